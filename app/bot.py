@@ -0,0 +1,95 @@
+"""
+Bot and Dispatcher assembly shared by main.py, web.py and the shard workers.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from aiogram import Bot, Dispatcher
+from aiogram.client.default import DefaultBotProperties
+from aiogram.enums import ParseMode
+from aiogram.fsm.storage.base import BaseStorage
+
+from app.config import MAX_CONCURRENT_UPDATES, TOKEN
+from app.database import Base, engine
+import app.models  # noqa: F401  (registers all tables)
+from app import handlers
+from app.middlewares import ChatOrderingIsolation
+from app.services.admin_roster import load_admin_roster
+from app.services.bot_stats import start_stats_refresh, stop_stats_refresh
+from app.services.fsm_storage import DatabaseStorage
+from app.services.i18n import report_catalog
+from app.services.media_cache import load_file_ids
+from app.services.media_manifest import MediaManifest, install_media_manifest, load_media_manifest
+from app.services.media_prewarm import start_media_prewarm
+from app.services.overload import OutboundRequestCounter, start_overload_monitor, stop_overload_monitor
+from app.services.reminders import load_and_schedule_all, set_bot_instance, start_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+def create_bot() -> Bot:
+    return Bot(
+        token=TOKEN,
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+    )
+
+
+def build_dispatcher(
+    bot: Bot,
+    storage: Optional[BaseStorage] = None,
+    leader: bool = True,
+    media_manifest: Optional[MediaManifest] = None,
+) -> Dispatcher:
+    """Dispatcher with every handler router and the startup work.
+
+    FSM state is kept in the database (DatabaseStorage) unless another
+    storage is given, so unfinished flows survive restarts. Only the leader
+    runs the reminder scheduler, the media pre-warm and the statistics
+    refresh, so with several worker processes that work is done once. Shard
+    workers get the media manifest built by the front process instead of
+    hashing the media tree again.
+    """
+    # Create missing tables
+    Base.metadata.create_all(bind=engine)
+
+    # Check every catalog media file once at startup
+    if media_manifest is not None:
+        install_media_manifest(media_manifest)
+    else:
+        load_media_manifest()
+    # Admin list is kept in memory: permission checks without DB queries
+    load_admin_roster()
+    # Missing translations and placeholder mismatches go to the log, not to users
+    report_catalog()
+
+    # One chat's updates run in order, different chats concurrently (bounded).
+    # As the FSM event isolation the chat lock is taken before state is read;
+    # it is kept in workflow data so web.py can report its metrics
+    ordering = ChatOrderingIsolation(MAX_CONCURRENT_UPDATES)
+    dp = Dispatcher(
+        storage=storage if storage is not None else DatabaseStorage(),
+        events_isolation=ordering,
+    )
+    dp["update_ordering"] = ordering
+    dp.include_router(handlers.router)
+
+    # Cached file_ids are read from memory; the first load happens off the event loop
+    dp.startup.register(load_file_ids)
+    # Degrade (cached media/snapshots, deferred log writes) while the bot is overloaded
+    bot.session.middleware(OutboundRequestCounter())
+    dp.startup.register(start_overload_monitor)
+    dp.shutdown.register(stop_overload_monitor)
+    if leader:
+        # Admin statistics come from a snapshot refreshed in the background;
+        # other workers refresh their copy on read once it gets old
+        dp.startup.register(start_stats_refresh)
+        dp.shutdown.register(stop_stats_refresh)
+        # Upload media to the storage chat in advance so users only get file_ids
+        dp.startup.register(start_media_prewarm)
+
+        start_scheduler()
+        set_bot_instance(bot)  # Set bot instance for sleep notifications
+        load_and_schedule_all()
+    return dp
@@ -5,4 +5,26 @@ load_dotenv()
 
 TOKEN = os.getenv("BOT_TOKEN")
 DB_URL = os.getenv("DB_URL")
-CHANNEL_USERNAME = os.getenv("CHANNEL_USERNAME", "@fitonomics_uz")
\ No newline at end of file
+CHANNEL_USERNAME = os.getenv("CHANNEL_USERNAME", "@fitonomics_uz")
+
+# Private chat/channel the bot uploads catalog media to at startup (file_id pre-warm)
+_media_storage_chat = os.getenv("MEDIA_STORAGE_CHAT_ID")
+MEDIA_STORAGE_CHAT_ID = int(_media_storage_chat) if _media_storage_chat else None
+
+# Webhook delivery (web.py). Render exposes the public URL as RENDER_EXTERNAL_URL;
+# without a base URL web.py falls back to long polling.
+WEBHOOK_BASE_URL = (os.getenv("WEBHOOK_BASE_URL") or os.getenv("RENDER_EXTERNAL_URL") or "").rstrip("/") or None
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/webhook")
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")
+PORT = int(os.getenv("PORT", "5000"))
+
+# Number of bot worker processes behind the webhook receiver (app/sharding.py)
+BOT_WORKERS = max(1, int(os.getenv("BOT_WORKERS", "1")))
+
+# Updates processed at the same time across all chats (one chat is always sequential)
+MAX_CONCURRENT_UPDATES = max(1, int(os.getenv("MAX_CONCURRENT_UPDATES", "32")))
+
+# Overload thresholds (app/services/overload.py): past any of them the bot degrades
+OVERLOAD_LOOP_LAG_MS = float(os.getenv("OVERLOAD_LOOP_LAG_MS", "250"))
+OVERLOAD_DB_LATENCY_MS = float(os.getenv("OVERLOAD_DB_LATENCY_MS", "200"))
+OVERLOAD_OUTBOUND_REQUESTS = int(os.getenv("OVERLOAD_OUTBOUND_REQUESTS", "80"))
@@ -1,18 +1,35 @@
 # app/handlers/__init__.py
-# ВАЖНО: main.py импортирует ИМЕННО пакет handlers (from app.handlers import start)
-# Этот файл выполнится и подтянет все модули, которые сами «подпишутся» на общий router.
+# ВАЖНО: main.py импортирует пакет handlers и подключает ОДИН общий router отсюда.
+# У каждого модуля свой Router; порядок подключения ниже = порядок проверки хендлеров.
+# Callback-запросы маршрутизируются по namespace (префиксу callback_data) через dict:
+# модуль получает только те callback'и, namespace которых указан рядом с ним.
 
-from . import start  # создаёт router
-# Подключаем модули, которые добавят свои хендлеры в тот же router:
-from . import menu     # главное меню
-from . import workouts # тренировки (пошагово)
-from . import settings # настройки и онбординг
-from . import meals    # прототип блюд
-from . import progress # прогресс
-from . import onboarding  # канал-гейт после выбора языка
+from app.services.callback_protocol import NamespaceRouter
+
+from . import start      # /start и выбор языка
+from . import menu       # главное меню
+from . import workouts   # тренировки (пошагово)
+from . import settings   # настройки и онбординг
+from . import meals      # прототип блюд
+from . import progress   # прогресс
+from . import onboarding # канал-гейт после выбора языка
 from . import sleep      # сон и статистика
 from . import reminders  # напоминания
 from . import help       # помощь
 from . import profile    # профиль пользователя
-from . import admin      # админка
-# позже добавим onboarding, meals, progress — без изменения main.py
\ No newline at end of file
+from . import admin      # админка (router за фильтром IsAdmin)
+
+router = NamespaceRouter(name="handlers")
+router.include_namespaced(start.router, "start")
+router.include_namespaced(menu.router)
+router.include_namespaced(workouts.router, "w")
+router.include_namespaced(settings.router, "settings", "lang", "budget", "reminder")
+router.include_namespaced(meals.router, "meals")
+router.include_namespaced(progress.router, "progress")
+router.include_namespaced(onboarding.router, "onb", "gate")
+router.include_namespaced(sleep.router, "sleep")
+router.include_namespaced(reminders.router, "reminders")
+router.include_namespaced(help.router)
+router.include_namespaced(profile.router, "profile", "budget")
+router.include_namespaced(admin.router, "admin")
+router.include_namespaced(admin.public_router, "admin", "back_to_main")
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from aiogram import F, types
+from aiogram import F, Router, types
+from aiogram.filters import BaseFilter, StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
 from app.database import SessionLocal
 from app.models.user import User
@@ -14,11 +15,16 @@ from app.models.user_settings import UserSettings
 from app.models.meal_log import MealLog
 from app.models.workout_log import WorkoutLog
 from app.models.sleep_log import SleepLog
+from app.services.admin_roster import admin_role, invalidate_admin_roster, is_active_admin
+from app.services.bot_stats import BotStats, get_bot_stats_snapshot
 from app.services.i18n import t, T
-from .start import router
+from app.services.keyboard_cache import cached_markup, ttl_cached
+from app.services.report_templates import ReportTemplate
 
-
-# Mass notification handler will be added at the end of file
+# Admin-only handlers; the IsAdmin filter is attached below, once per router
+router = Router(name="admin")
+# Handlers that also serve non-admins (access denial, shared "back_to_main")
+public_router = Router(name="admin_public")
 
 
 class MassNotification(StatesGroup):
@@ -26,6 +32,15 @@ class MassNotification(StatesGroup):
     target_filter = State()
 
 
+class AdminStates(StatesGroup):
+    search_user = State()
+    message_user_content = State()
+    send_to_user_target = State()
+    send_to_user_message = State()
+    add_admin = State()
+    remove_admin = State()
+
+
 # Super admin ID
 SUPER_ADMIN_ID = 1475749765
 
@@ -37,12 +52,19 @@ ADMIN_USERNAMES = {
 
 def is_admin(user_id: int) -> bool:
     """Check if user is admin."""
-    if user_id == SUPER_ADMIN_ID:
-        return True
-    
-    with SessionLocal() as session:
-        admin = session.query(Admin).filter(Admin.tg_id == user_id, Admin.is_active == True).first()
-        return admin is not None
+    return user_id == SUPER_ADMIN_ID or is_active_admin(user_id)
+
+
+class IsAdmin(BaseFilter):
+    """Router-level filter: lets only admins into the admin handlers."""
+
+    async def __call__(self, event: types.TelegramObject) -> bool:
+        user = getattr(event, "from_user", None)
+        return user is not None and is_admin(user.id)
+
+
+router.message.filter(IsAdmin())
+router.callback_query.filter(IsAdmin())
 
 
 def is_super_admin(user_id: int) -> bool:
@@ -54,12 +76,10 @@ def get_admin_role(user_id: int) -> str:
     """Get admin role."""
     if user_id == SUPER_ADMIN_ID:
         return "super_admin"
-    
-    with SessionLocal() as session:
-        admin = session.query(Admin).filter(Admin.tg_id == user_id).first()
-        return admin.role if admin else "user"
+    return admin_role(user_id) or "user"
 
 
+@cached_markup
 def _admin_main_kb() -> types.InlineKeyboardMarkup:
     """Build main admin panel keyboard."""
     kb = InlineKeyboardBuilder()
@@ -73,6 +93,7 @@ def _admin_main_kb() -> types.InlineKeyboardMarkup:
     return kb.as_markup()
 
 
+@ttl_cached(seconds=60)
 def _admin_users_kb(page: int = 0, per_page: int = 10) -> types.InlineKeyboardMarkup:
     """Build admin users management keyboard."""
     kb = InlineKeyboardBuilder()
@@ -94,6 +115,7 @@ def _admin_users_kb(page: int = 0, per_page: int = 10) -> types.InlineKeyboardMa
     return kb.as_markup()
 
 
+@cached_markup
 def _admin_stats_kb() -> types.InlineKeyboardMarkup:
     """Build admin stats keyboard."""
     kb = InlineKeyboardBuilder()
@@ -105,6 +127,7 @@ def _admin_stats_kb() -> types.InlineKeyboardMarkup:
     return kb.as_markup()
 
 
+@cached_markup
 def _admin_reminders_kb() -> types.InlineKeyboardMarkup:
     """Build admin reminders management keyboard."""
     kb = InlineKeyboardBuilder()
@@ -116,6 +139,7 @@ def _admin_reminders_kb() -> types.InlineKeyboardMarkup:
     return kb.as_markup()
 
 
+@cached_markup
 def _admin_settings_kb() -> types.InlineKeyboardMarkup:
     """Build admin settings keyboard."""
     kb = InlineKeyboardBuilder()
@@ -126,6 +150,7 @@ def _admin_settings_kb() -> types.InlineKeyboardMarkup:
     return kb.as_markup()
 
 
+@cached_markup
 def _admin_manage_admins_kb() -> types.InlineKeyboardMarkup:
     """Build admin management keyboard."""
     kb = InlineKeyboardBuilder()
@@ -172,52 +197,117 @@ def get_user_stats(user_id: int) -> dict:
         }
 
 
-def get_bot_stats() -> dict:
-    """Get bot statistics."""
-    with SessionLocal() as session:
-        total_users = session.query(User).count()
-        active_users = session.query(User).filter(User.updated_at >= datetime.now() - timedelta(days=7)).count()
-        
-        # Get growth stats
-        today = datetime.now().date()
-        week_ago = today - timedelta(days=7)
-        month_ago = today - timedelta(days=30)
-        
-        users_this_week = session.query(User).filter(User.created_at >= week_ago).count()
-        users_this_month = session.query(User).filter(User.created_at >= month_ago).count()
-        
-        # Get language distribution
-        lang_stats = {}
-        for user in session.query(User).all():
-            lang = user.language or 'ru'
-            lang_stats[lang] = lang_stats.get(lang, 0) + 1
-        
-        return {
-            'total_users': total_users,
-            'active_users': active_users,
-            'users_this_week': users_this_week,
-            'users_this_month': users_this_month,
-            'language_distribution': lang_stats
-        }
+# Admin screens (Russian only), resolved once by ReportTemplate
+ADMIN_PANEL_REPORT = ReportTemplate("""🛡️ Админ-панель
+
+👥 Пользователи: {total_users}
+📈 Активных: {active_users}
+📊 Рост за неделю: +{users_this_week}
+📈 Рост за месяц: +{users_this_month}
+
+Выберите действие:""")
+
+STATS_GENERAL_REPORT = ReportTemplate("""📈 Общая статистика
+
+👥 Пользователи:
+• Всего: {total_users}
+• Активных (7 дней): {active_users}
+• Рост за неделю: +{users_this_week}
+• Рост за месяц: +{users_this_month}
+
+🌍 Языки:
+• Русский: {lang_ru}
+• English: {lang_en}
+• O'zbek: {lang_uz}""")
+
+STATS_USERS_REPORT = ReportTemplate("""👥 Статистика пользователей
+
+📊 Активность:
+• Всего пользователей: {total_users}
+• Активных за 7 дней: {active_users}
+• Процент активности: {active_pct}%
+
+📈 Рост:
+• За неделю: +{users_this_week}
+• За месяц: +{users_this_month}
+
+💰 Бюджет:
+• Экономный: {budget_low}
+• Средний: {budget_mid}
+• Премиум: {budget_high}
+• Не указан: {budget_none}
+
+⏰ Время тренировок:
+• Утро: {time_morning}
+• День: {time_day}
+• Вечер: {time_evening}
+• Не указано: {time_none}
+
+🕒 Обновлено: {computed_at}""")
+
+STATS_GROWTH_REPORT = ReportTemplate("""📊 Рост пользователей
+
+📈 За последний период:
+• За неделю: +{users_this_week} пользователей
+• За месяц: +{users_this_month} пользователей
+
+🌍 По языкам:
+• Русский: {lang_ru}
+• English: {lang_en}
+• O'zbek: {lang_uz}""")
+
+REMINDERS_STATS_REPORT = ReportTemplate("""📊 Статистика напоминаний
+
+📈 Общая статистика:
+• Всего отправлено: {total_sent}
+• Отвечено: {total_responded}
+• Процент ответов: {response_rate:.1f}%
+
+📋 По типам:{by_type}""")
+
+NOTIFICATION_TYPE_NAMES = {
+    'workout': 'Тренировки',
+    'breakfast': 'Завтрак',
+    'lunch': 'Обед',
+    'dinner': 'Ужин',
+    'sleep': 'Сон'
+}
+
+
+def _bot_stats_values(stats: dict) -> dict:
+    """Flat slot values of the admin statistics reports."""
+    languages = stats['language_distribution']
+    return {
+        'total_users': stats['total_users'],
+        'active_users': stats['active_users'],
+        'users_this_week': stats['users_this_week'],
+        'users_this_month': stats['users_this_month'],
+        'active_pct': round(stats['active_users'] / max(stats['total_users'], 1) * 100, 1),
+        'lang_ru': languages.get('ru', 0),
+        'lang_en': languages.get('en', 0),
+        'lang_uz': languages.get('uz', 0),
+        **{f'budget_{level}': stats['budget_distribution'].get(level, 0) for level in ('low', 'mid', 'high', 'none')},
+        **{f'time_{slot}': stats['reminder_time_distribution'].get(slot, 0) for slot in ('morning', 'day', 'evening', 'none')},
+        'computed_at': stats['computed_at'].strftime('%d.%m.%Y %H:%M'),
+    }
+
+
+# Slot values of the current snapshot; rebuilt only when the snapshot changes
+_stats_values: Tuple[Optional[BotStats], dict] = (None, {})
+
+
+async def _admin_stats_values() -> dict:
+    global _stats_values
+    snapshot = await get_bot_stats_snapshot()
+    if _stats_values[0] is not snapshot:
+        _stats_values = (snapshot, _bot_stats_values(snapshot._asdict()))
+    return _stats_values[1]
 
 
 @router.message(F.text == "/admin")
 async def admin_command(message: types.Message):
     """Handle /admin command."""
-    if not is_admin(message.from_user.id):
-        await message.answer("❌ У вас нет прав доступа к админ-панели.")
-        return
-    
-    stats = get_bot_stats()
-    
-    text = f"""🛡️ Админ-панель
-
-👥 Пользователи: {stats['total_users']}
-📈 Активных: {stats['active_users']}
-📊 Рост за неделю: +{stats['users_this_week']}
-📈 Рост за месяц: +{stats['users_this_month']}
-
-Выберите действие:"""
+    text = ADMIN_PANEL_REPORT.render(await _admin_stats_values())
     
     await message.answer(text, reply_markup=_admin_main_kb())
 
@@ -225,20 +315,7 @@ async def admin_command(message: types.Message):
 @router.callback_query(F.data == "admin:main")
 async def admin_main_menu(call: types.CallbackQuery):
     """Show main admin menu."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
-    stats = get_bot_stats()
-    
-    text = f"""🛡️ Админ-панель
-
-👥 Пользователи: {stats['total_users']}
-📈 Активных: {stats['active_users']}
-📊 Рост за неделю: +{stats['users_this_week']}
-📈 Рост за месяц: +{stats['users_this_month']}
-
-Выберите действие:"""
+    text = ADMIN_PANEL_REPORT.render(await _admin_stats_values())
     
     await call.message.edit_text(text, reply_markup=_admin_main_kb())
 
@@ -246,10 +323,6 @@ async def admin_main_menu(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:users")
 async def admin_users_menu(call: types.CallbackQuery):
     """Show users management menu."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     with SessionLocal() as session:
         total_users = session.query(User).count()
         recent_users = session.query(User).order_by(User.created_at.desc()).limit(5).all()
@@ -283,10 +356,6 @@ async def admin_users_menu(call: types.CallbackQuery):
 @router.callback_query(F.data.startswith("admin:users_page_"))
 async def admin_users_page(call: types.CallbackQuery):
     """Show users page."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     page = int(call.data.split("_")[-1])
     per_page = 10
     
@@ -330,35 +399,17 @@ async def admin_users_page(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:search_user")
 async def admin_search_user(call: types.CallbackQuery, state: FSMContext):
     """Search for user."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """🔍 Поиск пользователя
 
 Введите ID пользователя или имя для поиска:"""
     
     await call.message.edit_text(text)
-    await state.set_state("admin_search_user")
+    await state.set_state(AdminStates.search_user)
 
 
-@router.message(lambda msg: msg.text)
+@router.message(AdminStates.search_user, F.text)
 async def handle_admin_search_user(message: types.Message, state: FSMContext):
     """Handle user search."""
-    current_state = await state.get_state()
-    print(f"DEBUG: handle_admin_search_user called, state: {current_state}")
-    
-    # Check if we're in mass notification state - if so, let mass notification handler process it
-    if current_state == "mass_notification_text":
-        print(f"DEBUG: Mass notification state detected, skipping search handler")
-        return
-        
-    if current_state != "admin_search_user":
-        return
-        
-    if not is_admin(message.from_user.id):
-        return
-    
     search_term = message.text.strip()
     
     with SessionLocal() as session:
@@ -424,10 +475,6 @@ async def handle_admin_search_user(message: types.Message, state: FSMContext):
 @router.callback_query(F.data.startswith("admin:message_user_"))
 async def admin_message_user(call: types.CallbackQuery, state: FSMContext):
     """Start sending message to specific user from search results."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     user_id = int(call.data.split("_")[-1])
     
     # Get user info
@@ -457,26 +504,12 @@ async def admin_message_user(call: types.CallbackQuery, state: FSMContext):
 Отправьте сообщение (текст, фото, видео, документ и т.д.):"""
     
     await call.message.edit_text(text)
-    await state.set_state("admin_message_user_content")
+    await state.set_state(AdminStates.message_user_content)
 
 
-@router.message(lambda msg: True)
+@router.message(AdminStates.message_user_content)
 async def handle_admin_message_user_content(message: types.Message, state: FSMContext):
     """Handle message content for sending to user from search results."""
-    current_state = await state.get_state()
-    print(f"DEBUG: handle_admin_message_user_content called, state: {current_state}")
-    
-    # Check if we're in mass notification state - if so, let mass notification handler process it
-    if current_state == "mass_notification_text":
-        print(f"DEBUG: Mass notification state detected, skipping message content handler")
-        return
-        
-    if current_state != "admin_message_user_content":
-        return
-        
-    if not is_admin(message.from_user.id):
-        return
-    
     data = await state.get_data()
     target_user_id = data.get('target_user_id')
     target_username = data.get('target_username')
@@ -521,16 +554,9 @@ async def handle_admin_message_user_content(message: types.Message, state: FSMCo
     await state.clear()
 
 
-@router.message(lambda msg: True)
+@router.message(AdminStates.send_to_user_message)
 async def handle_admin_send_to_user_message(message: types.Message, state: FSMContext):
     """Handle message content for sending to user."""
-    current_state = await state.get_state()
-    if current_state != "admin_send_to_user_message":
-        return
-        
-    if not is_admin(message.from_user.id):
-        return
-    
     data = await state.get_data()
     target_user_id = data.get('target_user_id')
     target_username = data.get('target_username')
@@ -578,10 +604,6 @@ async def handle_admin_send_to_user_message(message: types.Message, state: FSMCo
 @router.callback_query(F.data == "admin:stats")
 async def admin_stats_menu(call: types.CallbackQuery):
     """Show admin stats menu."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """📊 Статистика и аналитика
 
 Выберите тип статистики:"""
@@ -592,24 +614,7 @@ async def admin_stats_menu(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:stats_general")
 async def admin_stats_general(call: types.CallbackQuery):
     """Show general statistics."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
-    stats = get_bot_stats()
-    
-    text = f"""📈 Общая статистика
-
-👥 Пользователи:
-• Всего: {stats['total_users']}
-• Активных (7 дней): {stats['active_users']}
-• Рост за неделю: +{stats['users_this_week']}
-• Рост за месяц: +{stats['users_this_month']}
-
-🌍 Языки:
-• Русский: {stats['language_distribution'].get('ru', 0)}
-• English: {stats['language_distribution'].get('en', 0)}
-• O'zbek: {stats['language_distribution'].get('uz', 0)}"""
+    text = STATS_GENERAL_REPORT.render(await _admin_stats_values())
     
     await call.message.edit_text(text, reply_markup=_admin_stats_kb())
 
@@ -617,22 +622,7 @@ async def admin_stats_general(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:stats_users")
 async def admin_stats_users(call: types.CallbackQuery):
     """Show user statistics."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
-    stats = get_bot_stats()
-    
-    text = f"""👥 Статистика пользователей
-
-📊 Активность:
-• Всего пользователей: {stats['total_users']}
-• Активных за 7 дней: {stats['active_users']}
-• Процент активности: {round(stats['active_users'] / max(stats['total_users'], 1) * 100, 1)}%
-
-📈 Рост:
-• За неделю: +{stats['users_this_week']}
-• За месяц: +{stats['users_this_month']}"""
+    text = STATS_USERS_REPORT.render(await _admin_stats_values())
     
     await call.message.edit_text(text, reply_markup=_admin_stats_kb())
 
@@ -640,22 +630,7 @@ async def admin_stats_users(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:stats_growth")
 async def admin_stats_growth(call: types.CallbackQuery):
     """Show growth statistics."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
-    stats = get_bot_stats()
-    
-    text = f"""📊 Рост пользователей
-
-📈 За последний период:
-• За неделю: +{stats['users_this_week']} пользователей
-• За месяц: +{stats['users_this_month']} пользователей
-
-🌍 По языкам:
-• Русский: {stats['language_distribution'].get('ru', 0)}
-• English: {stats['language_distribution'].get('en', 0)}
-• O'zbek: {stats['language_distribution'].get('uz', 0)}"""
+    text = STATS_GROWTH_REPORT.render(await _admin_stats_values())
     
     await call.message.edit_text(text, reply_markup=_admin_stats_kb())
 
@@ -663,10 +638,6 @@ async def admin_stats_growth(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:reminders")
 async def admin_reminders_menu(call: types.CallbackQuery):
     """Show admin reminders menu."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """🔔 Управление напоминаниями
 
 Выберите действие:"""
@@ -677,10 +648,6 @@ async def admin_reminders_menu(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:reminders_stats")
 async def admin_reminders_stats(call: types.CallbackQuery):
     """Show reminder statistics."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     # Get reminder statistics from database
     with SessionLocal() as session:
         from app.models.notification_log import NotificationLog
@@ -702,25 +669,15 @@ async def admin_reminders_stats(call: types.CallbackQuery):
         
         response_rate = (total_responded / total_sent * 100) if total_sent > 0 else 0
     
-    text = f"""📊 Статистика напоминаний
-
-📈 Общая статистика:
-• Всего отправлено: {total_sent}
-• Отвечено: {total_responded}
-• Процент ответов: {response_rate:.1f}%
-
-📋 По типам:"""
-    
-    for notif_type, count in stats_by_type:
-        type_names = {
-            'workout': 'Тренировки',
-            'breakfast': 'Завтрак',
-            'lunch': 'Обед',
-            'dinner': 'Ужин',
-            'sleep': 'Сон'
-        }
-        type_name = type_names.get(notif_type, notif_type)
-        text += f"\n• {type_name}: {count}"
+    text = REMINDERS_STATS_REPORT.render({
+        "total_sent": total_sent,
+        "total_responded": total_responded,
+        "response_rate": response_rate,
+        "by_type": "".join(
+            f"\n• {NOTIFICATION_TYPE_NAMES.get(notif_type, notif_type)}: {count}"
+            for notif_type, count in stats_by_type
+        ),
+    })
     
     kb = InlineKeyboardBuilder()
     kb.button(text="⬅️ Назад", callback_data="admin:reminders")
@@ -731,10 +688,6 @@ async def admin_reminders_stats(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:reminders_settings")
 async def admin_reminders_settings(call: types.CallbackQuery):
     """Show reminder settings."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """⚙️ Настройки напоминаний
 
 🔧 Доступные настройки:
@@ -754,28 +707,17 @@ async def admin_reminders_settings(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:send_to_user")
 async def admin_send_to_user(call: types.CallbackQuery, state: FSMContext):
     """Start sending message to specific user."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """📤 Отправить сообщение пользователю
 
 Введите ID пользователя или username (@username):"""
     
     await call.message.edit_text(text)
-    await state.set_state("admin_send_to_user_target")
+    await state.set_state(AdminStates.send_to_user_target)
 
 
-@router.message(lambda msg: msg.text)
+@router.message(AdminStates.send_to_user_target, F.text)
 async def handle_admin_send_to_user_target(message: types.Message, state: FSMContext):
     """Handle user target for sending message."""
-    current_state = await state.get_state()
-    if current_state != "admin_send_to_user_target":
-        return
-        
-    if not is_admin(message.from_user.id):
-        return
-    
     target = message.text.strip()
     user_id = None
     username = None
@@ -817,16 +759,12 @@ async def handle_admin_send_to_user_target(message: types.Message, state: FSMCon
 Отправьте сообщение (текст, фото, видео, документ и т.д.):"""
     
     await message.answer(text)
-    await state.set_state("admin_send_to_user_message")
+    await state.set_state(AdminStates.send_to_user_message)
 
 
 @router.callback_query(F.data == "admin:mass_notification")
 async def admin_mass_notification(call: types.CallbackQuery, state: FSMContext):
     """Start mass notification process."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """📢 Массовая отправка уведомлений
 
 Введите текст сообщения для отправки всем пользователям:"""
@@ -841,10 +779,6 @@ async def admin_mass_notification(call: types.CallbackQuery, state: FSMContext):
 @router.callback_query(F.data == "admin:edit_mass_text")
 async def admin_edit_mass_text(call: types.CallbackQuery, state: FSMContext):
     """Edit mass notification text."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """📝 Редактирование текста
 
 Введите новый текст сообщения:"""
@@ -856,10 +790,6 @@ async def admin_edit_mass_text(call: types.CallbackQuery, state: FSMContext):
 @router.callback_query(F.data == "admin:send_all")
 async def admin_send_all_notification(call: types.CallbackQuery, state: FSMContext):
     """Send notification to all users."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     data = await state.get_data()
     message_text = data.get('message_text', '')
     
@@ -888,30 +818,18 @@ async def admin_send_all_notification(call: types.CallbackQuery, state: FSMConte
 @router.callback_query(F.data == "admin:send_filtered")
 async def admin_send_filtered_notification(call: types.CallbackQuery, state: FSMContext):
     """Send notification by filters."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     await call.answer("⚠️ Отправка по фильтрам временно недоступна")
 
 
 @router.callback_query(F.data == "admin:schedule_notification")
 async def admin_schedule_notification(call: types.CallbackQuery, state: FSMContext):
     """Schedule notification."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     await call.answer("⚠️ Планировщик уведомлений временно недоступен")
 
 
 @router.callback_query(F.data == "admin:settings")
 async def admin_settings_menu(call: types.CallbackQuery):
     """Show admin settings menu."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """⚙️ Настройки бота
 
 Выберите настройку:"""
@@ -922,10 +840,6 @@ async def admin_settings_menu(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:settings_features")
 async def admin_settings_features(call: types.CallbackQuery):
     """Show features settings."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     # Get current feature status (you can implement this with a database table)
     # For now, we'll use a simple approach
     features = {
@@ -958,10 +872,6 @@ async def admin_settings_features(call: types.CallbackQuery):
 @router.callback_query(F.data.startswith("admin:toggle_"))
 async def admin_toggle_feature(call: types.CallbackQuery):
     """Toggle bot feature."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     feature = call.data.split("_")[1]  # reminders, meal_notifications, etc.
     
     # For now, just show a message that the feature is temporarily disabled
@@ -980,10 +890,6 @@ async def admin_toggle_feature(call: types.CallbackQuery):
 @router.callback_query(F.data == "admin:settings_logs")
 async def admin_settings_logs(call: types.CallbackQuery):
     """Show system logs."""
-    if not is_admin(call.from_user.id):
-        await call.answer("❌ Нет прав доступа")
-        return
-    
     text = """📝 Системные логи
 
 Последние события:
@@ -1068,7 +974,7 @@ async def admin_remove_admin(call: types.CallbackQuery, state: FSMContext):
 Введите Telegram ID или username (@username) админа для удаления:"""
     
     await call.message.edit_text(text)
-    await state.set_state("admin_remove_admin")
+    await state.set_state(AdminStates.remove_admin)
 
 
 @router.callback_query(F.data == "admin:add_admin")
@@ -1083,10 +989,10 @@ async def admin_add_admin(call: types.CallbackQuery, state: FSMContext):
 Введите Telegram ID или username (@username) нового админа:"""
     
     await call.message.edit_text(text)
-    await state.set_state("admin_add_admin")
+    await state.set_state(AdminStates.add_admin)
 
 
-@router.message(lambda msg: msg.text and (msg.text.isdigit() or msg.text.startswith('@')))
+@router.message(StateFilter(AdminStates.add_admin, AdminStates.remove_admin), F.text)
 async def handle_admin_actions(message: types.Message, state: FSMContext):
     """Handle adding or removing admin."""
     current_state = await state.get_state()
@@ -1116,7 +1022,7 @@ async def handle_admin_actions(message: types.Message, state: FSMContext):
             await message.answer("❌ Неверный формат. Введите числовой ID или @username.")
             return
         
-        if current_state == "admin_add_admin":
+        if current_state == AdminStates.add_admin.state:
             # Adding admin
             with SessionLocal() as session:
                 # Check if already exists
@@ -1134,6 +1040,7 @@ async def handle_admin_actions(message: types.Message, state: FSMContext):
                 )
                 session.add(new_admin)
                 session.commit()
+            invalidate_admin_roster()
             
             success_msg = f"✅ Пользователь {admin_id}"
             if username:
@@ -1142,7 +1049,7 @@ async def handle_admin_actions(message: types.Message, state: FSMContext):
             
             await message.answer(success_msg)
             
-        elif current_state == "admin_remove_admin":
+        elif current_state == AdminStates.remove_admin.state:
             # Removing admin
             # Don't allow removing super admin
             if admin_id == SUPER_ADMIN_ID:
@@ -1157,6 +1064,7 @@ async def handle_admin_actions(message: types.Message, state: FSMContext):
                 
                 session.delete(admin)
                 session.commit()
+            invalidate_admin_roster()
                 
             success_msg = f"✅ Админ {admin_id}"
             if username:
@@ -1173,33 +1081,14 @@ async def handle_admin_actions(message: types.Message, state: FSMContext):
         await message.answer(f"❌ Ошибка: {str(e)}")
 
 
-@router.callback_query(F.data == "back_to_main")
-async def back_to_main_menu(call: types.CallbackQuery):
-    """Return to main menu."""
-    from .menu import build_main_menu_kb
-    
-    kb = build_main_menu_kb("ru")  # Default to Russian for admin
-    await call.message.answer("🏠 Главное меню", reply_markup=kb)
-
-
 # MASS NOTIFICATION HANDLER - using FSM state directly
-@router.message(MassNotification.message_text)
+@router.message(MassNotification.message_text, F.text)
 async def handle_mass_notification_text_final(message: types.Message, state: FSMContext):
     """Handle mass notification text - FSM STATE HANDLER."""
-    print(f"DEBUG: handle_mass_notification_text_final called for user {message.from_user.id}")
-    print(f"DEBUG: Message text: {message.text}")
-    print(f"DEBUG: FSM state handler triggered")
-    
-    if not is_admin(message.from_user.id):
-        print(f"DEBUG: User is not admin, returning")
-        return
-    
     text = message.text.strip()
-    print(f"DEBUG: Mass notification text received: {text}")
     
     # Save message text to state
     await state.update_data(message_text=text)
-    print(f"DEBUG: Message text saved to state")
     
     # Create confirmation menu with templates/options
     kb = InlineKeyboardBuilder()
@@ -1219,9 +1108,27 @@ async def handle_mass_notification_text_final(message: types.Message, state: FSM
     
     try:
         await message.answer(confirmation_text, reply_markup=kb.as_markup(), parse_mode="Markdown")
-        print(f"DEBUG: Mass notification confirmation menu sent to user")
-    except Exception as e:
-        print(f"DEBUG: Error sending confirmation menu: {e}")
+    except Exception:
         # Fallback without markdown
         await message.answer(f"📝 Текст сообщения:\n\n{text}\n\nВыберите способ отправки:", reply_markup=kb.as_markup())
-        print(f"DEBUG: Mass notification options sent to user (fallback)")
+
+
+@public_router.message(F.text == "/admin", ~IsAdmin())
+async def admin_command_denied(message: types.Message):
+    """/admin from a non-admin (admins are handled by the admin router)."""
+    await message.answer("❌ У вас нет прав доступа к админ-панели.")
+
+
+@public_router.callback_query(F.data.startswith("admin:"), ~IsAdmin())
+async def admin_callback_denied(call: types.CallbackQuery):
+    """Admin button pressed by a non-admin."""
+    await call.answer("❌ Нет прав доступа")
+
+
+@public_router.callback_query(F.data == "back_to_main")
+async def back_to_main_menu(call: types.CallbackQuery):
+    """Return to main menu."""
+    from .menu import build_main_menu_kb
+    
+    kb = build_main_menu_kb("ru")  # Default to Russian for admin
+    await call.message.answer("🏠 Главное меню", reply_markup=kb)
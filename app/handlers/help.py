@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from aiogram import F, types
+from aiogram import F, types, Router
 from aiogram.filters import Command
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.models.user import User
 from app.services.i18n import t, T
-from .start import router
+
+router = Router(name="help")
 
 
 def get_lang(user_id: int) -> str:
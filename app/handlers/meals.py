@@ -1,20 +1,32 @@
 """
 Meals handlers - complete meal tracking system.
 """
-from aiogram import F, types
+import html
+import logging
+
+from aiogram import F, types, Router
+from aiogram.filters import Command, CommandObject
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, ReplyKeyboardMarkup, KeyboardButton, InputMediaPhoto, FSInputFile
 
 from app.services.i18n import t
 from app.services.meals import (
-    get_user_budget, set_user_budget, get_meals_by_category, 
+    get_user_budget, set_user_budget,
     get_meal_by_id, log_meal_pack, log_custom_meal, get_meal_stats,
-    _extract_calories_from_text, _extract_price_from_text
 )
+from app.services.content import get_meal_media_path
+from app.services.meal_search import search_meals
+from app.services.recommendations import get_personalized_meals
+from app.services.callback_protocol import pack_callback
+from app.services.keyboard_cache import cached_markup
+from app.services.message_edit import edit_screen, replace_with_text, show_photo
 from app.database import SessionLocal
 from app.models.user import User
-from .start import router
+
+router = Router(name="meals")
+
+logger = logging.getLogger(__name__)
 
 
 def get_lang(user_id: int) -> str:
@@ -25,37 +37,13 @@ def get_lang(user_id: int) -> str:
 
 
 def extract_calories_from_text(pack: dict) -> str:
-    """Extract calories from meal text content."""
-    try:
-        text_content = pack.get('text_en', '')
-        if 'Calories:' in text_content:
-            # Find the line with calories
-            for line in text_content.split('\n'):
-                if 'Calories:' in line:
-                    # Extract everything after "Calories:"
-                    calories_text = line.split('Calories:')[1].strip()
-                    return calories_text
-        return 'N/A'
-    except Exception as e:
-        print(f"Error extracting calories: {e}")
-        return 'N/A'
+    """Calories line of a meal pack, pre-parsed when the content was loaded."""
+    return pack.get('calories_text') or 'N/A'
 
 
 def extract_price_from_text(pack: dict) -> str:
-    """Extract price from meal text content."""
-    try:
-        text_content = pack.get('text_en', '')
-        if 'Price:' in text_content:
-            # Find the line with price
-            for line in text_content.split('\n'):
-                if 'Price:' in line:
-                    # Extract everything after "Price:"
-                    price_text = line.split('Price:')[1].strip()
-                    return price_text
-        return 'N/A'
-    except Exception as e:
-        print(f"Error extracting price: {e}")
-        return 'N/A'
+    """Price line of a meal pack, pre-parsed when the content was loaded."""
+    return pack.get('price_text') or 'N/A'
 
 
 def get_localized_name(pack: dict, lang: str) -> str:
@@ -73,6 +61,7 @@ class MealStates(StatesGroup):
     """FSM states for meal logging."""
     waiting_for_custom_description = State()
     waiting_for_health_rating = State()
+    waiting_for_search_query = State()
 
 
 # Button text collections for different languages
@@ -83,84 +72,112 @@ MEALS_BTNS = {T[x]["btn_meals"] for x in T.keys()}
 # Budget selection keyboard removed - budget is set during onboarding
 
 
+@cached_markup
 def _build_category_kb(lang: str) -> InlineKeyboardMarkup:
     """Build category selection keyboard."""
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t(lang, "meals.category.breakfast"), callback_data="meals:category:breakfast")],
-        [InlineKeyboardButton(text=t(lang, "meals.category.lunch"), callback_data="meals:category:lunch")],
-        [InlineKeyboardButton(text=t(lang, "meals.category.dinner"), callback_data="meals:category:dinner")],
+        [InlineKeyboardButton(text=t(lang, "meals.category.breakfast"), callback_data=pack_callback("meals", "category", "breakfast"))],
+        [InlineKeyboardButton(text=t(lang, "meals.category.lunch"), callback_data=pack_callback("meals", "category", "lunch"))],
+        [InlineKeyboardButton(text=t(lang, "meals.category.dinner"), callback_data=pack_callback("meals", "category", "dinner"))],
+        [InlineKeyboardButton(text=t(lang, "meals.search"), callback_data=pack_callback("meals", "search"))],
     ])
 
 
 def _build_pack_grid_kb(packs: list, lang: str, page: int = 0, packs_per_page: int = 10) -> InlineKeyboardMarkup:
     """Build pack grid keyboard with pagination."""
+    pack_keys = tuple((pack['id'], pack['pack_number']) for pack in packs)
+    category = packs[0].get('category', 'breakfast') if packs else 'breakfast'
+    return _pack_grid_markup(pack_keys, lang, page, packs_per_page, category)
+
+
+@cached_markup
+def _pack_grid_markup(pack_keys: tuple, lang: str, page: int, packs_per_page: int, category: str) -> InlineKeyboardMarkup:
+    """Pack grid for a given ordering of (pack id, pack number) pairs."""
     start_idx = page * packs_per_page
     end_idx = start_idx + packs_per_page
-    page_packs = packs[start_idx:end_idx]
+    page_packs = pack_keys[start_idx:end_idx]
     
     buttons = []
     for i in range(0, len(page_packs), 5):
         row = []
         for j in range(5):
             if i + j < len(page_packs):
-                pack = page_packs[i + j]
+                pack_id, pack_number = page_packs[i + j]
                 row.append(InlineKeyboardButton(
-                    text=f"📦 {pack['pack_number']}",
-                    callback_data=f"meals:pack:{pack['id']}"
+                    text=f"📦 {pack_number}",
+                    callback_data=pack_callback("meals", "pack", pack_id)
                 ))
         buttons.append(row)
     
     # Pagination buttons
     nav_buttons = []
     if page > 0:
-        nav_buttons.append(InlineKeyboardButton(text="⬅️", callback_data=f"meals:page:{page-1}"))
-    if end_idx < len(packs):
-        nav_buttons.append(InlineKeyboardButton(text="➡️", callback_data=f"meals:page:{page+1}"))
+        nav_buttons.append(InlineKeyboardButton(text="⬅️", callback_data=pack_callback("meals", "page", category, page-1)))
+    if end_idx < len(pack_keys):
+        nav_buttons.append(InlineKeyboardButton(text="➡️", callback_data=pack_callback("meals", "page", category, page+1)))
     
     if nav_buttons:
         buttons.append(nav_buttons)
     
     # Custom meal button
-    buttons.append([InlineKeyboardButton(text=t(lang, "meals.category.custom"), callback_data="meals:category:custom")])
+    buttons.append([InlineKeyboardButton(text=t(lang, "meals.category.custom"), callback_data=pack_callback("meals", "category", "custom"))])
     
     # Back button
-    buttons.append([InlineKeyboardButton(text=t(lang, "menu.back"), callback_data="meals:back_to_categories")])
+    buttons.append([InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "back_to_categories"))])
     
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def _build_pack_detail_kb(pack_id: str, lang: str) -> InlineKeyboardMarkup:
+def _build_search_results_kb(packs: list, lang: str) -> InlineKeyboardMarkup:
+    """Build keyboard with one button per found pack."""
+    buttons = [
+        [InlineKeyboardButton(
+            text=f"📦 {pack['pack_number']}. {get_localized_name(pack, lang)}",
+            callback_data=pack_callback("meals", "pack", pack['id'])
+        )]
+        for pack in packs
+    ]
+    buttons.append([InlineKeyboardButton(text=t(lang, "meals.search"), callback_data=pack_callback("meals", "search"))])
+    buttons.append([InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "back_to_categories"))])
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
+
+
+@cached_markup
+def _build_pack_detail_kb(pack_id: str, lang: str, category: str = "breakfast") -> InlineKeyboardMarkup:
     """Build pack detail keyboard."""
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t(lang, "meals.done"), callback_data=f"meals:done:{pack_id}")],
-        [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data="meals:back_to_packs")],
+        [InlineKeyboardButton(text=t(lang, "meals.done"), callback_data=pack_callback("meals", "done", pack_id))],
+        [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "back_to_packs", category))],
     ])
 
 
+@cached_markup
 def _build_custom_meal_kb(lang: str) -> InlineKeyboardMarkup:
     """Build custom meal category keyboard."""
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t(lang, "meals.category.breakfast"), callback_data="meals:custom_category:breakfast")],
-        [InlineKeyboardButton(text=t(lang, "meals.category.lunch"), callback_data="meals:custom_category:lunch")],
-        [InlineKeyboardButton(text=t(lang, "meals.category.dinner"), callback_data="meals:custom_category:dinner")],
-        [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data="meals:back_to_categories")],
+        [InlineKeyboardButton(text=t(lang, "meals.category.breakfast"), callback_data=pack_callback("meals", "custom_category", "breakfast"))],
+        [InlineKeyboardButton(text=t(lang, "meals.category.lunch"), callback_data=pack_callback("meals", "custom_category", "lunch"))],
+        [InlineKeyboardButton(text=t(lang, "meals.category.dinner"), callback_data=pack_callback("meals", "custom_category", "dinner"))],
+        [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "back_to_categories"))],
     ])
 
 
+@cached_markup
 def _build_health_rating_kb(lang: str) -> InlineKeyboardMarkup:
     """Build health rating keyboard."""
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t(lang, "meals.health.healthy"), callback_data="meals:health:healthy")],
-        [InlineKeyboardButton(text=t(lang, "meals.health.normal"), callback_data="meals:health:normal")],
-        [InlineKeyboardButton(text=t(lang, "meals.health.unhealthy"), callback_data="meals:health:unhealthy")],
-        [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data="meals:back_to_categories")],
+        [InlineKeyboardButton(text=t(lang, "meals.health.healthy"), callback_data=pack_callback("meals", "health", "healthy"))],
+        [InlineKeyboardButton(text=t(lang, "meals.health.normal"), callback_data=pack_callback("meals", "health", "normal"))],
+        [InlineKeyboardButton(text=t(lang, "meals.health.unhealthy"), callback_data=pack_callback("meals", "health", "unhealthy"))],
+        [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "back_to_categories"))],
     ])
 
 
+@cached_markup
 def _build_back_to_menu_kb(lang: str) -> InlineKeyboardMarkup:
     """Build back to main menu keyboard."""
     return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data="meals:back_to_menu")],
+        [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "back_to_menu"))],
     ])
 
 
@@ -192,13 +209,7 @@ async def select_category(call: types.CallbackQuery, state: FSMContext):
         # Show custom meal category selection
         text = f"{t(lang, 'meals.custom.category')}\n\n{t(lang, 'meals.choose_category')}"
         
-        # Delete the previous message and send new one
-        try:
-            await call.message.delete()
-        except:
-            pass
-        
-        await call.message.answer(text, reply_markup=_build_custom_meal_kb(lang))
+        await edit_screen(call.message, text, _build_custom_meal_kb(lang))
         return
     
     # Get user's budget (should always be set during onboarding)
@@ -208,55 +219,34 @@ async def select_category(call: types.CallbackQuery, state: FSMContext):
         budget = "mid"
         set_user_budget(call.from_user.id, budget)
     
-    packs = get_meals_by_category(budget, category)
+    packs = get_personalized_meals(call.from_user.id, budget, category)
     
     if not packs:
-        text = t(lang, "meals.no_packs")
-        if call.message.text:
-            await call.message.edit_text(text, reply_markup=_build_back_to_menu_kb(lang))
-        else:
-            await call.message.answer(text, reply_markup=_build_back_to_menu_kb(lang))
+        await edit_screen(call.message, t(lang, "meals.no_packs"), _build_back_to_menu_kb(lang))
         return
     
     # Show pack grid
     text = f"{t(lang, 'meals.category.' + category).title()}\n\n{t(lang, 'meals.choose_pack')}"
-    
-    if call.message.text:
-        await call.message.edit_text(text, reply_markup=_build_pack_grid_kb(packs, lang))
-    else:
-        await call.message.answer(text, reply_markup=_build_pack_grid_kb(packs, lang))
+    await edit_screen(call.message, text, _build_pack_grid_kb(packs, lang))
 
 
 @router.callback_query(F.data.startswith("meals:page:"))
 async def change_page(call: types.CallbackQuery):
     """Handle pagination."""
     lang = get_lang(call.from_user.id)
-    page = int(call.data.split(":")[2])
+    parts = call.data.split(":")
+    # meals:page:<category>:<page>; older messages carry only the page
+    category = parts[2] if len(parts) > 3 else "breakfast"
+    page = int(parts[-1])
     
-    # Get current category from message text
     budget = get_user_budget(call.from_user.id)
     if not budget:
         budget = "mid"  # Fallback
     
-    # Extract category from message text (this is a bit hacky, but works)
-    message_text = call.message.text or ""
-    if "breakfast" in message_text.lower():
-        category = "breakfast"
-    elif "lunch" in message_text.lower():
-        category = "lunch"
-    elif "dinner" in message_text.lower():
-        category = "dinner"
-    else:
-        category = "breakfast"  # default
-    
-    packs = get_meals_by_category(budget, category)
+    packs = get_personalized_meals(call.from_user.id, budget, category)
     
     text = f"{t(lang, 'meals.category.' + category).title()}\n\n{t(lang, 'meals.choose_pack')}"
-    
-    if call.message.text:
-        await call.message.edit_text(text, reply_markup=_build_pack_grid_kb(packs, lang, page))
-    else:
-        await call.message.answer(text, reply_markup=_build_pack_grid_kb(packs, lang, page))
+    await edit_screen(call.message, text, _build_pack_grid_kb(packs, lang, page))
 
 
 @router.callback_query(F.data.startswith("meals:pack:"))
@@ -281,36 +271,20 @@ async def show_pack_detail(call: types.CallbackQuery):
     text = f"📦 {t(lang, 'meals.pack')} {pack['pack_number']}: {name}\n\n"
     text += description
     
-    # Delete the previous message and send new one with pack details
-    try:
-        await call.message.delete()
-    except:
-        pass  # Ignore if deletion fails
+    kb = _build_pack_detail_kb(pack_id, lang, pack.get('category', 'breakfast'))
     
-    # Send new message with pack details
-    if pack.get('image'):
-
+    # Edit the current message in place; media goes by pre-warmed file_id only
+    sent = None
+    image_path = get_meal_media_path(pack.get('image'))
+    if image_path:
         try:
-            # Create FSInputFile for local image
-            image_path = pack['image']
-            photo = FSInputFile(image_path)
-            await call.message.answer_photo(
-                photo=photo,
-                caption=text,
-                reply_markup=_build_pack_detail_kb(pack_id, lang)
-            )
-        except Exception as e:
-            print(f"Error sending photo: {e}")
-            # Fallback to text if image fails
-            await call.message.answer(
-                text,
-                reply_markup=_build_pack_detail_kb(pack_id, lang)
-            )
-    else:
-        await call.message.answer(
-            text,
-            reply_markup=_build_pack_detail_kb(pack_id, lang)
-        )
+            sent = await show_photo(call.bot, call.message, str(image_path), text, kb)
+        except Exception:
+            logger.exception("Failed to show the photo of pack %s", pack_id)
+    
+    if sent is None:
+        # Image not cached yet (or failed) - show the text card
+        await replace_with_text(call.message, text, kb)
 
 
 @router.callback_query(F.data.startswith("meals:done:"))
@@ -346,14 +320,8 @@ async def mark_meal_done(call: types.CallbackQuery):
         text += f"🔥 {calories_text}"
         text += f"\n💰 {price_text}"
         
-        # Delete the old message with buttons and send new confirmation
-        try:
-            await call.message.delete()
-        except Exception as e:
-            print(f"Error deleting message: {e}")
-            # Continue anyway
-        
-        await call.message.answer(text, reply_markup=_build_back_to_menu_kb(lang))
+        # Turn the pack card into the confirmation
+        await edit_screen(call.message, text, _build_back_to_menu_kb(lang))
         
     except Exception as e:
         print(f"Error in mark_meal_done: {e}")
@@ -452,39 +420,68 @@ async def process_health_rating(call: types.CallbackQuery, state: FSMContext):
     await state.clear()
 
 
+@router.callback_query(F.data == "meals:search")
+async def start_search(call: types.CallbackQuery, state: FSMContext):
+    """Ask for a search query."""
+    lang = get_lang(call.from_user.id)
+    await state.set_state(MealStates.waiting_for_search_query)
+    
+    await edit_screen(call.message, t(lang, "meals.search.prompt"))
+    await call.answer()
+
+
+@router.message(Command("search"))
+@router.message(MealStates.waiting_for_search_query)
+async def process_search_query(message: types.Message, state: FSMContext, command: CommandObject = None):
+    """Search packs in the user's budget by name, ingredient or tag."""
+    lang = get_lang(message.from_user.id)
+    query = (command.args if command else message.text) or ""
+    query = query.strip()
+    if not query:
+        await state.set_state(MealStates.waiting_for_search_query)
+        await message.answer(t(lang, "meals.search.prompt"))
+        return
+    
+    await state.clear()
+    budget = get_user_budget(message.from_user.id) or "mid"
+    packs = search_meals(query, budget)
+    
+    if not packs:
+        await message.answer(
+            t(lang, "meals.search.empty", query=html.escape(query)),
+            reply_markup=_build_search_results_kb([], lang)
+        )
+        return
+    
+    await message.answer(
+        t(lang, "meals.search.results", query=html.escape(query)),
+        reply_markup=_build_search_results_kb(packs, lang)
+    )
+
+
 @router.callback_query(F.data == "meals:back_to_categories")
 async def back_to_categories(call: types.CallbackQuery):
     """Go back to category selection."""
     lang = get_lang(call.from_user.id)
-    # Delete current message
-    try:
-        await call.message.delete()
-    except:
-        pass
-    
     text = f"{t(lang, 'meals.title')}\n\n{t(lang, 'meals.choose_category')}"
-    await call.message.answer(text, reply_markup=_build_category_kb(lang))
+    await edit_screen(call.message, text, _build_category_kb(lang))
 
 
-@router.callback_query(F.data == "meals:back_to_packs")
+@router.callback_query(F.data.startswith("meals:back_to_packs"))
 async def back_to_packs(call: types.CallbackQuery):
-    """Go back to pack grid."""
+    """Go back to the pack grid of the pack's category."""
     lang = get_lang(call.from_user.id)
+    parts = call.data.split(":")
+    category = parts[2] if len(parts) > 2 else "breakfast"
     budget = get_user_budget(call.from_user.id)
     if not budget:
         budget = "mid"  # Fallback
     
-    # Delete current message
-    try:
-        await call.message.delete()
-    except:
-        pass
+    packs = get_personalized_meals(call.from_user.id, budget, category)
     
-    # Default to breakfast, should be improved to remember context
-    packs = get_meals_by_category(budget, "breakfast")
-    
-    text = f"{t(lang, 'meals.category.breakfast').title()}\n\n{t(lang, 'meals.choose_pack')}"
-    await call.message.answer(text, reply_markup=_build_pack_grid_kb(packs, lang))
+    # Keep the pack photo and put the grid into its caption
+    text = f"{t(lang, 'meals.category.' + category).title()}\n\n{t(lang, 'meals.choose_pack')}"
+    await edit_screen(call.message, text, _build_pack_grid_kb(packs, lang))
 
 
 @router.callback_query(F.data == "meals:back_to_menu")
@@ -523,9 +520,9 @@ async def handle_meal_reminder(call: types.CallbackQuery):
     text = f"{t(lang, 'meals.reminder.quick_log')}\n\n{category_text}"
     
     kb = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=t(lang, "meals.reminder.quick_pack"), callback_data=f"meals:quick_pack:{meal_type}")],
-        [InlineKeyboardButton(text=t(lang, "meals.reminder.quick_custom"), callback_data=f"meals:quick_custom:{meal_type}")],
-        [InlineKeyboardButton(text=t(lang, "meals.reminder.skip"), callback_data="meals:reminder:skip")]
+        [InlineKeyboardButton(text=t(lang, "meals.reminder.quick_pack"), callback_data=pack_callback("meals", "quick_pack", meal_type))],
+        [InlineKeyboardButton(text=t(lang, "meals.reminder.quick_custom"), callback_data=pack_callback("meals", "quick_custom", meal_type))],
+        [InlineKeyboardButton(text=t(lang, "meals.reminder.skip"), callback_data=pack_callback("meals", "reminder", "skip"))]
     ])
     
     try:
@@ -548,7 +545,7 @@ async def quick_pack_selection(call: types.CallbackQuery):
     if not budget:
         budget = "mid"  # Fallback
     
-    packs = get_meals_by_category(budget, meal_type)
+    packs = get_personalized_meals(call.from_user.id, budget, meal_type)
     
     if not packs:
         await call.answer(t(lang, "meals.no_packs"))
@@ -561,10 +558,10 @@ async def quick_pack_selection(call: types.CallbackQuery):
     kb_rows = []
     for pack in packs:
         pack_name = pack.get(f'name_{lang}', pack.get('name_en', 'Unknown'))
-        kb_rows.append([InlineKeyboardButton(text=f"📦 {pack['pack_number']}: {pack_name}", callback_data=f"meals:quick_done:{pack['id']}")])
+        kb_rows.append([InlineKeyboardButton(text=f"📦 {pack['pack_number']}: {pack_name}", callback_data=pack_callback("meals", "quick_done", pack['id']))])
     
     # Add back button
-    kb_rows.append([InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=f"meals:reminder:{meal_type}")])
+    kb_rows.append([InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "reminder", meal_type))])
     
     kb = InlineKeyboardMarkup(inline_keyboard=kb_rows)
     
@@ -613,14 +610,8 @@ async def quick_pack_done(call: types.CallbackQuery):
         text += f"📦 {name}\n"
         text += f"🔥 {calories_text}"
         
-        # Delete the old message with buttons and send new confirmation
-        try:
-            await call.message.delete()
-        except Exception as e:
-            print(f"Error deleting message in reminder: {e}")
-            # Continue anyway
-        
-        await call.message.answer(text)
+        # Replace the reminder with the confirmation
+        await edit_screen(call.message, text)
         
     except Exception as e:
         print(f"Error in quick_pack_done: {e}")
@@ -641,11 +632,11 @@ async def quick_custom_meal(call: types.CallbackQuery, state: FSMContext):
     
     if call.message.text:
         await call.message.edit_text(text, reply_markup=InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=f"meals:reminder:{meal_type}")]
+            [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "reminder", meal_type))]
         ]))
     else:
         await call.message.answer(text, reply_markup=InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=f"meals:reminder:{meal_type}")]
+            [InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("meals", "reminder", meal_type))]
         ]))
 
 
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from aiogram import F, types
+from typing import Dict, Optional, Tuple
+
+from aiogram import F, types, Router
 from aiogram.filters import Command
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.models.user import User
 from app.services.i18n import t, T
-from .start import router
+from app.services.keyboard_cache import cached_markup
+
+router = Router(name="menu")
 
 
 def get_lang(user_id: int) -> str:
@@ -18,6 +22,7 @@ def get_lang(user_id: int) -> str:
     return lang
 
 
+@cached_markup
 def build_main_menu_kb(lang: str) -> types.ReplyKeyboardMarkup:
     """Build the persistent main menu reply keyboard with 8 buttons."""
     return types.ReplyKeyboardMarkup(
@@ -44,6 +49,7 @@ def build_main_menu_kb(lang: str) -> types.ReplyKeyboardMarkup:
     )
 
 
+@cached_markup
 def build_back_to_menu_kb(lang: str) -> types.ReplyKeyboardMarkup:
     """Build back to main menu keyboard for submenus (single button)."""
     return types.ReplyKeyboardMarkup(
@@ -63,86 +69,114 @@ async def show_main_menu(message: types.Message):
     await message.answer(t(lang, "menu.welcome"), reply_markup=kb)
 
 
-# Button handlers for main menu
-WORKOUTS_BTNS = {T[x]["menu.workouts"] for x in T.keys()}
-MEALS_BTNS = {T[x]["menu.meals"] for x in T.keys()}
-SLEEP_BTNS = {T[x]["menu.sleep"] for x in T.keys()}
-PROGRESS_BTNS = {T[x]["menu.progress"] for x in T.keys()}
-REMINDERS_BTNS = {T[x]["menu.reminders"] for x in T.keys()}
-SETTINGS_BTNS = {T[x]["menu.settings"] for x in T.keys()}
-HELP_BTNS = {T[x]["menu.help"] for x in T.keys()}
-MAIN_BTNS = {T[x]["menu.main"] for x in T.keys()}
-PROFILE_BTNS = {T[x]["menu.profile"] for x in T.keys()}
-
-
-@router.message(F.text.in_(WORKOUTS_BTNS))
-async def handle_workouts(message: types.Message):
+# Button handlers for main menu.
+# Reply-keyboard text -> (action, language): the button itself tells which
+# language keyboard it came from, so no DB query is needed to answer it.
+MENU_ACTION_KEYS = {
+    "workouts": ("menu.workouts",),
+    "meals": ("menu.meals",),
+    "sleep": ("menu.sleep",),
+    "progress": ("menu.progress",),
+    "reminders": ("menu.reminders",),
+    "settings": ("menu.settings",),
+    "help": ("menu.help",),
+    "profile": ("menu.profile",),
+    "main": ("menu.main", "menu.back_to_main"),
+}
+
+
+def _build_menu_buttons() -> Dict[str, Tuple[str, Optional[str]]]:
+    buttons: Dict[str, Tuple[str, Optional[str]]] = {}
+    for lang, strings in T.items():
+        for action, keys in MENU_ACTION_KEYS.items():
+            for key in keys:
+                text = strings.get(key)
+                if not text:
+                    continue
+                known = buttons.get(text)
+                if known is None:
+                    buttons[text] = (action, lang)
+                elif known[1] != lang:
+                    # Same text in several languages: fall back to the user's language
+                    buttons[text] = (known[0], None)
+    return buttons
+
+
+MENU_BUTTONS = _build_menu_buttons()
+
+
+async def handle_workouts(message: types.Message, lang: str):
     """Handle workouts button click."""
     from .workouts import open_workouts_menu
-    lang = get_lang(message.from_user.id)
     # Send workouts menu with keyboard switch
     await open_workouts_menu(message, lang, reply_markup=build_back_to_menu_kb(lang))
 
 
-@router.message(F.text.in_(MEALS_BTNS))
-async def handle_meals(message: types.Message):
+async def handle_meals(message: types.Message, lang: str):
     """Handle meals button click."""
     from .meals import open_meals_menu
-    lang = get_lang(message.from_user.id)
     await open_meals_menu(message, lang, reply_markup=build_back_to_menu_kb(lang))
 
 
-@router.message(F.text.in_(SLEEP_BTNS))
-async def handle_sleep(message: types.Message):
+async def handle_sleep(message: types.Message, lang: str):
     """Handle sleep button click."""
     from .sleep import show_sleep_summary
-    lang = get_lang(message.from_user.id)
     await show_sleep_summary(message, lang, reply_markup=build_back_to_menu_kb(lang))
 
 
-@router.message(F.text.in_(PROGRESS_BTNS))
-async def handle_progress(message: types.Message):
+async def handle_progress(message: types.Message, lang: str):
     """Handle progress button click."""
     from .progress import show_progress_summary_from_menu
-    lang = get_lang(message.from_user.id)
     await show_progress_summary_from_menu(message, lang, reply_markup=build_back_to_menu_kb(lang))
 
 
-@router.message(F.text.in_(REMINDERS_BTNS))
-async def handle_reminders(message: types.Message):
+async def handle_reminders(message: types.Message, lang: str):
     """Handle reminders button click."""
     from .reminders import show_reminders_menu_from_menu
-    lang = get_lang(message.from_user.id)
     await show_reminders_menu_from_menu(message, lang, reply_markup=build_back_to_menu_kb(lang))
 
 
-@router.message(F.text.in_(SETTINGS_BTNS))
-async def handle_settings(message: types.Message):
+async def handle_settings(message: types.Message, lang: str):
     """Handle settings button click."""
     from .settings import open_settings_menu
-    lang = get_lang(message.from_user.id)
     await open_settings_menu(message, lang, reply_markup=build_back_to_menu_kb(lang))
 
 
-@router.message(F.text.in_(HELP_BTNS))
-async def handle_help(message: types.Message):
+async def handle_help(message: types.Message, lang: str):
     """Handle help button click."""
     from .help import show_help_from_menu
-    lang = get_lang(message.from_user.id)
     await show_help_from_menu(message, lang, reply_markup=build_back_to_menu_kb(lang))
 
 
-@router.message(F.text.in_(PROFILE_BTNS))
-async def handle_profile(message: types.Message):
+async def handle_profile(message: types.Message, lang: str):
     """Handle profile button click."""
     from .profile import show_profile_from_menu
-    lang = get_lang(message.from_user.id)
     await show_profile_from_menu(message, lang, reply_markup=build_back_to_menu_kb(lang))
 
 
-@router.message(F.text.in_(MAIN_BTNS))
-async def handle_main_menu(message: types.Message):
+async def handle_main_menu(message: types.Message, lang: str):
     """Handle main menu button click - return to main menu."""
-    lang = get_lang(message.from_user.id)
     kb = build_main_menu_kb(lang)
     await message.answer(t(lang, "menu.welcome"), reply_markup=kb)
+
+
+MENU_HANDLERS = {
+    "workouts": handle_workouts,
+    "meals": handle_meals,
+    "sleep": handle_sleep,
+    "progress": handle_progress,
+    "reminders": handle_reminders,
+    "settings": handle_settings,
+    "help": handle_help,
+    "profile": handle_profile,
+    "main": handle_main_menu,
+}
+
+
+@router.message(F.text.in_(MENU_BUTTONS))
+async def handle_menu_button(message: types.Message):
+    """Resolve a main-menu button by its text and open the matching section."""
+    action, lang = MENU_BUTTONS[message.text]
+    if lang is None:
+        lang = get_lang(message.from_user.id)
+    await MENU_HANDLERS[action](message, lang)
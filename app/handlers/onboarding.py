@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-from aiogram import F
+from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
 
-from .start import router
 from app.config import CHANNEL_USERNAME
 from app.database import SessionLocal
 from app.models.user import User
 from app.models.user_settings import UserSettings
 from app.services.i18n import t
+from app.services.callback_protocol import unpack_callback
 from app.services.channel_gate import build_gate_kb
 from app.services.onboarding import (
     build_budget_kb,
@@ -20,6 +20,8 @@ from app.services.onboarding import (
 )
 from app.services.reminders import schedule_sleep_notifications
 
+router = Router(name="onboarding")
+
 
 class OnbStates(StatesGroup):
     waiting_name = State()
@@ -161,7 +163,7 @@ async def onb_weight(message: Message, state: FSMContext) -> None:
 @router.callback_query(OnbStates.waiting_budget, F.data.startswith("onb:budget:"))
 async def onb_budget(call: CallbackQuery, state: FSMContext) -> None:
     lang = _get_user_lang(call.from_user.id)
-    budget_key = call.data.split(":", 2)[2]
+    budget_key = unpack_callback(call.data).field(0)
     
     # Save budget to both User and UserMealSettings
     with SessionLocal() as session:
@@ -189,7 +191,7 @@ async def onb_budget(call: CallbackQuery, state: FSMContext) -> None:
 @router.callback_query(OnbStates.waiting_workout_time, F.data.startswith("onb:workout:"))
 async def onb_workout_time(call: CallbackQuery, state: FSMContext) -> None:
     lang = _get_user_lang(call.from_user.id)
-    pref = call.data.split(":", 2)[2]
+    pref = unpack_callback(call.data).field(0)
     with SessionLocal() as session:
         user = session.query(User).filter(User.tg_id == call.from_user.id).first()
         if user:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from aiogram import F, types
+from aiogram import F, types, Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
@@ -10,7 +10,9 @@ from app.database import SessionLocal
 from app.models.user import User
 from app.models.user_settings import UserSettings
 from app.services.i18n import t, T
-from .start import router
+from app.services.callback_protocol import pack_callback, unpack_callback
+
+router = Router(name="profile")
 
 
 class ProfileEditStates(StatesGroup):
@@ -37,19 +39,19 @@ def _back_to_menu_kb(lang: str) -> types.InlineKeyboardMarkup:
 def _profile_edit_kb(lang: str) -> types.InlineKeyboardMarkup:
     """Build profile edit inline keyboard."""
     return types.InlineKeyboardMarkup(inline_keyboard=[
-        [types.InlineKeyboardButton(text=t(lang, "profile.edit"), callback_data="profile:edit_menu")]
+        [types.InlineKeyboardButton(text=t(lang, "profile.edit"), callback_data=pack_callback("profile", "edit_menu"))]
     ])
 
 
 def _profile_edit_menu_kb(lang: str) -> types.InlineKeyboardMarkup:
     """Build profile edit menu keyboard with separate buttons for each field."""
     return types.InlineKeyboardMarkup(inline_keyboard=[
-        [types.InlineKeyboardButton(text=t(lang, "profile.edit_name"), callback_data="profile:edit:name")],
-        [types.InlineKeyboardButton(text=t(lang, "profile.edit_age"), callback_data="profile:edit:age")],
-        [types.InlineKeyboardButton(text=t(lang, "profile.edit_height"), callback_data="profile:edit:height")],
-        [types.InlineKeyboardButton(text=t(lang, "profile.edit_weight"), callback_data="profile:edit:weight")],
-        [types.InlineKeyboardButton(text=t(lang, "profile.edit_budget"), callback_data="profile:edit:budget")],
-        [types.InlineKeyboardButton(text=t(lang, "menu.back"), callback_data="profile:back_to_profile")]
+        [types.InlineKeyboardButton(text=t(lang, "profile.edit_name"), callback_data=pack_callback("profile", "edit", "name"))],
+        [types.InlineKeyboardButton(text=t(lang, "profile.edit_age"), callback_data=pack_callback("profile", "edit", "age"))],
+        [types.InlineKeyboardButton(text=t(lang, "profile.edit_height"), callback_data=pack_callback("profile", "edit", "height"))],
+        [types.InlineKeyboardButton(text=t(lang, "profile.edit_weight"), callback_data=pack_callback("profile", "edit", "weight"))],
+        [types.InlineKeyboardButton(text=t(lang, "profile.edit_budget"), callback_data=pack_callback("profile", "edit", "budget"))],
+        [types.InlineKeyboardButton(text=t(lang, "menu.back"), callback_data=pack_callback("profile", "back_to_profile"))]
     ])
 
 
@@ -154,7 +156,7 @@ async def back_to_profile(call: types.CallbackQuery):
 async def profile_edit_field(call: types.CallbackQuery, state: FSMContext):
     """Start editing a profile field."""
     lang = get_lang(call.from_user.id)
-    field = call.data.split(":")[2]
+    field = unpack_callback(call.data).field(0)
     
     if field == "name":
         await state.set_state(ProfileEditStates.waiting_for_name)
@@ -330,7 +332,7 @@ async def profile_save_budget(message: types.Message, state: FSMContext):
 async def profile_pick_budget(call: types.CallbackQuery):
     """Handle budget selection from profile."""
     lang = get_lang(call.from_user.id)
-    budget = call.data.split(":", 1)[1]
+    budget = unpack_callback(call.data).action
     
     if budget not in ["low", "mid", "high"]:
         await call.answer("Invalid budget")
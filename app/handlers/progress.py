@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from aiogram import F, types
+from aiogram import F, types, Router
 from aiogram.filters import Command
 from sqlalchemy.orm import Session
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from typing import Callable, Tuple
 
 from app.database import SessionLocal
 from app.models.user import User
@@ -11,8 +13,13 @@ from app.models.user_settings import UserSettings
 from app.models.sleep_log import SleepLog
 from app.models.notification_log import NotificationLog
 from app.services.i18n import t, T
+from app.services.callback_protocol import pack_callback, unpack_callback
 from app.services.progress import get_comprehensive_progress_stats
-from .start import router
+from app.services.keyboard_cache import cached_markup
+from app.services.overload import is_degraded
+from app.services.report_templates import ReportTemplate, Section
+
+router = Router(name="progress")
 
 
 def get_lang(user_id: int) -> str:
@@ -28,22 +35,46 @@ def _back_to_menu_kb(lang: str) -> types.InlineKeyboardMarkup:
     return types.InlineKeyboardMarkup(inline_keyboard=[])
 
 
+@cached_markup
 def _details_kb(lang: str) -> types.InlineKeyboardMarkup:
     """Build details inline keyboard."""
     return types.InlineKeyboardMarkup(inline_keyboard=[
         [
-            types.InlineKeyboardButton(text=t(lang, "progress.details.workouts"), callback_data="progress:details:workouts"),
-            types.InlineKeyboardButton(text=t(lang, "progress.details.sleep"), callback_data="progress:details:sleep")
+            types.InlineKeyboardButton(text=t(lang, "progress.details.workouts"), callback_data=pack_callback("progress", "details", "workouts")),
+            types.InlineKeyboardButton(text=t(lang, "progress.details.sleep"), callback_data=pack_callback("progress", "details", "sleep"))
         ],
         [
-            types.InlineKeyboardButton(text=t(lang, "progress.details.meals"), callback_data="progress:details:meals"),
-            types.InlineKeyboardButton(text=t(lang, "progress.details.notifications"), callback_data="progress:details:notifications")
+            types.InlineKeyboardButton(text=t(lang, "progress.details.meals"), callback_data=pack_callback("progress", "details", "meals")),
+            types.InlineKeyboardButton(text=t(lang, "progress.details.notifications"), callback_data=pack_callback("progress", "details", "notifications"))
         ]
     ])
 
 
+# Last computed values per (report part, user), served as-is while the bot is overloaded
+PROGRESS_SNAPSHOT_LIMIT = 5000
+_snapshots: "OrderedDict[Tuple[str, int], dict]" = OrderedDict()
+
+
+def _snapshot(part: str, user_id: int, compute: Callable[[int], dict]) -> dict:
+    """compute(user_id), or its last result while the bot is degraded."""
+    key = (part, user_id)
+    if is_degraded() and key in _snapshots:
+        return _snapshots[key]
+    values = compute(user_id)
+    if values:
+        _snapshots[key] = values
+        _snapshots.move_to_end(key)
+        if len(_snapshots) > PROGRESS_SNAPSHOT_LIMIT:
+            _snapshots.popitem(last=False)
+    return values
+
+
 def get_progress_stats(user_id: int) -> dict:
     """Get aggregated progress statistics for the user."""
+    return _snapshot("stats", user_id, _compute_progress_stats)
+
+
+def _compute_progress_stats(user_id: int) -> dict:
     with SessionLocal() as session:
         user = session.query(User).filter(User.tg_id == user_id).first()
         if not user:
@@ -120,6 +151,184 @@ def get_progress_stats(user_id: int) -> dict:
         }
 
 
+_NOTIFICATION_TYPES = ("workout", "breakfast", "lunch", "dinner", "sleep")
+
+_MEALS_LINES = (
+    "   • [[progress.meals.this_week]]: {meals_this_week}\n"
+    "   • [[progress.meals.healthy]]: {meals_healthy}\n"
+    "   • [[progress.meals.unsure]]: {meals_unsure}\n"
+    "   • [[progress.meals.unhealthy]]: {meals_unhealthy}\n"
+    "   • [[progress.meals.healthiness]]: {meals_healthiness}%\n"
+    "   • [[progress.meals.custom]]: {meals_custom}\n"
+)
+
+SUMMARY_REPORT = ReportTemplate(
+    "[[progress.title]]\n\n",
+    Section(
+        "😴 [[progress.sleep.title]]:\n"
+        "   • [[progress.sleep.avg_duration]]: {sleep_avg_duration:.1f}h\n"
+        "   • [[progress.sleep.optimal_nights]]: {sleep_optimal_nights}/{sleep_total_nights}\n",
+        when="sleep_has_data",
+        otherwise="😴 [[progress.sleep.no_data]]\n",
+    ),
+    Section(
+        "   • [[progress.sleep.electronics]]: {sleep_electronics} [[progress.sleep.nights]]\n",
+        when="sleep_has_electronics",
+    ),
+    "\n🏋️ [[progress.workouts.title]]:\n"
+    "   • [[progress.workouts.this_week]]: {workouts_total}\n"
+    "\n🍽️ [[progress.meals.title]]:\n" + _MEALS_LINES +
+    "\n🔔 [[progress.details.notifications]]:\n",
+    Section(
+        "   • [[progress.details.notifications.status]]: ✅ [[progress.details.notifications.enabled]]\n",
+        when="reminders_enabled",
+        otherwise="   • [[progress.details.notifications.status]]: ❌ [[progress.details.notifications.disabled]]\n",
+    ),
+    "   • [[progress.details.notifications.workout]]: {workout_time}\n"
+    "   • [[progress.details.notifications.breakfast]]: {breakfast_time}\n"
+    "   • [[progress.details.notifications.lunch]]: {lunch_time}\n"
+    "   • [[progress.details.notifications.dinner]]: {dinner_time}\n"
+    "   • [[progress.details.notifications.sleep]]: {sleep_time}\n",
+)
+
+MENU_SUMMARY_REPORT = ReportTemplate(
+    "[[progress.title]]\n\n",
+    Section(
+        "😴 [[progress.sleep.title]]:\n"
+        "   • [[progress.sleep.avg_duration]]: {sleep_avg_duration}h\n"
+        "   • [[progress.sleep.optimal_nights]]: {sleep_optimal_nights}/{sleep_total_nights}\n",
+        when="sleep_has_data",
+        otherwise="😴 [[progress.sleep.no_data]]\n",
+    ),
+    Section(
+        "   • [[progress.sleep.deviation]]: {sleep_deviation} [[progress.sleep.nights]]\n",
+        when="sleep_has_deviation",
+    ),
+    "\n🏋️ [[progress.workouts.title]]:\n"
+    "   • [[progress.workouts.this_week]]: {workouts_this_week}\n"
+    "   • [[progress.workouts.total]]: {workouts_total}\n"
+    "\n🍽️ [[progress.meals.title]]:\n" + _MEALS_LINES,
+)
+
+DETAIL_REPORTS = {
+    "sleep": ReportTemplate(
+        "[[progress.details.sleep.title]]\n\n",
+        Section(
+            "📊 [[progress.details.sleep.last_7_days]]:\n"
+            "   • [[progress.details.sleep.nights_tracked]]: {sleep_total_nights}\n"
+            "   • [[progress.details.sleep.avg_duration]]: {sleep_avg_duration}h\n"
+            "   • [[progress.details.sleep.optimal_pct]]: {sleep_optimal_pct}%\n",
+            when="sleep_has_data",
+            otherwise="[[progress.details.sleep.no_data]]",
+        ),
+    ),
+    "workouts": ReportTemplate(
+        "[[progress.details.workouts.title]]\n\n"
+        "📊 [[progress.details.workouts.summary]]:\n"
+        "   • [[progress.details.workouts.this_week]]: {workouts_this_week}\n"
+        "   • [[progress.details.workouts.total]]: {workouts_total}\n"
+    ),
+    "meals": ReportTemplate(
+        "[[progress.details.meals.title]]\n\n"
+        "📊 [[progress.details.meals.summary]]:\n"
+        "   • [[progress.details.meals.this_week]]: {meals_this_week}\n"
+        "   • [[progress.details.meals.healthy]]: {meals_healthy}\n"
+        "   • [[progress.details.meals.unsure]]: {meals_unsure}\n"
+        "   • [[progress.details.meals.unhealthy]]: {meals_unhealthy}\n"
+        "   • [[progress.details.meals.healthiness]]: {meals_healthiness}%\n"
+        "   • [[progress.details.meals.custom]]: {meals_custom}\n"
+    ),
+    "notifications": ReportTemplate(
+        "[[progress.details.notifications.title]]\n\n"
+        "📊 [[progress.details.notifications.summary]]:\n",
+        Section(
+            "   • [[progress.details.notifications.status]]: ✅ [[reminders.enabled]]\n\n",
+            when="reminders_enabled",
+            otherwise="   • [[progress.details.notifications.status]]: ❌ [[reminders.disabled]]\n\n",
+        ),
+        "".join(
+            f"   • [[progress.details.notifications.{kind}]]:\n"
+            f"     - [[progress.details.notifications.sent]]: {{{kind}_sent}}\n"
+            f"     - [[progress.details.notifications.responded]]: {{{kind}_responded}}\n"
+            f"     - [[progress.details.notifications.skipped]]: {{{kind}_skipped}}\n"
+            for kind in _NOTIFICATION_TYPES
+        ),
+    ),
+}
+
+
+def _progress_values(stats: dict) -> dict:
+    """Flat slot values of the progress reports."""
+    sleep, workouts, meals = stats["sleep"], stats["workouts"], stats["meals"]
+    nights = sleep["total_nights"]
+    electronics = sleep.get("electronics_used", 0)
+    return {
+        "sleep_has_data": nights > 0,
+        "sleep_total_nights": nights,
+        "sleep_avg_duration": sleep["avg_duration"],
+        "sleep_optimal_nights": sleep["optimal_nights"],
+        "sleep_optimal_pct": round(100 * sleep["optimal_nights"] / nights) if nights else 0,
+        "sleep_deviation": sleep["deviation"],
+        "sleep_has_deviation": nights > 0 and sleep["deviation"] > 0,
+        "sleep_electronics": electronics,
+        "sleep_has_electronics": nights > 0 and electronics > 0,
+        "workouts_this_week": workouts["this_week"],
+        "workouts_total": workouts["total"],
+        "meals_this_week": meals["this_week"],
+        "meals_healthy": meals["healthy"],
+        "meals_unsure": meals["unsure"],
+        "meals_unhealthy": meals["unhealthy"],
+        "meals_healthiness": meals["healthiness_percentage"],
+        "meals_custom": meals["custom_meals"],
+    }
+
+
+def _reminder_values(user_id: int) -> dict:
+    """Reminder switch and times shown on the progress summary."""
+    return _snapshot("reminders", user_id, _compute_reminder_values)
+
+
+def _compute_reminder_values(user_id: int) -> dict:
+    with SessionLocal() as session:
+        user = session.query(User).filter(User.tg_id == user_id).first()
+        settings = session.query(UserSettings).filter(UserSettings.user_id == user_id).first() if user else None
+        return {
+            "reminders_enabled": getattr(user, 'reminders_enabled', True),
+            "workout_time": (user.reminder_time if user else None) or 'morning',
+            "breakfast_time": settings.breakfast_time if settings else '08:00',
+            "lunch_time": settings.lunch_time if settings else '13:00',
+            "dinner_time": settings.dinner_time if settings else '19:00',
+            "sleep_time": settings.sleep_time if settings else '22:00',
+        }
+
+
+def _notification_values(user_id: int) -> dict:
+    """Sent/responded/skipped counts per reminder type."""
+    return _snapshot("notifications", user_id, _compute_notification_values)
+
+
+def _compute_notification_values(user_id: int) -> dict:
+    values = {"reminders_enabled": True}
+    for kind in _NOTIFICATION_TYPES:
+        values.update({f"{kind}_sent": 0, f"{kind}_responded": 0, f"{kind}_skipped": 0})
+    with SessionLocal() as session:
+        user = session.query(User).filter(User.tg_id == user_id).first()
+        if not user:
+            return values
+        values["reminders_enabled"] = getattr(user, 'reminders_enabled', True)
+        notification_logs = session.query(NotificationLog).filter(
+            NotificationLog.user_id == user.tg_id
+        ).all()
+        for log in notification_logs:
+            if log.notification_type in _NOTIFICATION_TYPES:
+                values[f"{log.notification_type}_sent"] += 1
+                if log.responded:
+                    values[f"{log.notification_type}_responded"] += 1
+                if log.action == 'skipped':
+                    values[f"{log.notification_type}_skipped"] += 1
+    return values
+
+
 @router.message(Command("progress"))
 async def show_progress_summary(message: types.Message):
     """Show progress summary with aggregated statistics."""
@@ -130,58 +339,8 @@ async def show_progress_summary(message: types.Message):
         await message.answer(t(lang, "progress.no_data"), reply_markup=_back_to_menu_kb(lang))
         return
     
-    # Build summary text
-    text = f"{t(lang, 'progress.title')}\n\n"
-    
-    # Sleep summary
-    sleep = stats["sleep"]
-    if sleep["total_nights"] > 0:
-        text += f"😴 {t(lang, 'progress.sleep.title')}:\n"
-        text += f"   • {t(lang, 'progress.sleep.avg_duration')}: {sleep['avg_duration']:.1f}h\n"
-        text += f"   • {t(lang, 'progress.sleep.optimal_nights')}: {sleep['optimal_nights']}/{sleep['total_nights']}\n"
-        if sleep.get("electronics_used", 0) > 0:
-            text += f"   • {t(lang, 'progress.sleep.electronics')}: {sleep['electronics_used']} {t(lang, 'progress.sleep.nights')}\n"
-    else:
-        text += f"😴 {t(lang, 'progress.sleep.no_data')}\n"
-    
-    # Workout summary
-    workouts = stats["workouts"]
-    text += f"\n🏋️ {t(lang, 'progress.workouts.title')}:\n"
-    text += f"   • {t(lang, 'progress.workouts.this_week')}: {workouts['total']}\n"
-    
-    # Meal summary
-    meals = stats["meals"]
-    text += f"\n🍽️ {t(lang, 'progress.meals.title')}:\n"
-    text += f"   • {t(lang, 'progress.meals.this_week')}: {meals['this_week']}\n"
-    text += f"   • {t(lang, 'progress.meals.healthy')}: {meals['healthy']}\n"
-    text += f"   • {t(lang, 'progress.meals.unsure')}: {meals['unsure']}\n"
-    text += f"   • {t(lang, 'progress.meals.unhealthy')}: {meals['unhealthy']}\n"
-    text += f"   • {t(lang, 'progress.meals.healthiness')}: {meals['healthiness_percentage']}%\n"
-    text += f"   • {t(lang, 'progress.meals.custom')}: {meals['custom_meals']}\n"
-    
-    # Notifications summary
-    with SessionLocal() as session:
-        user = session.query(User).filter(User.tg_id == message.from_user.id).first()
-        if user:
-            reminders_enabled = getattr(user, 'reminders_enabled', True)
-            workout_time = user.reminder_time or 'morning'
-            
-            # Get user settings for meal times
-            settings = session.query(UserSettings).filter(UserSettings.user_id == user.tg_id).first()
-            breakfast_time = settings.breakfast_time if settings else '08:00'
-            lunch_time = settings.lunch_time if settings else '13:00'
-            dinner_time = settings.dinner_time if settings else '19:00'
-            sleep_time = settings.sleep_time if settings else '22:00'
-    
-    text += f"\n🔔 {t(lang, 'progress.details.notifications')}:\n"
-    text += f"   • {t(lang, 'progress.details.notifications.status')}: {'✅ ' + t(lang, 'progress.details.notifications.enabled') if reminders_enabled else '❌ ' + t(lang, 'progress.details.notifications.disabled')}\n"
-    text += f"   • {t(lang, 'progress.details.notifications.workout')}: {workout_time}\n"
-    text += f"   • {t(lang, 'progress.details.notifications.breakfast')}: {breakfast_time}\n"
-    text += f"   • {t(lang, 'progress.details.notifications.lunch')}: {lunch_time}\n"
-    text += f"   • {t(lang, 'progress.details.notifications.dinner')}: {dinner_time}\n"
-    text += f"   • {t(lang, 'progress.details.notifications.sleep')}: {sleep_time}\n"
-    
-    await message.answer(text, reply_markup=_details_kb(lang))
+    values = {**_progress_values(stats), **_reminder_values(message.from_user.id)}
+    await message.answer(SUMMARY_REPORT.render(values, lang), reply_markup=_details_kb(lang))
 
 
 async def show_progress_summary_from_menu(message: types.Message, lang: str, reply_markup=None):
@@ -194,35 +353,7 @@ async def show_progress_summary_from_menu(message: types.Message, lang: str, rep
         await message.answer(t(lang, "progress.no_data"), reply_markup=_back_to_menu_kb(lang))
         return
     
-    # Build summary text
-    text = f"{t(lang, 'progress.title')}\n\n"
-    
-    # Sleep summary
-    sleep = stats["sleep"]
-    if sleep["total_nights"] > 0:
-        text += f"😴 {t(lang, 'progress.sleep.title')}:\n"
-        text += f"   • {t(lang, 'progress.sleep.avg_duration')}: {sleep['avg_duration']}h\n"
-        text += f"   • {t(lang, 'progress.sleep.optimal_nights')}: {sleep['optimal_nights']}/{sleep['total_nights']}\n"
-        if sleep["deviation"] > 0:
-            text += f"   • {t(lang, 'progress.sleep.deviation')}: {sleep['deviation']} {t(lang, 'progress.sleep.nights')}\n"
-    else:
-        text += f"😴 {t(lang, 'progress.sleep.no_data')}\n"
-    
-    # Workout summary
-    workouts = stats["workouts"]
-    text += f"\n🏋️ {t(lang, 'progress.workouts.title')}:\n"
-    text += f"   • {t(lang, 'progress.workouts.this_week')}: {workouts['this_week']}\n"
-    text += f"   • {t(lang, 'progress.workouts.total')}: {workouts['total']}\n"
-    
-    # Meal summary
-    meals = stats["meals"]
-    text += f"\n🍽️ {t(lang, 'progress.meals.title')}:\n"
-    text += f"   • {t(lang, 'progress.meals.this_week')}: {meals['this_week']}\n"
-    text += f"   • {t(lang, 'progress.meals.healthy')}: {meals['healthy']}\n"
-    text += f"   • {t(lang, 'progress.meals.unsure')}: {meals['unsure']}\n"
-    text += f"   • {t(lang, 'progress.meals.unhealthy')}: {meals['unhealthy']}\n"
-    text += f"   • {t(lang, 'progress.meals.healthiness')}: {meals['healthiness_percentage']}%\n"
-    text += f"   • {t(lang, 'progress.meals.custom')}: {meals['custom_meals']}\n"
+    text = MENU_SUMMARY_REPORT.render(_progress_values(stats), lang)
     
     if reply_markup:
         await message.answer("🔽", reply_markup=reply_markup)
@@ -236,86 +367,20 @@ async def show_progress_summary_from_menu(message: types.Message, lang: str, rep
 async def show_details(call: types.CallbackQuery):
     """Show detailed progress for specific category."""
     lang = get_lang(call.from_user.id)
-    detail_type = call.data.split(":")[2]
+    detail_type = unpack_callback(call.data).field(0)
     
     stats = get_progress_stats(call.from_user.id)
     if not stats:
         await call.answer(t(lang, "progress.no_data"))
         return
     
-    text = f"{t(lang, f'progress.details.{detail_type}.title')}\n\n"
-    
-    if detail_type == "sleep":
-        sleep = stats["sleep"]
-        if sleep["total_nights"] > 0:
-            text += f"📊 {t(lang, 'progress.details.sleep.last_7_days')}:\n"
-            text += f"   • {t(lang, 'progress.details.sleep.nights_tracked')}: {sleep['total_nights']}\n"
-            text += f"   • {t(lang, 'progress.details.sleep.avg_duration')}: {sleep['avg_duration']}h\n"
-            text += f"   • {t(lang, 'progress.details.sleep.optimal_pct')}: {round(100 * sleep['optimal_nights'] / sleep['total_nights'])}%\n"
-        else:
-            text += t(lang, "progress.details.sleep.no_data")
-    
-    elif detail_type == "workouts":
-        workouts = stats["workouts"]
-        text += f"📊 {t(lang, 'progress.details.workouts.summary')}:\n"
-        text += f"   • {t(lang, 'progress.details.workouts.this_week')}: {workouts['this_week']}\n"
-        text += f"   • {t(lang, 'progress.details.workouts.total')}: {workouts['total']}\n"
-        # Note: by_group data not available in current stats structure
-    
-    elif detail_type == "meals":
-        meals = stats["meals"]
-        text += f"📊 {t(lang, 'progress.details.meals.summary')}:\n"
-        text += f"   • {t(lang, 'progress.details.meals.this_week')}: {meals['this_week']}\n"
-        text += f"   • {t(lang, 'progress.details.meals.healthy')}: {meals['healthy']}\n"
-        text += f"   • {t(lang, 'progress.details.meals.unsure')}: {meals['unsure']}\n"
-        text += f"   • {t(lang, 'progress.details.meals.unhealthy')}: {meals['unhealthy']}\n"
-        text += f"   • {t(lang, 'progress.details.meals.healthiness')}: {meals['healthiness_percentage']}%\n"
-        text += f"   • {t(lang, 'progress.details.meals.custom')}: {meals['custom_meals']}\n"
-    
+    report = DETAIL_REPORTS.get(detail_type)
+    if report is None:
+        text = f"{t(lang, f'progress.details.{detail_type}.title')}\n\n"
     elif detail_type == "notifications":
-        # Get notification statistics
-        with SessionLocal() as session:
-            user = session.query(User).filter(User.tg_id == call.from_user.id).first()
-            if user:
-                reminders_enabled = getattr(user, 'reminders_enabled', True)
-                
-                # Get notification statistics from logs
-                notification_logs = session.query(NotificationLog).filter(
-                    NotificationLog.user_id == user.tg_id
-                ).all()
-                
-                # Count by type and action
-                stats = {
-                    'workout': {'sent': 0, 'responded': 0, 'skipped': 0},
-                    'breakfast': {'sent': 0, 'responded': 0, 'skipped': 0},
-                    'lunch': {'sent': 0, 'responded': 0, 'skipped': 0},
-                    'dinner': {'sent': 0, 'responded': 0, 'skipped': 0},
-                    'sleep': {'sent': 0, 'responded': 0, 'skipped': 0}
-                }
-                
-                for log in notification_logs:
-                    if log.notification_type in stats:
-                        stats[log.notification_type]['sent'] += 1
-                        if log.responded:
-                            stats[log.notification_type]['responded'] += 1
-                        if log.action == 'skipped':
-                            stats[log.notification_type]['skipped'] += 1
-        
-        text += f"📊 {t(lang, 'progress.details.notifications.summary')}:\n"
-        status_text = t(lang, 'reminders.enabled') if reminders_enabled else t(lang, 'reminders.disabled')
-        text += f"   • {t(lang, 'progress.details.notifications.status')}: {'✅ ' + status_text if reminders_enabled else '❌ ' + status_text}\n\n"
-        
-        # Show statistics for each notification type
-        for notif_type in ['workout', 'breakfast', 'lunch', 'dinner', 'sleep']:
-            type_name = t(lang, f'progress.details.notifications.{notif_type}')
-            sent = stats[notif_type]['sent']
-            responded = stats[notif_type]['responded']
-            skipped = stats[notif_type]['skipped']
-            
-            text += f"   • {type_name}:\n"
-            text += f"     - {t(lang, 'progress.details.notifications.sent')}: {sent}\n"
-            text += f"     - {t(lang, 'progress.details.notifications.responded')}: {responded}\n"
-            text += f"     - {t(lang, 'progress.details.notifications.skipped')}: {skipped}\n"
+        text = report.render(_notification_values(call.from_user.id), lang)
+    else:
+        text = report.render(_progress_values(stats), lang)
     
     await call.message.edit_text(text, reply_markup=_details_kb(lang))
     await call.answer()
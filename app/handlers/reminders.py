@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from aiogram import F, types
+from aiogram import F, types, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
@@ -10,7 +10,10 @@ from app.database import SessionLocal
 from app.models.user import User
 from app.models.user_settings import UserSettings
 from app.services.i18n import t, T
-from .start import router
+from app.services.callback_protocol import pack_callback, unpack_callback
+from app.services.keyboard_cache import cached_markup
+
+router = Router(name="reminders")
 
 
 class ReminderSettings(StatesGroup):
@@ -29,32 +32,35 @@ def get_lang(user_id: int) -> str:
     return lang
 
 
+@cached_markup
 def _back_to_menu_kb(lang: str) -> types.InlineKeyboardMarkup:
     """Build back to main menu keyboard."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "btn_back"), callback_data="back_to_main")
+    kb.button(text=t(lang, "btn_back"), callback_data=pack_callback("back_to_main", ""))
     kb.adjust(1)
     return kb.as_markup()
 
 
+@cached_markup
 def _reminders_main_kb(lang: str) -> types.InlineKeyboardMarkup:
     """Build main reminders menu keyboard."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "reminders.settings"), callback_data="reminders:settings")
-    kb.button(text=t(lang, "reminders.toggle_all"), callback_data="reminders:toggle_all")
+    kb.button(text=t(lang, "reminders.settings"), callback_data=pack_callback("reminders", "settings"))
+    kb.button(text=t(lang, "reminders.toggle_all"), callback_data=pack_callback("reminders", "toggle_all"))
     kb.adjust(1)
     return kb.as_markup()
 
 
+@cached_markup
 def _reminders_settings_kb(lang: str) -> types.InlineKeyboardMarkup:
     """Build reminders settings keyboard."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "reminders.workout_time"), callback_data="reminders:set_workout")
-    kb.button(text=t(lang, "reminders.sleep_reminder"), callback_data="reminders:set_sleep")
-    kb.button(text=t(lang, "reminders.breakfast_time"), callback_data="reminders:set_breakfast")
-    kb.button(text=t(lang, "reminders.lunch_time"), callback_data="reminders:set_lunch")
-    kb.button(text=t(lang, "reminders.dinner_time"), callback_data="reminders:set_dinner")
-    kb.button(text=t(lang, "btn_back"), callback_data="reminders:main")
+    kb.button(text=t(lang, "reminders.workout_time"), callback_data=pack_callback("reminders", "set_workout"))
+    kb.button(text=t(lang, "reminders.sleep_reminder"), callback_data=pack_callback("reminders", "set_sleep"))
+    kb.button(text=t(lang, "reminders.breakfast_time"), callback_data=pack_callback("reminders", "set_breakfast"))
+    kb.button(text=t(lang, "reminders.lunch_time"), callback_data=pack_callback("reminders", "set_lunch"))
+    kb.button(text=t(lang, "reminders.dinner_time"), callback_data=pack_callback("reminders", "set_dinner"))
+    kb.button(text=t(lang, "btn_back"), callback_data=pack_callback("reminders", "main"))
     kb.adjust(1)
     return kb.as_markup()
 
@@ -233,10 +239,10 @@ async def set_workout_time(call: types.CallbackQuery, state: FSMContext):
     lang = get_lang(call.from_user.id)
     
     kb = InlineKeyboardBuilder()
-    kb.button(text="🌅 Утром (08:00)", callback_data="reminders:workout_morning")
-    kb.button(text="☀️ Днем (13:00)", callback_data="reminders:workout_day")
-    kb.button(text="🌙 Вечером (19:00)", callback_data="reminders:workout_evening")
-    kb.button(text=t(lang, "btn_back"), callback_data="reminders:settings")
+    kb.button(text="🌅 Утром (08:00)", callback_data=pack_callback("reminders", "workout_morning"))
+    kb.button(text="☀️ Днем (13:00)", callback_data=pack_callback("reminders", "workout_day"))
+    kb.button(text="🌙 Вечером (19:00)", callback_data=pack_callback("reminders", "workout_evening"))
+    kb.button(text=t(lang, "btn_back"), callback_data=pack_callback("reminders", "settings"))
     kb.adjust(1)
     
     text = """⏰ Время тренировок
@@ -250,7 +256,7 @@ async def set_workout_time(call: types.CallbackQuery, state: FSMContext):
 async def save_workout_time(call: types.CallbackQuery):
     """Save workout time setting."""
     lang = get_lang(call.from_user.id)
-    time_setting = call.data.split("_")[-1]  # morning, day, evening
+    time_setting = unpack_callback(call.data).action.split("_")[-1]  # morning, day, evening
     
     with SessionLocal() as session:
         user = session.query(User).filter(User.tg_id == call.from_user.id).first()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from aiogram import F
+from aiogram import F, Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
@@ -10,6 +10,7 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from app.database import SessionLocal
 from app.models.user import User
 from app.services.i18n import t, T
+from app.services.callback_protocol import pack_callback, unpack_callback
 from app.services.settings import (
     build_settings_menu_kb,
     build_language_kb,
@@ -17,9 +18,10 @@ from app.services.settings import (
     build_reminder_kb,
     parse_profile_text,
 )
-from .start import router
 from app.services.reminders import start_scheduler, schedule_daily_reminder
 
+router = Router(name="settings")
+
 
 class OnboardingStates(StatesGroup):
     waiting_for_name = State()
@@ -140,7 +142,7 @@ async def settings_change_lang(call: CallbackQuery) -> None:
 
 @router.callback_query(F.data.startswith("lang:"))
 async def pick_language(call: CallbackQuery) -> None:
-    new_lang = call.data.split(":", 1)[1]
+    new_lang = unpack_callback(call.data).action
     with SessionLocal() as session:
         user = session.query(User).filter(User.tg_id == call.from_user.id).first()
         if user:
@@ -182,7 +184,7 @@ async def settings_set_profile(call: CallbackQuery, state: FSMContext) -> None:
         text = t(lang, "profile.no_data")
 
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "profile.edit"), callback_data="settings:profile:renew")
+    kb.button(text=t(lang, "profile.edit"), callback_data=pack_callback("settings", "profile", "renew"))
     kb.adjust(1)
     await call.message.edit_text(text, reply_markup=kb.as_markup())
     await call.answer()
@@ -281,7 +283,7 @@ async def profile_set_weight(message: Message, state: FSMContext) -> None:
 
 @router.callback_query(ProfileStates.waiting_for_budget, F.data.startswith("budget:"))
 async def pick_budget(call: CallbackQuery, state: FSMContext) -> None:
-    budget = call.data.split(":", 1)[1]
+    budget = unpack_callback(call.data).action
     with SessionLocal() as session:
         user = session.query(User).filter(User.tg_id == call.from_user.id).first()
         lang = (user.language or "ru") if user else "ru"
@@ -311,7 +313,7 @@ async def settings_reminder(call: CallbackQuery) -> None:
 
 @router.callback_query(F.data.startswith("reminder:"))
 async def pick_reminder(call: CallbackQuery) -> None:
-    choice = call.data.split(":", 1)[1]
+    choice = unpack_callback(call.data).action
     with SessionLocal() as session:
         user = session.query(User).filter(User.tg_id == call.from_user.id).first()
         lang = (user.language or "ru") if user else "ru"
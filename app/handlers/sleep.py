@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-from aiogram import F, types
+from aiogram import F, types, Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import Message, CallbackQuery
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-from .start import router
 from app.database import SessionLocal
 from app.models.user import User
 from app.models.sleep_log import SleepLog
 from app.services.i18n import t
-from app.services.sleep_tips import get_random_tip, get_sleep_stats, get_electronics_feedback, get_quality_emoji_and_text, RECOMMENDED_SLEEP_SCHEDULE
+from app.services.callback_protocol import pack_callback, unpack_callback
+from app.services.sleep_tips import get_next_tip, get_sleep_stats, get_electronics_feedback, get_quality_emoji_and_text, RECOMMENDED_SLEEP_SCHEDULE
+from app.services.keyboard_cache import cached_markup
+
+router = Router(name="sleep")
 
 
 class SleepStates(StatesGroup):
@@ -28,67 +31,73 @@ def _get_lang(user_id: int) -> str:
         return (user.language or "ru") if user else "ru"
 
 
-def _build_sleep_menu_kb(lang: str) -> InlineKeyboardBuilder:
+@cached_markup
+def _build_sleep_menu_kb(lang: str) -> InlineKeyboardMarkup:
     """Build main sleep menu keyboard."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "sleep.log_sleep"), callback_data="sleep:log")
-    kb.button(text=t(lang, "sleep.daily_tip"), callback_data="sleep:tip")
+    kb.button(text=t(lang, "sleep.log_sleep"), callback_data=pack_callback("sleep", "log"))
+    kb.button(text=t(lang, "sleep.daily_tip"), callback_data=pack_callback("sleep", "tip"))
     kb.adjust(1)
-    return kb
+    return kb.as_markup()
 
 
-def _build_sleep_time_kb(lang: str) -> InlineKeyboardBuilder:
+@cached_markup
+def _build_sleep_time_kb(lang: str) -> InlineKeyboardMarkup:
     """Build sleep time selection keyboard."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "sleep.time_21"), callback_data="sleep:time:21:00")
-    kb.button(text=t(lang, "sleep.time_22"), callback_data="sleep:time:22:00")
-    kb.button(text=t(lang, "sleep.time_23"), callback_data="sleep:time:23:00")
-    kb.button(text=t(lang, "sleep.later"), callback_data="sleep:time:later")
-    kb.button(text=t(lang, "sleep.enter_manually"), callback_data="sleep:time:manual")
+    kb.button(text=t(lang, "sleep.time_21"), callback_data=pack_callback("sleep", "time", "21", "00"))
+    kb.button(text=t(lang, "sleep.time_22"), callback_data=pack_callback("sleep", "time", "22", "00"))
+    kb.button(text=t(lang, "sleep.time_23"), callback_data=pack_callback("sleep", "time", "23", "00"))
+    kb.button(text=t(lang, "sleep.later"), callback_data=pack_callback("sleep", "time", "later"))
+    kb.button(text=t(lang, "sleep.enter_manually"), callback_data=pack_callback("sleep", "time", "manual"))
     kb.adjust(2, 2, 1)
-    return kb
+    return kb.as_markup()
 
 
-def _build_wake_time_kb(lang: str) -> InlineKeyboardBuilder:
+@cached_markup
+def _build_wake_time_kb(lang: str) -> InlineKeyboardMarkup:
     """Build wake time selection keyboard."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "sleep.time_06"), callback_data="sleep:wake:06:00")
-    kb.button(text=t(lang, "sleep.time_07"), callback_data="sleep:wake:07:00")
-    kb.button(text=t(lang, "sleep.time_08"), callback_data="sleep:wake:08:00")
-    kb.button(text=t(lang, "sleep.later"), callback_data="sleep:wake:later")
-    kb.button(text=t(lang, "sleep.enter_manually"), callback_data="sleep:wake:manual")
+    kb.button(text=t(lang, "sleep.time_06"), callback_data=pack_callback("sleep", "wake", "06", "00"))
+    kb.button(text=t(lang, "sleep.time_07"), callback_data=pack_callback("sleep", "wake", "07", "00"))
+    kb.button(text=t(lang, "sleep.time_08"), callback_data=pack_callback("sleep", "wake", "08", "00"))
+    kb.button(text=t(lang, "sleep.later"), callback_data=pack_callback("sleep", "wake", "later"))
+    kb.button(text=t(lang, "sleep.enter_manually"), callback_data=pack_callback("sleep", "wake", "manual"))
     kb.adjust(2, 2, 1)
-    return kb
+    return kb.as_markup()
 
 
-def _build_electronics_kb(lang: str) -> InlineKeyboardBuilder:
+@cached_markup
+def _build_electronics_kb(lang: str) -> InlineKeyboardMarkup:
     """Build electronics usage keyboard."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "sleep.yes"), callback_data="sleep:electronics:yes")
-    kb.button(text=t(lang, "sleep.no"), callback_data="sleep:electronics:no")
+    kb.button(text=t(lang, "sleep.yes"), callback_data=pack_callback("sleep", "electronics", "yes"))
+    kb.button(text=t(lang, "sleep.no"), callback_data=pack_callback("sleep", "electronics", "no"))
     kb.adjust(2)
-    return kb
+    return kb.as_markup()
 
 
-def _build_quality_kb(lang: str) -> InlineKeyboardBuilder:
+@cached_markup
+def _build_quality_kb(lang: str) -> InlineKeyboardMarkup:
     """Build sleep quality rating keyboard."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "sleep.quality_1"), callback_data="sleep:quality:1")
-    kb.button(text=t(lang, "sleep.quality_2"), callback_data="sleep:quality:2")
-    kb.button(text=t(lang, "sleep.quality_3"), callback_data="sleep:quality:3")
-    kb.button(text=t(lang, "sleep.quality_4"), callback_data="sleep:quality:4")
-    kb.button(text=t(lang, "sleep.quality_5"), callback_data="sleep:quality:5")
+    kb.button(text=t(lang, "sleep.quality_1"), callback_data=pack_callback("sleep", "quality", "1"))
+    kb.button(text=t(lang, "sleep.quality_2"), callback_data=pack_callback("sleep", "quality", "2"))
+    kb.button(text=t(lang, "sleep.quality_3"), callback_data=pack_callback("sleep", "quality", "3"))
+    kb.button(text=t(lang, "sleep.quality_4"), callback_data=pack_callback("sleep", "quality", "4"))
+    kb.button(text=t(lang, "sleep.quality_5"), callback_data=pack_callback("sleep", "quality", "5"))
     kb.adjust(5)
-    return kb
+    return kb.as_markup()
 
 
-def _build_tip_kb(lang: str) -> InlineKeyboardBuilder:
+@cached_markup
+def _build_tip_kb(lang: str) -> InlineKeyboardMarkup:
     """Build tip keyboard with another tip button and back to sleep menu."""
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "sleep.want_another_tip"), callback_data="sleep:tip")
-    kb.button(text=t(lang, "menu.back"), callback_data="sleep:back_to_menu")
+    kb.button(text=t(lang, "sleep.want_another_tip"), callback_data=pack_callback("sleep", "tip"))
+    kb.button(text=t(lang, "menu.back"), callback_data=pack_callback("sleep", "back_to_menu"))
     kb.adjust(1)  # One button per row
-    return kb
+    return kb.as_markup()
 
 
 def _calculate_duration(sleep_time: str, wake_time: str) -> float:
@@ -132,7 +141,7 @@ async def show_sleep_summary(message: Message, lang: str, reply_markup=None):
     
     if reply_markup:
         await message.answer("🔽", reply_markup=reply_markup)
-    await message.answer(text, reply_markup=_build_sleep_menu_kb(lang).as_markup())
+    await message.answer(text, reply_markup=_build_sleep_menu_kb(lang))
 
 
 @router.callback_query(F.data == "sleep:log")
@@ -140,7 +149,7 @@ async def start_sleep_logging(call: CallbackQuery, state: FSMContext):
     """Start sleep logging process."""
     lang = _get_lang(call.from_user.id)
     await state.set_state(SleepStates.waiting_sleep_time)
-    await call.message.edit_text(t(lang, "sleep.when_did_you_sleep"), reply_markup=_build_sleep_time_kb(lang).as_markup())
+    await call.message.edit_text(t(lang, "sleep.when_did_you_sleep"), reply_markup=_build_sleep_time_kb(lang))
     await call.answer()
 
 
@@ -148,7 +157,8 @@ async def start_sleep_logging(call: CallbackQuery, state: FSMContext):
 async def handle_sleep_time(call: CallbackQuery, state: FSMContext):
     """Handle sleep time selection."""
     lang = _get_lang(call.from_user.id)
-    time_choice = call.data.split(":")[2]
+    # Preset times arrive as hour and minute fields ("sleep:time:21:00")
+    time_choice = ":".join(unpack_callback(call.data).fields)
     
     if time_choice == "manual":
         await call.message.edit_text(t(lang, "sleep_ask_sleep"))
@@ -161,7 +171,7 @@ async def handle_sleep_time(call: CallbackQuery, state: FSMContext):
     else:
         await state.update_data(sleep_time=time_choice)
         await state.set_state(SleepStates.waiting_wake_time)
-        await call.message.edit_text(t(lang, "sleep.when_did_you_wake"), reply_markup=_build_wake_time_kb(lang).as_markup())
+        await call.message.edit_text(t(lang, "sleep.when_did_you_wake"), reply_markup=_build_wake_time_kb(lang))
         await call.answer()
 
 
@@ -177,7 +187,7 @@ async def handle_manual_sleep_time(message: Message, state: FSMContext):
         if 0 <= h <= 23 and 0 <= m <= 59:
             await state.update_data(sleep_time=text)
             await state.set_state(SleepStates.waiting_wake_time)
-            await message.answer(t(lang, "sleep.when_did_you_wake"), reply_markup=_build_wake_time_kb(lang).as_markup())
+            await message.answer(t(lang, "sleep.when_did_you_wake"), reply_markup=_build_wake_time_kb(lang))
         else:
             await message.answer(t(lang, "onb_invalid_time"))
     except:
@@ -188,7 +198,7 @@ async def handle_manual_sleep_time(message: Message, state: FSMContext):
 async def handle_wake_time(call: CallbackQuery, state: FSMContext):
     """Handle wake time selection."""
     lang = _get_lang(call.from_user.id)
-    time_choice = call.data.split(":")[2]
+    time_choice = ":".join(unpack_callback(call.data).fields)
     
     if time_choice == "manual":
         await call.message.edit_text(t(lang, "sleep_ask_wake"))
@@ -201,7 +211,7 @@ async def handle_wake_time(call: CallbackQuery, state: FSMContext):
     else:
         await state.update_data(wake_time=time_choice)
         await state.set_state(SleepStates.waiting_electronics)
-        await call.message.edit_text(t(lang, "sleep.electronics_question"), reply_markup=_build_electronics_kb(lang).as_markup())
+        await call.message.edit_text(t(lang, "sleep.electronics_question"), reply_markup=_build_electronics_kb(lang))
         await call.answer()
 
 
@@ -217,7 +227,7 @@ async def handle_manual_wake_time(message: Message, state: FSMContext):
         if 0 <= h <= 23 and 0 <= m <= 59:
             await state.update_data(wake_time=text)
             await state.set_state(SleepStates.waiting_electronics)
-            await message.answer(t(lang, "sleep.electronics_question"), reply_markup=_build_electronics_kb(lang).as_markup())
+            await message.answer(t(lang, "sleep.electronics_question"), reply_markup=_build_electronics_kb(lang))
         else:
             await message.answer(t(lang, "onb_invalid_time"))
     except:
@@ -228,11 +238,11 @@ async def handle_manual_wake_time(message: Message, state: FSMContext):
 async def handle_electronics(call: CallbackQuery, state: FSMContext):
     """Handle electronics usage question."""
     lang = _get_lang(call.from_user.id)
-    choice = call.data.split(":")[2]
+    choice = unpack_callback(call.data).field(0)
     
     await state.update_data(electronics_used=choice)
     await state.set_state(SleepStates.waiting_quality)
-    await call.message.edit_text(t(lang, "sleep.quality_question"), reply_markup=_build_quality_kb(lang).as_markup())
+    await call.message.edit_text(t(lang, "sleep.quality_question"), reply_markup=_build_quality_kb(lang))
     await call.answer()
 
 
@@ -240,7 +250,7 @@ async def handle_electronics(call: CallbackQuery, state: FSMContext):
 async def handle_quality_rating(call: CallbackQuery, state: FSMContext):
     """Handle sleep quality rating and save the log."""
     lang = _get_lang(call.from_user.id)
-    rating = int(call.data.split(":")[2])
+    rating = unpack_callback(call.data).int_field(0)
     
     data = await state.get_data()
     sleep_time = data.get("sleep_time")
@@ -303,19 +313,19 @@ async def handle_back_to_sleep_menu(call: CallbackQuery):
     text += f"{t(lang, 'sleep.section_desc')}\n\n"
     text += f"{t(lang, 'sleep.choose_action')}"
     
-    await call.message.edit_text(text, reply_markup=_build_sleep_menu_kb(lang).as_markup())
+    await call.message.edit_text(text, reply_markup=_build_sleep_menu_kb(lang))
     await call.answer()
 
 
 @router.callback_query(F.data == "sleep:tip")
 async def show_sleep_tip(call: CallbackQuery):
-    """Show a random sleep tip."""
+    """Show the next sleep tip from the user's rotation."""
     lang = _get_lang(call.from_user.id)
-    tip = get_random_tip(lang)
+    tip = await get_next_tip(call.from_user.id, lang)
     
     text = f"{t(lang, 'sleep.daily_tip_title')}\n\n{tip}"
     
-    await call.message.edit_text(text, reply_markup=_build_tip_kb(lang).as_markup())
+    await call.message.edit_text(text, reply_markup=_build_tip_kb(lang))
     await call.answer()
 
 
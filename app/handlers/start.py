@@ -2,28 +2,13 @@ from aiogram import Router, types, F
 from aiogram.filters import Command
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-router = Router()
+router = Router(name="start")
 
 # DB
 from app.database import SessionLocal
 from app.models.user import User
 from app.services.i18n import t
-
-# Храним языки в виде словаря
-messages = {
-    "ru": {
-        "start": "Привет! 👋 Я твой Fitonomics бот. Выбери язык:",
-        "lang_chosen": "Язык установлен на Русский 🇷🇺"
-    },
-    "uz": {
-        "start": "Salom! 👋 Men sizning Fitonomics botingizman. Tilni tanlang:",
-        "lang_chosen": "Til O‘zbekcha 🇺🇿 ga o‘rnatildi"
-    },
-    "en": {
-        "start": "Hi! 👋 I'm your Fitonomics bot. Choose your language:",
-        "lang_chosen": "Language set to English 🇺🇸"
-    }
-}
+from app.services.callback_protocol import pack_callback
 
 user_lang = {}  # временно храним язык в памяти
 
@@ -35,8 +20,8 @@ async def cmd_start(message: types.Message):
     if user:
         lang = user.language or "ru"
         kb = InlineKeyboardBuilder()
-        kb.button(text=t(lang, "btn_yes"), callback_data="start:reset:yes")
-        kb.button(text=t(lang, "btn_no"), callback_data="start:reset:no")
+        kb.button(text=t(lang, "btn_yes"), callback_data=pack_callback("start", "reset", "yes"))
+        kb.button(text=t(lang, "btn_no"), callback_data=pack_callback("start", "reset", "no"))
         kb.adjust(2)
         await message.answer(f"{t(lang, 'start.reset_title')}\n{t(lang, 'start.reset_desc')}", reply_markup=kb.as_markup())
         return
@@ -45,7 +30,7 @@ async def cmd_start(message: types.Message):
         [types.KeyboardButton(text="🇷🇺 Русский"), types.KeyboardButton(text="🇺🇿 O‘zbekcha"), types.KeyboardButton(text="🇺🇸 English")]
     ]
     keyboard = types.ReplyKeyboardMarkup(keyboard=kb, resize_keyboard=True)
-    await message.answer(messages["en"]["start"], reply_markup=keyboard)
+    await message.answer(t("en", "start.choose_language"), reply_markup=keyboard)
 
 
 @router.callback_query(F.data == "start:reset:no")
@@ -73,11 +58,11 @@ async def start_reset_yes(call: types.CallbackQuery):
         [types.KeyboardButton(text="🇷🇺 Русский"), types.KeyboardButton(text="🇺🇿 O‘zbekcha"), types.KeyboardButton(text="🇺🇸 English")]
     ]
     keyboard = types.ReplyKeyboardMarkup(keyboard=kb, resize_keyboard=True)
-    await call.message.edit_text(messages[lang]["start"])
-    await call.message.answer(messages[lang]["start"], reply_markup=keyboard)
+    await call.message.edit_text(t(lang, "start.choose_language"))
+    await call.message.answer(t(lang, "start.choose_language"), reply_markup=keyboard)
     await call.answer()
 
-@router.message(lambda m: m.text in ["🇷🇺 Русский", "🇺🇿 O‘zbekcha", "🇺🇸 English"])
+@router.message(F.text.in_({"🇷🇺 Русский", "🇺🇿 O‘zbekcha", "🇺🇸 English"}))
 async def set_language(message: types.Message):
     if message.text == "🇷🇺 Русский":
         user_lang[message.from_user.id] = "ru"
@@ -97,7 +82,7 @@ async def set_language(message: types.Message):
             user.language = lang
         session.commit()
 
-    await message.answer(messages[lang]["lang_chosen"], reply_markup=types.ReplyKeyboardRemove())
+    await message.answer(t(lang, "start.lang_chosen"), reply_markup=types.ReplyKeyboardRemove())
 
     # Показать приветствие и подписку на канал в выбранном языке
     from app.services.channel_gate import send_channel_gate
@@ -1,20 +1,36 @@
 from __future__ import annotations
 
+import logging
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from aiogram import types, F
+from aiogram import types, F, Router
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import CallbackQuery, InputFile
+from aiogram.types import CallbackQuery
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.models.user import User
 from app.models.workout_log import WorkoutLog
-from app.services.content import load_workouts, get_workout_media_path
+from app.services.content import get_workouts_catalog
 from app.services.i18n import t, T
-from .start import router
+from app.services.callback_protocol import pack_callback
+from app.services.keyboard_cache import cached_markup
+from app.services.media_cache import cached_file_id
+from app.services.media_prewarm import schedule_upload
+from app.services.message_edit import edit_screen, replace_with_text, show_animation
+
+router = Router(name="workouts")
+
+
+logger = logging.getLogger(__name__)
+
+# Telegram text message length limit
+MESSAGE_LIMIT = 4096
 
 
 class WorkoutStates(StatesGroup):
@@ -35,19 +51,52 @@ def _exercise_caption(lang: str, group: str, index: int, total: int, ex: dict) -
     return f"{title}\n{desc}\n{t(lang, 'w_start', group=group, i=index+1, n=total)}"
 
 
+@dataclass(frozen=True)
+class _Step:
+    """One workout step with its media resolved and captions rendered per language."""
+    media_path: Optional[Path]
+    captions: Dict[str, str]
 
-def _nav_kb(lang: str, at_last: bool) -> types.InlineKeyboardMarkup:
-    builder = types.InlineKeyboardMarkup(inline_keyboard=[
-        [types.InlineKeyboardButton(text=t(lang, "w_next"), callback_data="w:next")],
-        [types.InlineKeyboardButton(text=t(lang, "w_done"), callback_data="w:done")],
-    ])
+    def caption(self, lang: str) -> str:
+        return self.captions.get(lang) or self.captions["ru"]
+
+
+def _build_steps() -> Dict[str, Tuple[_Step, ...]]:
+    """Pre-render every exercise caption for every language from the workout catalog."""
+    steps: Dict[str, Tuple[_Step, ...]] = {}
+    for group, exercises in get_workouts_catalog().items():
+        total = len(exercises)
+        steps[group] = tuple(
+            _Step(
+                media_path=ex.get("media_path"),
+                captions={lang: _exercise_caption(lang, group, index, total, ex) for lang in T},
+            )
+            for index, ex in enumerate(exercises)
+        )
+    return steps
+
+
+# Built once at import; stepping through a workout does no file I/O
+_STEPS = _build_steps()
+
+
+
+@cached_markup
+def _nav_kb(lang: str, at_last: bool, with_overview: bool = False) -> types.InlineKeyboardMarkup:
+    rows = [
+        [types.InlineKeyboardButton(text=t(lang, "w_next"), callback_data=pack_callback("w", "next"))],
+        [types.InlineKeyboardButton(text=t(lang, "w_done"), callback_data=pack_callback("w", "done"))],
+    ]
+    if with_overview:
+        rows.append([types.InlineKeyboardButton(text=t(lang, "w_overview"), callback_data=pack_callback("w", "overview"))])
+    builder = types.InlineKeyboardMarkup(inline_keyboard=rows)
     return builder
 
 
 async def open_workouts_menu(message: types.Message, lang: str, reply_markup=None) -> None:
     kb = types.InlineKeyboardMarkup(inline_keyboard=[
-        [types.InlineKeyboardButton(text=t(lang, "workouts.mode_home"), callback_data="w:mode:home")],
-        [types.InlineKeyboardButton(text=t(lang, "workouts.mode_gym"), callback_data="w:mode:gym")],
+        [types.InlineKeyboardButton(text=t(lang, "workouts.mode_home"), callback_data=pack_callback("w", "mode", "home"))],
+        [types.InlineKeyboardButton(text=t(lang, "workouts.mode_gym"), callback_data=pack_callback("w", "mode", "gym"))],
     ])
     if reply_markup:
         await message.answer("🔽", reply_markup=reply_markup)
@@ -58,8 +107,8 @@ async def open_workouts_menu(message: types.Message, lang: str, reply_markup=Non
 async def choose_mode(call: CallbackQuery):
     lang = get_lang(call.from_user.id)
     kb = types.InlineKeyboardMarkup(inline_keyboard=[
-        [types.InlineKeyboardButton(text=t(lang, "workouts.mode_home"), callback_data="w:mode:home")],
-        [types.InlineKeyboardButton(text=t(lang, "workouts.mode_gym"), callback_data="w:mode:gym")],
+        [types.InlineKeyboardButton(text=t(lang, "workouts.mode_home"), callback_data=pack_callback("w", "mode", "home"))],
+        [types.InlineKeyboardButton(text=t(lang, "workouts.mode_gym"), callback_data=pack_callback("w", "mode", "gym"))],
     ])
     await call.message.edit_text(t(lang, "workouts.choose_mode_title"), reply_markup=kb)
     await call.answer()
@@ -96,12 +145,12 @@ async def choose_body_after_mode(call: CallbackQuery):
         return t(lang, key)
 
     kb = types.InlineKeyboardMarkup(inline_keyboard=[
-        [types.InlineKeyboardButton(text=t(lang, "group_full"), callback_data="w:start:full")],
-        [types.InlineKeyboardButton(text=t(lang, "group_chest"), callback_data="w:start:chest")],
-        [types.InlineKeyboardButton(text=t(lang, "group_arms"), callback_data="w:start:arms")],
-        [types.InlineKeyboardButton(text=t(lang, "group_legs"), callback_data="w:start:legs")],
-        [types.InlineKeyboardButton(text=t(lang, "group_shoulders"), callback_data="w:start:shoulders")],
-        [types.InlineKeyboardButton(text=t(lang, "group_back"), callback_data="w:start:back")],
+        [types.InlineKeyboardButton(text=t(lang, "group_full"), callback_data=pack_callback("w", "start", "full"))],
+        [types.InlineKeyboardButton(text=t(lang, "group_chest"), callback_data=pack_callback("w", "start", "chest"))],
+        [types.InlineKeyboardButton(text=t(lang, "group_arms"), callback_data=pack_callback("w", "start", "arms"))],
+        [types.InlineKeyboardButton(text=t(lang, "group_legs"), callback_data=pack_callback("w", "start", "legs"))],
+        [types.InlineKeyboardButton(text=t(lang, "group_shoulders"), callback_data=pack_callback("w", "start", "shoulders"))],
+        [types.InlineKeyboardButton(text=t(lang, "group_back"), callback_data=pack_callback("w", "start", "back"))],
     ])
     await call.message.edit_text(
         t(lang, "workouts.choose_body_with_last", last=_loc(last)),
@@ -117,13 +166,13 @@ async def choose_body_after_mode(call: CallbackQuery):
 async def start_workout(call: CallbackQuery, state: FSMContext):
     group = call.data.split(":", 2)[2]
     lang = get_lang(call.from_user.id)
-    exercises = load_workouts(group)
-    if not exercises:
+    steps = _STEPS.get(group)
+    if not steps:
         await call.message.edit_text(t(lang, "gif_missing"))
         await call.answer()
         return
     await state.set_state(WorkoutStates.doing)
-    await state.update_data(group=group, index=0, total=len(exercises))
+    await state.update_data(group=group, index=0, total=len(steps))
     await _send_exercise(call, state, lang)
     await call.answer()
 
@@ -132,19 +181,63 @@ async def _send_exercise(call: CallbackQuery, state: FSMContext, lang: str):
     data = await state.get_data()
     group: str = data["group"]
     index: int = data["index"]
-    exercises = load_workouts(group)
-    total = len(exercises)
-    ex = exercises[index]
-    media_name = ex.get("media")
-    caption = _exercise_caption(lang, group, index, total, ex)
-    file_path = get_workout_media_path(media_name)
+    steps = _STEPS.get(group, ())
+    total = len(steps)
+    step = steps[index]
+    caption = step.caption(lang)
+    kb = _nav_kb(lang, at_last=(index == total-1), with_overview=(index == 0 and total > 1))
+    file_path = step.media_path
+    # Media and keyboard go in a single edit
+    sent = None
     if file_path:
-        await call.message.edit_media(
-            types.InputMediaAnimation(media=InputFile(file_path), caption=caption)
-        )
-    else:
-        await call.message.edit_text(f"{t(lang, 'gif_missing')}\n\n{caption}")
-    await call.message.edit_reply_markup(reply_markup=_nav_kb(lang, at_last=(index == total-1)))
+        sent = await show_animation(call.bot, call.message, str(file_path), caption, kb)
+    if sent is None:
+        # No cached animation yet: show the step as text
+        text = caption if file_path else f"{t(lang, 'gif_missing')}\n\n{caption}"
+        await replace_with_text(call.message, text, kb)
+
+
+def _text_chunks(parts: List[str], limit: int = MESSAGE_LIMIT) -> List[str]:
+    """Join parts with blank lines into messages of at most `limit` characters."""
+    chunks: List[str] = []
+    for part in parts:
+        part = part[:limit]
+        if chunks and len(chunks[-1]) + 2 + len(part) <= limit:
+            chunks[-1] += "\n\n" + part
+        else:
+            chunks.append(part)
+    return chunks
+
+
+@router.callback_query(WorkoutStates.doing, F.data == "w:overview")
+async def workout_overview(call: CallbackQuery, state: FSMContext):
+    """Send every exercise of the workout: cached animations by file_id, the rest as text."""
+    lang = get_lang(call.from_user.id)
+    data = await state.get_data()
+    steps = _STEPS.get(data.get("group", ""), ())
+    cached = []
+    for step in steps:
+        file_id = cached_file_id(str(step.media_path)) if step.media_path else None
+        if file_id is None and step.media_path:
+            schedule_upload(call.bot, str(step.media_path))
+        cached.append(file_id)
+    if not any(cached):
+        await call.answer(t(lang, "w_overview_pending"), show_alert=True)
+        return
+    # Albums cannot hold animations, so each cached GIF is its own (upload-free) message
+    texts = []
+    for step, file_id in zip(steps, cached):
+        if file_id is None:
+            texts.append(step.caption(lang))
+            continue
+        try:
+            await call.message.answer_animation(animation=file_id, caption=step.caption(lang))
+        except TelegramBadRequest as exc:
+            logger.warning("Workout overview animation failed: %s", exc)
+            texts.append(step.caption(lang))
+    for text in _text_chunks(texts):
+        await call.message.answer(text)
+    await call.answer()
 
 
 @router.callback_query(WorkoutStates.doing, F.data == "w:next")
@@ -170,5 +263,5 @@ async def done_workout(call: CallbackQuery, state: FSMContext):
         session.add(WorkoutLog(user_id=call.from_user.id, group=group))
         session.commit()
     await state.clear()
-    await call.message.edit_text(t(lang, "w_finished", group=group))
+    await edit_screen(call.message, t(lang, "w_finished", group=group))
     await call.answer()
@@ -0,0 +1 @@
+from .ordering import ChatOrderingIsolation  # noqa: F401
@@ -0,0 +1,88 @@
+"""
+Per-chat ordered, globally bounded update processing.
+
+Polling and webhook delivery both run every update as its own task, and the
+handlers await Telegram calls between their (blocking) DB steps, so two
+quick taps from one chat could interleave: `meals:done` logged twice, or a
+workout step read before the previous one was saved. Every chat gets a lane
+(an asyncio.Lock, FIFO) so one chat's updates run one after another in
+arrival order, while different chats run concurrently up to
+`max_concurrent` updates at a time.
+
+This is the Dispatcher's `events_isolation`: aiogram's FSMContextMiddleware
+takes the lock before it reads the FSM state, so a queued update sees the
+state its predecessor left, not the one from when it arrived.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Dict, Tuple
+
+from aiogram.fsm.storage.base import BaseEventIsolation, StorageKey
+
+
+class _Lane:
+    __slots__ = ("lock", "pending")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.pending = 0
+
+
+class ChatOrderingIsolation(BaseEventIsolation):
+    """Serialize updates per chat and cap concurrent updates overall."""
+
+    def __init__(self, max_concurrent: int) -> None:
+        self.max_concurrent = max_concurrent
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._lanes: Dict[Tuple[int, int], _Lane] = {}
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.processed = 0
+
+    @asynccontextmanager
+    async def lock(self, key: StorageKey) -> AsyncGenerator[None, None]:
+        # The key is per user in chat (FSM strategy); order is kept per chat
+        lane_id = (key.bot_id, key.chat_id)
+        lane = self._lanes.get(lane_id)
+        if lane is None:
+            lane = self._lanes[lane_id] = _Lane()
+        lane.pending += 1
+
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        started = False
+        try:
+            # Chat lane first, then a global slot: a chat waiting for its
+            # previous update does not hold a slot other chats could use
+            async with lane.lock:
+                async with self._slots:
+                    started = True
+                    self.queued -= 1
+                    self.in_flight += 1
+                    try:
+                        yield
+                    finally:
+                        self.in_flight -= 1
+                        self.processed += 1
+        finally:
+            if not started:
+                self.queued -= 1
+            lane.pending -= 1
+            if not lane.pending:
+                del self._lanes[lane_id]
+
+    async def close(self) -> None:
+        pass
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "processed": self.processed,
+            "active_chats": len(self._lanes),
+            "max_concurrent": self.max_concurrent,
+        }
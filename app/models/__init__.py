@@ -5,6 +5,10 @@ from .workout_log import WorkoutLog  # noqa: F401
 from .meal_log import MealLog, UserMealSettings  # noqa: F401
 from .admin import Admin  # noqa: F401
 from .notification_log import NotificationLog  # noqa: F401
+from .meal_recommendation import MealRecommendation  # noqa: F401
+from .media_file import MediaFile  # noqa: F401
+from .fsm_state import FsmState  # noqa: F401
+from .sleep_tip_cursor import SleepTipCursor  # noqa: F401
 
 
 
@@ -0,0 +1,16 @@
+"""
+Persisted FSM state (aiogram storage backend).
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime
+from app.database import Base
+
+
+class FsmState(Base):
+    """FSM state and data of one storage key (bot, chat, user, thread, ...)."""
+    __tablename__ = "fsm_states"
+
+    key = Column(String(255), primary_key=True)  # StorageKey joined with ':'
+    state = Column(String(255), nullable=True)
+    data = Column(Text, nullable=True)  # JSON; NULL when empty
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
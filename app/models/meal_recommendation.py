@@ -0,0 +1,17 @@
+"""
+Precomputed meal pack ranking per user.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from app.database import Base
+
+
+class MealRecommendation(Base):
+    """Packs of the user's budget ranked best-first, refreshed nightly and on new logs."""
+    __tablename__ = "meal_recommendations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False, unique=True, index=True)
+    budget_level = Column(String(10), nullable=False)  # budget the ranking was computed for
+    ranked_pack_ids = Column(Text, nullable=False, default="")  # comma-separated pack ids
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
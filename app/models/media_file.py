@@ -0,0 +1,18 @@
+"""
+Telegram file_id cache for uploaded media.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from app.database import Base
+
+
+class MediaFile(Base):
+    """file_id Telegram returned for a local file with a given content hash."""
+    __tablename__ = "media_files"
+    __table_args__ = (UniqueConstraint("path", "sha256", name="uq_media_files_path_sha256"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    path = Column(String(255), nullable=False, index=True)  # relative to project root, e.g. media/meals/...
+    sha256 = Column(String(64), nullable=False)
+    file_id = Column(String(255), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
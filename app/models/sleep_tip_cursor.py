@@ -0,0 +1,13 @@
+"""
+Per-user position in the sleep tip rotation.
+"""
+from sqlalchemy import Column, Integer
+from app.database import Base
+
+
+class SleepTipCursor(Base):
+    """How many sleep tips a user has been served (drives the no-repeat rotation)."""
+    __tablename__ = "sleep_tip_cursors"
+
+    user_id = Column(Integer, primary_key=True)  # Telegram id
+    cursor = Column(Integer, nullable=False, default=0)
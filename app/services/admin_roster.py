@@ -0,0 +1,66 @@
+"""
+In-memory admin roster.
+
+Authorization runs on every admin update (and, through the admin router
+filter, on every update that reaches it), so the `admins` table is read once
+into memory and checks are set/dict lookups. The roster is loaded at startup
+and dropped whenever admins are added or removed; the next check reloads it.
+It also expires after ROSTER_TTL_SECONDS, so worker processes that did not
+make a change pick it up too.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Dict, FrozenSet, NamedTuple, Optional
+
+from app.database import SessionLocal
+from app.models.admin import Admin
+
+logger = logging.getLogger(__name__)
+
+ROSTER_TTL_SECONDS = 60
+
+
+class AdminRoster(NamedTuple):
+    active: FrozenSet[int]   # tg_ids of active admins
+    roles: Dict[int, str]    # tg_id -> role, active or not
+    loaded_at: float
+
+
+_roster: Optional[AdminRoster] = None
+
+
+def load_admin_roster() -> AdminRoster:
+    """Read the admins table into memory (called at startup and after changes)."""
+    global _roster
+    with SessionLocal() as session:
+        rows = session.query(Admin.tg_id, Admin.role, Admin.is_active).all()
+    _roster = AdminRoster(
+        active=frozenset(tg_id for tg_id, _, is_active in rows if is_active),
+        roles={tg_id: role or "admin" for tg_id, role, _ in rows},
+        loaded_at=time.monotonic(),
+    )
+    logger.debug("Admin roster loaded: %d active admins", len(_roster.active))
+    return _roster
+
+
+def get_admin_roster() -> AdminRoster:
+    roster = _roster
+    if roster is None or time.monotonic() - roster.loaded_at > ROSTER_TTL_SECONDS:
+        return load_admin_roster()
+    return roster
+
+
+def invalidate_admin_roster() -> None:
+    """Drop the cached roster; the next check reloads it from the database."""
+    global _roster
+    _roster = None
+
+
+def is_active_admin(tg_id: int) -> bool:
+    return tg_id in get_admin_roster().active
+
+
+def admin_role(tg_id: int) -> Optional[str]:
+    return get_admin_roster().roles.get(tg_id)
@@ -0,0 +1,155 @@
+"""
+Bot-wide statistics snapshot.
+
+The admin screens and the web /stats endpoint show user counts and
+distributions. They are computed in SQL (COUNT with GROUP BY, no rows loaded
+into Python) into one snapshot that a background task refreshes every
+STATS_REFRESH_SECONDS; screens read the snapshot and never query the users
+table themselves. A process without the refresh task (the web front and
+the non-leader workers in sharded mode) gets the last snapshot and a refresh in a worker thread once
+it is older than STATS_MAX_AGE_SECONDS. The queries never run on the event
+loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlalchemy import case, func
+
+from app.database import SessionLocal
+from app.models.meal_log import MealLog
+from app.models.user import User
+from app.models.workout_log import WorkoutLog
+
+logger = logging.getLogger(__name__)
+
+STATS_REFRESH_SECONDS = 300
+STATS_MAX_AGE_SECONDS = 2 * STATS_REFRESH_SECONDS
+
+
+class BotStats(NamedTuple):
+    total_users: int
+    active_users: int        # updated in the last 7 days
+    users_this_week: int
+    users_this_month: int
+    growth: Dict[str, int]   # signup bucket (today/week/month/older) -> users
+    language_distribution: Dict[str, int]
+    budget_distribution: Dict[str, int]
+    reminder_time_distribution: Dict[str, int]
+    workout_logs: int
+    meal_logs: int
+    computed_at: datetime
+    loaded_at: float
+
+
+_stats: Optional[BotStats] = None
+_refresher: Optional[asyncio.Task] = None
+# Running recompute; concurrent readers share it
+_computing: Optional[asyncio.Future] = None
+
+
+def _grouped(session, column, default: str) -> Dict[str, int]:
+    key = func.coalesce(column, default)
+    return {value: count for value, count in session.query(key, func.count(User.id)).group_by(key).all()}
+
+
+def compute_bot_stats() -> BotStats:
+    """Run the aggregate queries and replace the snapshot."""
+    global _stats
+    now = datetime.now()
+    today = now.date()
+    week_ago = today - timedelta(days=7)
+    month_ago = today - timedelta(days=30)
+    bucket = case(
+        (User.created_at >= today, "today"),
+        (User.created_at >= week_ago, "week"),
+        (User.created_at >= month_ago, "month"),
+        else_="older",
+    )
+    with SessionLocal() as session:
+        growth = {name: count for name, count in session.query(bucket, func.count(User.id)).group_by(bucket).all()}
+        active_users = session.query(func.count(User.id)).filter(User.updated_at >= now - timedelta(days=7)).scalar()
+        languages = _grouped(session, User.language, "ru")
+        budgets = _grouped(session, User.budget, "none")
+        reminder_times = _grouped(session, User.reminder_time, "none")
+        workout_logs = session.query(func.count(WorkoutLog.id)).scalar()
+        meal_logs = session.query(func.count(MealLog.id)).scalar()
+
+    users_this_week = growth.get("today", 0) + growth.get("week", 0)
+    _stats = BotStats(
+        total_users=sum(growth.values()),
+        active_users=active_users or 0,
+        users_this_week=users_this_week,
+        users_this_month=users_this_week + growth.get("month", 0),
+        growth=growth,
+        language_distribution=languages,
+        budget_distribution=budgets,
+        reminder_time_distribution=reminder_times,
+        workout_logs=workout_logs or 0,
+        meal_logs=meal_logs or 0,
+        computed_at=now,
+        loaded_at=time.monotonic(),
+    )
+    return _stats
+
+
+def _recompute() -> "asyncio.Future[BotStats]":
+    """Start compute_bot_stats in a thread, or return the one already running."""
+    global _computing
+    if _computing is None or _computing.done():
+        _computing = asyncio.ensure_future(asyncio.to_thread(compute_bot_stats))
+        _computing.add_done_callback(_log_failure)
+    return _computing
+
+
+def _log_failure(future: "asyncio.Future[BotStats]") -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Failed to refresh bot statistics", exc_info=future.exception())
+
+
+async def get_bot_stats_snapshot() -> BotStats:
+    """The current snapshot without blocking the event loop.
+
+    A stale snapshot is returned as it is while a refresh runs in the
+    background; only the very first read waits for the queries.
+    """
+    stats = _stats
+    if stats is None:
+        return await asyncio.shield(_recompute())
+    if time.monotonic() - stats.loaded_at > STATS_MAX_AGE_SECONDS:
+        _recompute()
+    return stats
+
+
+async def _refresh_loop() -> None:
+    while True:
+        # Waits without raising: a failed refresh is logged by _log_failure
+        await asyncio.wait([_recompute()])
+        await asyncio.sleep(STATS_REFRESH_SECONDS)
+
+
+async def start_stats_refresh() -> None:
+    """Dispatcher startup hook: compute the snapshot now and keep it fresh."""
+    global _refresher
+    if _refresher is None:
+        _refresher = asyncio.create_task(_refresh_loop())
+
+
+async def stop_stats_refresh() -> None:
+    global _refresher
+    if _refresher is not None:
+        _refresher.cancel()
+        _refresher = None
+
+
+async def bot_stats_summary() -> Dict[str, Any]:
+    """Snapshot as a JSON-friendly dict (web /stats)."""
+    stats = await get_bot_stats_snapshot()
+    summary = stats._asdict()
+    summary.pop("loaded_at")
+    summary["computed_at"] = stats.computed_at.isoformat(timespec="seconds")
+    return summary
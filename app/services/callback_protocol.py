@@ -0,0 +1,145 @@
+"""
+Callback data protocol and namespace dispatch.
+
+The canonical form of callback_data is "<namespace>:<action>[:<field>...]",
+which is what every handler filters on. `pack_callback` builds the compact wire form
+instead: the namespace is a single uppercase byte glued to the action, e.g.
+"meals:page:lunch:2" -> "Mpage:lunch:2". Legacy namespaces are lowercase, so
+both forms can be told apart by the first byte and old keyboards keep working.
+
+`NamespaceRouter` routes callback queries by a dict lookup on the namespace
+to the sub-routers that declared it, instead of offering every callback to
+every router in turn. Compact data is expanded to the canonical form before
+the sub-routers see it, so handlers never deal with the wire format.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from aiogram import Router
+from aiogram.dispatcher.event.bases import REJECTED, UNHANDLED
+from aiogram.types import TelegramObject
+
+MAX_CALLBACK_BYTES = 64  # Telegram limit for callback_data
+
+# namespace -> namespace byte; codes are uppercase so they never clash with legacy data
+NAMESPACE_CODES: Dict[str, str] = {
+    "admin": "A",
+    "back_to_main": "K",
+    "budget": "B",
+    "gate": "G",
+    "lang": "L",
+    "meals": "M",
+    "onb": "O",
+    "profile": "P",
+    "progress": "Q",
+    "reminder": "N",
+    "reminders": "R",
+    "settings": "T",
+    "sleep": "S",
+    "start": "H",
+    "w": "W",
+}
+_NAMESPACES_BY_CODE: Dict[str, str] = {code: ns for ns, code in NAMESPACE_CODES.items()}
+
+Field = Union[str, int, bool]
+
+
+class Callback(NamedTuple):
+    namespace: str
+    action: str
+    fields: Tuple[str, ...]
+    compact: bool = False
+
+    @property
+    def data(self) -> str:
+        """Canonical "namespace:action:field..." string."""
+        return ":".join((self.namespace, self.action) + self.fields) if self.action else self.namespace
+
+    def field(self, index: int, cast: Callable[[str], Any] = str, default: Any = None) -> Any:
+        """Field `index` converted with `cast`; `default` if missing or malformed."""
+        try:
+            return cast(self.fields[index])
+        except (IndexError, ValueError):
+            return default
+
+    def int_field(self, index: int, default: Optional[int] = None) -> Optional[int]:
+        return self.field(index, int, default)
+
+    def flag(self, index: int) -> bool:
+        return self.field(index) == "1"
+
+
+def _encode(value: Field) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    text = str(value)
+    if ":" in text:
+        raise ValueError(f"Callback field must not contain ':': {text!r}")
+    return text
+
+
+def pack_callback(namespace: str, action: str, *fields: Field) -> str:
+    """Compact callback_data for `namespace`/`action` with typed `fields`."""
+    code = NAMESPACE_CODES[namespace]
+    data = ":".join([code + action, *(_encode(value) for value in fields)])
+    if len(data.encode("utf-8")) > MAX_CALLBACK_BYTES:
+        raise ValueError(f"callback_data is longer than {MAX_CALLBACK_BYTES} bytes: {data!r}")
+    return data
+
+
+@lru_cache(maxsize=4096)
+def unpack_callback(data: str) -> Callback:
+    """Parse compact or legacy callback_data."""
+    head, *fields = data.split(":")
+    namespace = _NAMESPACES_BY_CODE.get(head[:1])
+    if namespace is not None:
+        return Callback(namespace, head[1:], tuple(fields), compact=True)
+    if not fields:
+        return Callback(head, "", ())
+    return Callback(head, fields[0], tuple(fields[1:]))
+
+
+class NamespaceRouter(Router):
+    """Router that offers a callback query only to the routers owning its namespace.
+
+    Sub-routers are attached with `include_namespaced`; the namespaces a router
+    lists are the only callbacks it receives. Other update types propagate as usual.
+    """
+
+    def __init__(self, *, name: Optional[str] = None) -> None:
+        super().__init__(name=name)
+        self._callback_routes: Dict[str, List[Router]] = {}
+
+    def include_namespaced(self, router: Router, *namespaces: str) -> Router:
+        for namespace in namespaces:
+            if namespace not in NAMESPACE_CODES:
+                raise ValueError(f"Unknown callback namespace: {namespace!r}")
+            self._callback_routes.setdefault(namespace, []).append(router)
+        return self.include_router(router)
+
+    async def _propagate_event(self, observer, update_type: str, event: TelegramObject, **kwargs: Any) -> Any:
+        if update_type != "callback_query":
+            return await super()._propagate_event(observer, update_type, event, **kwargs)
+
+        callback = unpack_callback(event.data or "")
+        if callback.compact:
+            event = event.model_copy(update={"data": callback.data})
+
+        if observer:
+            result, data = await observer.check_root_filters(event, **kwargs)
+            if not result:
+                return UNHANDLED
+            kwargs.update(data)
+            response = await observer.trigger(event, **kwargs)
+            if response is REJECTED:
+                return UNHANDLED
+            if response is not UNHANDLED:
+                return response
+
+        for router in self._callback_routes.get(callback.namespace, ()):
+            response = await router.propagate_event(update_type=update_type, event=event, **kwargs)
+            if response is not UNHANDLED:
+                return response
+        return UNHANDLED
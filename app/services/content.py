@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parents[2]
 WORKOUTS_PATH = ROOT / "data" / "workouts_sample.json"
@@ -13,20 +13,58 @@ MEALS_MEDIA_DIR = ROOT / "media" / "meals"
 
 logger = logging.getLogger(__name__)
 
+# Workout catalog keyed by group, built once on first use
+_workouts_catalog: Optional[Dict[str, Tuple[Dict, ...]]] = None
 
-def load_workouts(group: str) -> List[Dict]:
-    """Load workouts list for a group; tolerate missing file/invalid JSON."""
+
+def _read_workouts_json() -> Dict:
+    """Read raw workouts JSON (or the compiled bundle); tolerate missing file/invalid JSON."""
+    from app.services.content_bundle import load_bundle
+
+    bundle = load_bundle()
+    if bundle is not None:
+        return bundle["workouts"]
     if not WORKOUTS_PATH.exists():
         logger.warning("Workouts JSON not found at %s", WORKOUTS_PATH)
-        return []
+        return {}
     try:
         with open(WORKOUTS_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
-        items = data.get(group, []) if isinstance(data, dict) else []
-        return items if isinstance(items, list) else []
+        return data if isinstance(data, dict) else {}
     except Exception as exc:
         logger.exception("Failed to load workouts JSON: %s", exc)
-        return []
+        return {}
+
+
+def _build_workouts_catalog() -> Dict[str, Tuple[Dict, ...]]:
+    """Parse workouts JSON and resolve each exercise's media path once."""
+    catalog: Dict[str, Tuple[Dict, ...]] = {}
+    for group, items in _read_workouts_json().items():
+        if not isinstance(items, list):
+            continue
+        exercises = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            exercise = dict(item)
+            exercise["media_path"] = get_workout_media_path(item.get("media"))
+            exercises.append(exercise)
+        catalog[group] = tuple(exercises)
+    logger.info("Workout catalog loaded: %d groups", len(catalog))
+    return catalog
+
+
+def get_workouts_catalog() -> Dict[str, Tuple[Dict, ...]]:
+    """Return the preloaded workout catalog: group -> exercises with `media_path`."""
+    global _workouts_catalog
+    if _workouts_catalog is None:
+        _workouts_catalog = _build_workouts_catalog()
+    return _workouts_catalog
+
+
+def load_workouts(group: str) -> List[Dict]:
+    """Load workouts list for a group from the preloaded catalog."""
+    return list(get_workouts_catalog().get(group, ()))
 
 
 def load_meals(budget: str, category: str) -> List[Dict]:
@@ -63,25 +101,35 @@ def load_meals(budget: str, category: str) -> List[Dict]:
 
 
 def get_workout_media_path(filename: Optional[str]) -> Optional[Path]:
-    """Resolve media path for a workout GIF; return None if missing or invalid."""
+    """Resolve media path for a workout GIF from the media manifest; None if missing."""
     if not filename:
         return None
-    try:
-        path = WORKOUTS_MEDIA_DIR / filename
-        if path.exists() and path.is_file():
-            return path
-        logger.info("Workout media not found: %s", path)
-        return None
-    except Exception as exc:
-        logger.exception("Error resolving media path for %s: %s", filename, exc)
-        return None
+    from app.services.media_manifest import get_media_manifest
 
+    entry = get_media_manifest().workouts.get(filename)
+    return entry.path if entry else None
 
-def get_meal_media_path(filename: Optional[str]) -> Optional[Path]:
-    """Resolve media path for a meal image; return None if missing or invalid."""
+
+def get_meal_media_path(filename: Optional[str], variant: str = "jpeg") -> Optional[Path]:
+    """Resolve media path for a meal image, preferring its optimized variant.
+
+    Catalog images are a media manifest lookup; other files and variants are
+    resolved on disk, falling back to the source image. Returns None if the
+    image is missing or invalid.
+    """
     if not filename:
         return None
+    from app.services.media_manifest import get_media_manifest
+
+    entry = get_media_manifest().meals.get(filename)
+    if entry is not None and variant == "jpeg":
+        return entry.path
     try:
+        from app.services.media_pipeline import optimized_variant
+
+        optimized = optimized_variant(filename, variant)
+        if optimized is not None:
+            return optimized
         path = ROOT / filename
         if path.exists() and path.is_file():
             return path
@@ -89,4 +137,4 @@ def get_meal_media_path(filename: Optional[str]) -> Optional[Path]:
         return None
     except Exception as exc:
         logger.exception("Error resolving media path for %s: %s", filename, exc)
-        return None
\ No newline at end of file
+        return None
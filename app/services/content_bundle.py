@@ -0,0 +1,278 @@
+"""
+Compiled content bundle.
+
+`compile_bundle()` validates meals.json, workouts_sample.json and
+sleep_tips.json, pre-parses nutrition fields out of the meal texts, checks
+that every referenced media file exists and pickles the result into a single
+file. At runtime `load_bundle()` unpickles it once; if the bundle is missing
+or older than its sources the loaders fall back to the JSON files.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import pickle
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.content import ROOT, MEALS_PATH, WORKOUTS_PATH, WORKOUTS_MEDIA_DIR
+
+SLEEP_TIPS_PATH = ROOT / "data" / "sleep_tips.json"
+BUNDLE_PATH = ROOT / "data" / "content.bundle.pkl"
+BUNDLE_VERSION = 1
+
+SOURCES = {
+    "meals": MEALS_PATH,
+    "workouts": WORKOUTS_PATH,
+    "sleep_tips": SLEEP_TIPS_PATH,
+}
+
+LANGS = ("ru", "uz", "en")
+BUDGET_KEYS = ("budget_low", "budget_mid", "budget_high")
+MEAL_CATEGORIES = ("breakfast", "lunch", "dinner")
+
+logger = logging.getLogger(__name__)
+
+_bundle: Optional[Dict[str, Any]] = None
+_bundle_loaded = False
+
+
+# --- Parsing -----------------------------------------------------------------
+
+_NUMBER_RE = re.compile(r"\d[\d,\s]*")
+_KCAL_RE = re.compile(r"(\d+)\s*kcal", re.IGNORECASE)
+_MINUTES_RE = re.compile(r"(\d+)\s*min", re.IGNORECASE)
+
+
+def extract_field(text_content: str, label: str) -> Optional[str]:
+    """Return the text after `label` on the first line that contains it."""
+    for line in (text_content or "").split("\n"):
+        if label in line:
+            return line.split(label, 1)[1].strip()
+    return None
+
+
+def parse_kcal(value: Optional[str]) -> Optional[int]:
+    """'~350 kcal' -> 350."""
+    match = _KCAL_RE.search(value or "")
+    return int(match.group(1)) if match else None
+
+
+def parse_price_uzs(value: Optional[str]) -> Optional[int]:
+    """'~8,000 UZS' -> 8000. For ranges the lower bound is used."""
+    match = _NUMBER_RE.search(value or "")
+    if not match:
+        return None
+    digits = re.sub(r"[,\s]", "", match.group(0))
+    return int(digits) if digits else None
+
+
+def parse_prep_time(text_content: str) -> Optional[int]:
+    """Prep time in minutes from a 'Prep time:' / '⏱' line, if the text has one."""
+    value = extract_field(text_content, "Prep time:") or extract_field(text_content, "⏱")
+    match = _MINUTES_RE.search(value or "")
+    return int(match.group(1)) if match else None
+
+
+def meal_image_path(budget_key: str, meal: Dict) -> str:
+    """Relative image path for a meal pack: media/meals/budget_mid/breakfast/1.png."""
+    return meal.get("image") or f"media/meals/{budget_key}/{meal.get('category', '')}/{meal.get('pack_number', '')}.png"
+
+
+def enrich_meal(budget_key: str, meal: Dict) -> Dict:
+    """Copy of a meal with image path and numeric nutrition fields filled in."""
+    enriched = dict(meal)
+    text_en = meal.get("text_en", "")
+    calories_text = extract_field(text_en, "Calories:")
+    price_text = extract_field(text_en, "Price:")
+    enriched["image"] = meal_image_path(budget_key, meal)
+    enriched["calories_text"] = calories_text or "N/A"
+    enriched["price_text"] = price_text or "N/A"
+    enriched["kcal"] = parse_kcal(calories_text)
+    enriched["price_uzs"] = parse_price_uzs(price_text)
+    enriched["prep_time_min"] = meal.get("prep_time_min") or parse_prep_time(text_en)
+    return enriched
+
+
+def enrich_meals(data: Dict) -> Dict[str, List[Dict]]:
+    """Enrich every meal of every budget section."""
+    return {
+        budget_key: [enrich_meal(budget_key, meal) for meal in data.get(budget_key, []) if isinstance(meal, dict)]
+        for budget_key in BUDGET_KEYS
+    }
+
+
+# --- Validation --------------------------------------------------------------
+
+@dataclass
+class CompileReport:
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    missing_media: List[str] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+def _read_json(path: Path, report: CompileReport) -> Any:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        report.errors.append(f"{path.name}: file not found")
+    except json.JSONDecodeError as exc:
+        report.errors.append(f"{path.name}: invalid JSON ({exc})")
+    return None
+
+
+def validate_meals(data: Any, report: CompileReport) -> Dict[str, List[Dict]]:
+    if not isinstance(data, dict):
+        report.errors.append("meals.json: top level must be an object")
+        return {}
+    seen_ids = set()
+    for budget_key in BUDGET_KEYS:
+        meals = data.get(budget_key)
+        if not isinstance(meals, list):
+            report.errors.append(f"meals.json: '{budget_key}' must be a list")
+            continue
+        for i, meal in enumerate(meals):
+            where = f"meals.json {budget_key}[{i}]"
+            if not isinstance(meal, dict):
+                report.errors.append(f"{where}: must be an object")
+                continue
+            meal_id = meal.get("id")
+            if not meal_id:
+                report.errors.append(f"{where}: missing id")
+            elif meal_id in seen_ids:
+                report.errors.append(f"{where}: duplicate id '{meal_id}'")
+            seen_ids.add(meal_id)
+            if not isinstance(meal.get("pack_number"), int):
+                report.errors.append(f"{where}: pack_number must be an integer")
+            if meal.get("category") not in MEAL_CATEGORIES:
+                report.errors.append(f"{where}: unknown category '{meal.get('category')}'")
+            for lang in LANGS:
+                for key in (f"name_{lang}", f"text_{lang}"):
+                    if not meal.get(key):
+                        report.errors.append(f"{where}: missing {key}")
+    meals = enrich_meals(data)
+    for budget_key, items in meals.items():
+        for meal in items:
+            if meal["kcal"] is None:
+                report.warnings.append(f"meals.json {meal.get('id')}: no 'Calories:' value in text_en")
+            if meal["price_uzs"] is None:
+                report.warnings.append(f"meals.json {meal.get('id')}: no 'Price:' value in text_en")
+            if not (ROOT / meal["image"]).is_file():
+                report.missing_media.append(meal["image"])
+    report.counts["meals"] = sum(len(items) for items in meals.values())
+    return meals
+
+
+def validate_workouts(data: Any, report: CompileReport) -> Dict[str, List[Dict]]:
+    if not isinstance(data, dict):
+        report.errors.append("workouts_sample.json: top level must be an object")
+        return {}
+    workouts: Dict[str, List[Dict]] = {}
+    for group, items in data.items():
+        if not isinstance(items, list):
+            report.errors.append(f"workouts_sample.json: '{group}' must be a list")
+            continue
+        for i, ex in enumerate(items):
+            where = f"workouts_sample.json {group}[{i}]"
+            if not isinstance(ex, dict):
+                report.errors.append(f"{where}: must be an object")
+                continue
+            for lang in LANGS:
+                if not ex.get(f"title_{lang}"):
+                    report.errors.append(f"{where}: missing title_{lang}")
+            media = ex.get("media")
+            if not media:
+                report.warnings.append(f"{where}: no media")
+            elif not (WORKOUTS_MEDIA_DIR / media).is_file():
+                report.missing_media.append(f"media/workouts/{media}")
+        workouts[group] = [ex for ex in items if isinstance(ex, dict)]
+    report.counts["workouts"] = sum(len(items) for items in workouts.values())
+    return workouts
+
+
+def validate_sleep_tips(data: Any, report: CompileReport) -> List[Dict]:
+    if not isinstance(data, list):
+        report.errors.append("sleep_tips.json: top level must be a list")
+        return []
+    tips = []
+    for i, tip in enumerate(data):
+        if not isinstance(tip, dict):
+            report.errors.append(f"sleep_tips.json [{i}]: must be an object")
+            continue
+        for lang in LANGS:
+            if not tip.get(lang):
+                report.warnings.append(f"sleep_tips.json [{i}]: missing '{lang}'")
+        tips.append(tip)
+    report.counts["sleep_tips"] = len(tips)
+    return tips
+
+
+# --- Bundle ------------------------------------------------------------------
+
+def _source_fingerprints() -> Dict[str, Tuple[int, int]]:
+    fingerprints = {}
+    for name, path in SOURCES.items():
+        try:
+            st = path.stat()
+            fingerprints[name] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            fingerprints[name] = (-1, -1)
+    return fingerprints
+
+
+def compile_bundle(path: Path = BUNDLE_PATH, allow_missing_media: bool = False) -> CompileReport:
+    """Validate all content sources and write the bundle if they are sound.
+
+    Schema errors always block the bundle; missing media blocks it unless
+    `allow_missing_media` is set.
+    """
+    report = CompileReport()
+    meals = validate_meals(_read_json(MEALS_PATH, report), report)
+    workouts = validate_workouts(_read_json(WORKOUTS_PATH, report), report)
+    sleep_tips = validate_sleep_tips(_read_json(SLEEP_TIPS_PATH, report), report)
+
+    if report.errors or (report.missing_media and not allow_missing_media):
+        return report
+
+    bundle = {
+        "version": BUNDLE_VERSION,
+        "sources": _source_fingerprints(),
+        "meals": meals,
+        "workouts": workouts,
+        "sleep_tips": sleep_tips,
+        "missing_media": report.missing_media,
+    }
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(path)
+    return report
+
+
+def load_bundle() -> Optional[Dict[str, Any]]:
+    """Unpickle the compiled bundle once; None if missing, outdated or stale."""
+    global _bundle, _bundle_loaded
+    if _bundle_loaded:
+        return _bundle
+    _bundle_loaded = True
+    if not BUNDLE_PATH.exists():
+        return None
+    try:
+        with open(BUNDLE_PATH, "rb") as f:
+            bundle = pickle.load(f)
+    except Exception as exc:
+        logger.warning("Failed to load content bundle %s: %s", BUNDLE_PATH, exc)
+        return None
+    if bundle.get("version") != BUNDLE_VERSION:
+        logger.warning("Content bundle version mismatch, falling back to JSON")
+        return None
+    if bundle.get("sources") != _source_fingerprints():
+        logger.warning("Content bundle is older than its JSON sources, run compile_content.py")
+        return None
+    _bundle = bundle
+    logger.info("Content bundle loaded from %s", BUNDLE_PATH)
+    return _bundle
@@ -0,0 +1,214 @@
+"""
+FSM storage on the bot database.
+
+aiogram's MemoryStorage lives inside one process and is lost on restart, so
+users partway through onboarding, sleep logging, a workout or an admin flow
+had to start over. State and data are kept in the `fsm_states` table instead.
+
+Every FSM step reads and writes state, so the storage keeps hot keys in
+memory and writes changes behind: changed keys are collected and written in
+one transaction every FLUSH_INTERVAL_SECONDS (or as soon as FLUSH_BATCH_SIZE
+keys are pending) and on shutdown. A crash can lose at most the last
+interval of steps. A key missing from the cache is read in a worker thread,
+and concurrent reads of the same key share that one read. With several worker processes (app/sharding.py) updates
+are sharded by chat, so every key is owned by one worker and its
+per-process cache is never stale.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+
+from app.database import SessionLocal
+from app.models.fsm_state import FsmState
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL_SECONDS = 2.0
+FLUSH_BATCH_SIZE = 200
+CACHE_SIZE = 10_000
+# Keeps `IN (...)` below SQLite's bound parameter limit
+_WRITE_CHUNK = 500
+
+# state, data
+Record = Tuple[Optional[str], Dict[str, Any]]
+_EMPTY: Record = (None, {})
+
+
+def storage_key(key: StorageKey) -> str:
+    return ":".join(
+        str(part) if part is not None else ""
+        for part in (key.bot_id, key.chat_id, key.user_id, key.thread_id, key.business_connection_id, key.destiny)
+    )
+
+
+def dump_data(data: Mapping[str, Any]) -> Optional[str]:
+    """Compact JSON for the `data` column; NULL for empty data."""
+    if not data:
+        return None
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_data(raw: Optional[str]) -> Dict[str, Any]:
+    return json.loads(raw) if raw else {}
+
+
+class DatabaseStorage(BaseStorage):
+    """FSM storage backed by the `fsm_states` table with a write-behind cache."""
+
+    def __init__(
+        self,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        batch_size: int = FLUSH_BATCH_SIZE,
+        cache_size: int = CACHE_SIZE,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Record]" = OrderedDict()
+        self._dirty: Set[str] = set()
+        # Keys in the batch being written; kept cached until the write ends
+        self._writing: Set[str] = set()
+        self._reading: Dict[str, "asyncio.Future[Record]"] = {}
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._closing = False
+
+    # --- cache ---
+
+    async def _record(self, db_key: str) -> Record:
+        record = self._cache.get(db_key)
+        if record is not None:
+            self._cache.move_to_end(db_key)
+            return record
+        reading = self._reading.get(db_key)
+        if reading is None:
+            reading = self._reading[db_key] = asyncio.ensure_future(asyncio.to_thread(self._read, db_key))
+            reading.add_done_callback(lambda _: self._reading.pop(db_key, None))
+        record = await asyncio.shield(reading)
+        # A write made while the row was being read is newer than the row
+        cached = self._cache.get(db_key)
+        if cached is not None:
+            return cached
+        self._cache[db_key] = record
+        self._evict()
+        return record
+
+    @staticmethod
+    def _read(db_key: str) -> Record:
+        with SessionLocal() as session:
+            row = session.get(FsmState, db_key)
+            return (row.state, load_data(row.data)) if row else _EMPTY
+
+    def _evict(self) -> None:
+        # Least recently used first; pending keys stay until they are written
+        while len(self._cache) > self.cache_size:
+            for db_key in self._cache:
+                if db_key not in self._dirty and db_key not in self._writing:
+                    del self._cache[db_key]
+                    break
+            else:
+                return
+
+    def _put(self, db_key: str, record: Record) -> None:
+        self._cache[db_key] = record
+        self._cache.move_to_end(db_key)
+        self._dirty.add(db_key)
+        if self._flusher is None:
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+        if len(self._dirty) >= self.batch_size:
+            self._batch_full.set()
+
+    # --- write-behind ---
+
+    async def _flush_loop(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_full.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending keys in one transaction."""
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+            batch: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+            for db_key in self._dirty:
+                state, data = self._cache[db_key]
+                try:
+                    batch[db_key] = (state, dump_data(data))
+                except (TypeError, ValueError) as exc:
+                    # Kept in memory only; one bad value must not stop the other writes
+                    logger.error("FSM data for %s is not JSON-serializable, not saved: %s", db_key, exc)
+            self._dirty = set()
+            if not batch:
+                return
+            self._writing = set(batch)
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception:
+                logger.exception("Failed to write %d FSM records, will retry", len(batch))
+                # The cache still holds the latest values of these keys
+                self._dirty.update(batch)
+            else:
+                logger.debug("Wrote %d FSM records", len(batch))
+            finally:
+                self._writing = set()
+
+    @staticmethod
+    def _write_batch(batch: Dict[str, Tuple[Optional[str], Optional[str]]]) -> None:
+        keys = list(batch)
+        with SessionLocal() as session:
+            for start in range(0, len(keys), _WRITE_CHUNK):
+                chunk = keys[start:start + _WRITE_CHUNK]
+                rows = {row.key: row for row in session.query(FsmState).filter(FsmState.key.in_(chunk))}
+                for db_key in chunk:
+                    state, data = batch[db_key]
+                    row = rows.get(db_key)
+                    if state is None and data is None:
+                        if row is not None:
+                            session.delete(row)
+                    elif row is None:
+                        session.add(FsmState(key=db_key, state=state, data=data))
+                    else:
+                        row.state, row.data = state, data
+            session.commit()
+
+    # --- BaseStorage ---
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        db_key = storage_key(key)
+        _, data = await self._record(db_key)
+        self._put(db_key, (state.state if isinstance(state, State) else state, data))
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        return (await self._record(storage_key(key)))[0]
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        db_key = storage_key(key)
+        state, _ = await self._record(db_key)
+        self._put(db_key, (state, dict(data)))
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        # A copy, so handlers cannot change the cached record in place
+        return dict((await self._record(storage_key(key)))[1])
+
+    async def close(self) -> None:
+        # Let the flusher finish its current batch instead of cancelling a write
+        if self._flusher is not None:
+            self._closing = True
+            self._batch_full.set()
+            await self._flusher
+            self._flusher = None
+            self._closing = False
+        await self.flush()
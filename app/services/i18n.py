@@ -1,1268 +1,147 @@
 # app/services/i18n.py
-T = {
-    "ru": {
-        # Main menu
-        "menu.welcome": "🏠 Главное меню Fitonomics",
-        "menu.workouts": "🏋️ Тренировки",
-        "menu.meals": "🍽️ Питание",
-        "menu.sleep": "💤 Сон",
-        "menu.progress": "📈 Прогресс",
-        "menu.reminders": "⏰ Напоминания",
-        
-        # Reminders
-        "reminders.settings": "⚙️ Настроить напоминания",
-        "reminders.toggle_all": "🔕 Включить/выключить все",
-        "reminders.workout_time": "Время тренировок",
-        "reminders.sleep_reminder": "Напоминание о сне",
-        "reminders.breakfast_time": "Время завтрака",
-        "reminders.lunch_time": "Время обеда",
-        "reminders.dinner_time": "Время ужина",
-        "reminders.sleep_reminder_enter_time": "Введите время напоминания о записи сна",
-        "reminders.breakfast_enter_time": "Введите время напоминания о завтраке",
-        "reminders.lunch_enter_time": "Введите время напоминания об обеде",
-        "reminders.dinner_enter_time": "Введите время напоминания об ужине",
-        "reminders.time_format_error": "Неверный формат времени. Используйте ЧЧ:ММ (например: 22:30)",
-        "reminders.time_saved": "Время сохранено!",
-        "reminders.standard": "стандартно",
-        "reminders.enabled": "Включены",
-        "reminders.disabled": "Выключены",
-        "btn_back_to_main": "🏠 Главное меню",
-        "btn_back": "⬅️ Назад",
-        "menu.settings": "⚙️ Настройки",
-        "menu.help": "❓ Помощь",
-        "menu.main": "🏠 Главное меню",
-        "menu.back_to_main": "🏠 Главное меню",
-        "menu.back": "⬅️ Назад",
-        "menu.profile": "👤 Профиль",
-        
-        # Legacy keys for backward compatibility
-        "menu_welcome": "Главное меню:",
-        "btn_workouts": "🏋️ Тренировки",
-        "btn_meals": "🍽 Питание",
-        # Meals
-        "meals_title": "🍽️ Питание",
-        "meals.title": "🍽️ Питание",
-        "meals.section_desc": "Здесь ты можешь увидеть здоровые пайки еды и отслеживать свой прогресс.",
-        "meals.choose_options": "Выбери опции:",
-        "meals_hint": "Сначала выбери цель и бюджет.",
-        "meals_empty": "Нет блюд для выбранных параметров.",
-        "meals.choose_budget": "Выбери бюджет:",
-        "meals.choose_budget_first": "Сначала выбери свой бюджет питания:",
-        "meals.budget.current": "Текущий бюджет",
-        "meals.budget.low": "💰 Экономный",
-        "meals.budget.mid": "💎 Средний", 
-        "meals.budget.high": "👑 Премиум",
-        "meals.change_budget": "Изменить бюджет",
-        "meals.budget.saved": "Бюджет сохранен: {budget}",
-        "meals.choose_category": "Выбери категорию:",
-        "meals.category.breakfast": "Завтрак",
-        "meals.category.lunch": "Обед",
-        "meals.category.dinner": "Ужин",
-        "meals.category.custom": "Свое блюдо",
-        "meals.choose_pack": "Выбери паек:",
-        "meals.pack": "Паек",
-        "meals.ingredients": "Ингредиенты",
-        "meals.price": "Цена",
-        "meals.calories": "Калории",
-        "meals.tags": "Теги",
-        "meals.prep_time": "Время приготовления",
-        "meals.done": "✅ Готово",
-        "meals.logged": "Блюдо записано!",
-        "meals.pack_not_found": "Паек не найден",
-        "meals.no_packs": "Нет пайков в этой категории",
-        "meals.custom.what_ate": "Что ты ел?",
-        "meals.custom.category": "Категория:",
-        "meals.custom.health_rating": "Оцени, насколько это было здорово:",
-        "meals.custom.logged": "Свое блюдо записано!",
-        "meals.health.healthy": "Здорово",
-        "meals.health.normal": "Я не уверен",
-        "meals.health.unhealthy": "Не здорово",
-        "meals.error.missing_data": "Ошибка: не хватает данных",
-        "meals.reminder.breakfast": "Быстрая проверка — что ты ел на завтрак?",
-        "meals.reminder.lunch": "Быстрая проверка — что ты ел на обед?",
-        "meals.reminder.dinner": "Быстрая проверка — что ты ел на ужин?",
-        "meals.reminder.question": "Быстрая проверка — что ты ел на {meal}?",
-        "meals.reminder.mark_now": "Отметить сейчас",
-        "meals.reminder.later": "В следующий раз",
-        "meals.reminder.later_response": "Хорошо, в следующий раз!",
-        "meals.reminder.quick_log": "Быстрое логирование:",
-        "meals.reminder.quick_pack": "📦 Выбрать паек",
-        "meals.reminder.quick_custom": "🍽️ Свое блюдо",
-        "meals.reminder.skip": "⏭️ Пропустить",
-        "meals.reminder.quick_select": "Выбери паек:",
-        "meals.reminder.logged": "Записано!",
-        "meals.reminder.skipped": "Пропущено!",
-        "prev": "⬅️ Назад",
-        "next": "➡️ Далее",
-        "btn_progress": "📈 Прогресс",
-        # Progress
-        "progress.title": "📊 Твой прогресс",
-        "progress.no_data": "Нет данных для отображения",
-        "progress.sleep.title": "Статистика сна",
-        "progress.sleep.avg_duration": "Средняя продолжительность",
-        "progress.sleep.optimal_nights": "Оптимальные ночи",
-        "progress.sleep.deviation": "Отклонения",
-        "progress.sleep.electronics": "С электроникой",
-        "progress.sleep.nights": "ночей",
-        "progress.sleep.no_data": "Нет данных о сне",
-        "progress.workouts.title": "Статистика тренировок",
-        "progress.workouts.this_week": "На этой неделе",
-        "progress.workouts.total": "Всего тренировок",
-        "progress.meals.title": "Статистика питания",
-        "progress.meals.this_week": "На этой неделе",
-        "progress.meals.avg_calories": "Средние калории",
-        "progress.meals.healthy": "Здоровые",
-        "progress.meals.unsure": "Сомнительные",
-        "progress.meals.unhealthy": "Нездоровые",
-        "progress.meals.healthiness": "Общая полезность",
-        "progress.meals.custom": "Свои блюда",
-        "progress.details.workouts": "🏋️ Тренировки",
-        "progress.details.sleep": "💤 Сон",
-        "progress.details.meals": "🍽️ Питание",
-        "progress.details.weight": "⚖️ Вес",
-        "progress.details.workouts.title": "Детали тренировок",
-        "progress.details.workouts.summary": "Сводка тренировок",
-        "progress.details.workouts.this_week": "На этой неделе",
-        "progress.details.workouts.total": "Всего тренировок",
-        "progress.details.workouts.by_group": "По группам мышц",
-        "progress.details.sleep.title": "Детали сна",
-        "progress.details.sleep.last_7_days": "Последние 7 дней",
-        "progress.details.sleep.nights_tracked": "Отслежено ночей",
-        "progress.details.sleep.avg_duration": "Средняя продолжительность",
-        "progress.details.sleep.optimal_pct": "Оптимальных ночей",
-        "progress.details.sleep.no_data": "Нет данных о сне",
-        "progress.details.meals.title": "Детали питания",
-        "progress.details.meals.summary": "Сводка питания",
-        "progress.details.meals.this_week": "На этой неделе",
-        "progress.details.meals.total": "Всего приемов пищи",
-        "progress.details.meals.avg_calories": "Средние калории",
-        "progress.details.meals.healthy": "Здоровые",
-        "progress.details.meals.unsure": "Сомнительные",
-        "progress.details.meals.unhealthy": "Нездоровые",
-        "progress.details.meals.healthiness": "Полезность",
-        "progress.details.meals.custom": "Свои блюда",
-        "progress.details.notifications": "🔔 Уведомления",
-        "progress.details.notifications.summary": "Статистика уведомлений",
-        "progress.details.notifications.status": "Статус",
-        "progress.details.notifications.workout": "Тренировки",
-        "progress.details.notifications.breakfast": "Завтрак",
-        "progress.details.notifications.lunch": "Обед",
-        "progress.details.notifications.dinner": "Ужин",
-        "progress.details.notifications.sleep": "Сон",
-        "progress.details.notifications.enabled": "Включены",
-        "progress.details.notifications.disabled": "Выключены",
-        "progress.details.notifications.sent": "Отправлено",
-        "progress.details.notifications.responded": "Отвечено",
-        "progress.details.notifications.skipped": "Пропущено",
-        "progress.details.weight.title": "Детали веса",
-        "progress.details.weight.current": "Текущий вес",
-        "progress.details.weight.no_data": "Вес не указан",
-        
-        # Legacy keys for backward compatibility
-        "progress_title": "Твой прогресс",
-        "progress_total": "Всего тренировок",
-        "progress_by_group": "По группам",
-        "progress_last7": "За последние 7 дней",
-        "back_to_menu": "⬅️ В меню",
-        "none": "—",
-        "btn_settings": "⚙️ Настройки",
+# Translations live in app/locales/<lang>.json, one file per language, and are
+# loaded at import into read-only mappings with interned strings. Every
+# language is needed from the start: the menu, settings and meals handlers
+# match button texts in all of them.
+import json
+import logging
+import sys
+from pathlib import Path
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Set, Union
 
-        # Settings
-        "settings_title": "⚙️Настройки",
-        "btn_change_language": "🌐 Сменить язык",
+logger = logging.getLogger(__name__)
 
-        "btn_set_profile": "👤 Профиль",
-        "btn_set_reminder": "⏰ Время напоминания",
-        "choose_language": "Выбери язык:",
-        "saved_language": "Язык сохранён",
-        "ask_name": "Как тебя зовут? Напиши имя.",
-        "saved_name": "Имя сохранено: {name}",
+LOCALES_DIR = Path(__file__).resolve().parent.parent / "locales"
+LANGS = ("ru", "uz", "en")
+DEFAULT_LANG = "ru"
+
+
+def _load_strings(lang: str) -> Mapping[str, str]:
+    with open(LOCALES_DIR / f"{lang}.json", encoding="utf-8") as f:
+        raw = json.load(f)
+    return MappingProxyType({sys.intern(key): sys.intern(text) for key, text in raw.items()})
+
+
+# `T[lang][key]`: raw strings per language
+T: Dict[str, Mapping[str, str]] = {lang: _load_strings(lang) for lang in LANGS}
+
+
+# --- compiled catalog ---
+# Compiled once per language at import: static strings are returned as they
+# are, strings with placeholders are pre-split into Template objects, and keys
+# missing in a language fall back to DEFAULT_LANG. Gaps are reported by
+# report_catalog().
+
+_FORMATTER = Formatter()
+
+
+class Template:
+    """A translation with placeholders, parsed once."""
+    __slots__ = ("text", "fields", "_parts", "_format_map")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._parts = tuple(
+            (literal, name, spec or "", conversion)
+            for literal, name, spec, conversion in _FORMATTER.parse(text)
+        )
+        self.fields = frozenset(name for _, name, _, _ in self._parts if name is not None)
+        self._format_map = text.format_map
+
+    def format(self, kwargs: Mapping[str, Any]) -> str:
+        try:
+            return self._format_map(kwargs)
+        except KeyError:
+            return self._format_checked(kwargs)
+
+    def _format_checked(self, kwargs: Mapping[str, Any]) -> str:
+        out = []
+        for literal, name, spec, conversion in self._parts:
+            out.append(literal)
+            if name is None:
+                continue
+            if name not in kwargs:
+                logger.error("Missing placeholder {%s} in %r", name, self.text)
+                out.append("{" + name + "}")
+                continue
+            value = kwargs[name]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            out.append(format(value, spec))
+        return "".join(out)
+
+
+Entry = Union[str, Template]
+
+
+def compile_text(text: str) -> Entry:
+    """A static string as it is, or a Template if it has placeholders."""
+    if "{" not in text and "}" not in text:
+        return text
+    return Template(text)
+
+
+def _compile_lang(strings: Mapping[str, str]) -> Dict[str, Entry]:
+    return {key: compile_text(text) for key, text in strings.items()}
+
+
+def _compile_catalog() -> Dict[str, Dict[str, Entry]]:
+    default = _compile_lang(T[DEFAULT_LANG])
+    return {
+        lang: default if lang == DEFAULT_LANG else {**default, **_compile_lang(T[lang])}
+        for lang in LANGS
+    }
+
+
+_CATALOG: Dict[str, Dict[str, Entry]] = _compile_catalog()
+
+
+_unknown_keys: Set[str] = set()
+
+
+def catalog_problems() -> List[str]:
+    """Keys missing per language and placeholders that differ between languages."""
+    problems = []
+    all_keys = set().union(*(strings.keys() for strings in T.values()))
+    for lang, strings in T.items():
+        missing = sorted(all_keys - strings.keys())
+        if missing:
+            problems.append(f"{lang}: {len(missing)} missing keys: {', '.join(missing)}")
+    for key in sorted(all_keys):
+        fields = {}
+        for lang, strings in T.items():
+            entry = compile_text(strings[key]) if key in strings else None
+            if entry is not None:
+                fields[lang] = entry.fields if isinstance(entry, Template) else frozenset()
+        if len(set(fields.values())) > 1:
+            described = ", ".join(f"{lang}={sorted(names)}" for lang, names in fields.items())
+            problems.append(f"{key}: placeholders differ ({described})")
+        for lang, names in fields.items():
+            bad = sorted(name for name in names if not name.isidentifier())
+            if bad:
+                problems.append(f"{lang}.{key}: unsupported placeholders {bad}")
+    return problems
 
-        "ask_profile": "Укажи через пробел: возраст рост(см) вес(кг). Пример: 28 176 70",
-        "invalid_input": "Неверный формат. Пример: 28 176 70",
-        "choose_budget": "Выбери бюджет питания:",
-        "budget_low": "🔘 До 200 000 UZS (Низкий бюджет)",
-        "budget_mid": "🔘 200 000–800 000 UZS (Средний бюджет)",
-        "budget_high": "🔘 800 000+ UZS (Высокий бюджет)",
-        "profile_saved": "Профиль сохранён ✅",
-        "choose_reminder_time": "Выбери время напоминаний:",
-        "rem_morning": "Утро (08:00)",
-        "rem_day": "День (13:00)",
-        "rem_evening": "Вечер (19:00)",
-        "reminder_saved": "Напоминания установлены: {time}",
 
-        "workouts_title": "Выбери вариант тренировки:",
-        "suggested_today": "Предложено на сегодня: {group}",
-        "btn_suggested": "✅ Предложенная: {group}",
-        "btn_choose_body": "📚 Выбрать группу",
-        "btn_cancel": "❌ Отмена",
-
-        "choose_group": "Выбери группу мышц:",
-        "group_arms": "Руки",
-        "group_legs": "Ноги",
-        "group_chest": "Грудь",
-        "group_back": "Спина",
-        "group_core": "Кор",
-        "group_shoulders": "Плечи",
-        "group_full": "Все тело",
-
-        "w_start": "Начинаем тренировку: {group}\nУпражнение {i}/{n}",
-        "w_next": "Дальше ▶️",
-        "w_skip": "Пропустить ⏭",
-        "w_done": "Готово ✅",
-        "w_finished": "Отлично! Ты завершил тренировку для: {group} 👏",
-        "gif_missing": "⚠️ GIF не найден, показываю описание.",
-
-        # Workouts new flow
-        "workouts.choose_mode_title": "🏃‍♂️ Раздел «Тренировки»\n\nЗдесь ты можешь выполнять упражнения и отслеживать прогресс\n\nВыбери вариант:",
-        "workouts.mode_home": "🏠 Домашние тренировки",
-        "workouts.mode_gym": "🏋️ Зал",
-        "workouts.choose_body_with_last": "Выбери группу мышц\n(В прошлый раз ты тренировал: {last})",
-
-        # Notifications
-        "notif.workout.line1": "«Маленькие шаги каждый день дают большие результаты.»",
-        "notif.workout.line2": "Время для тренировки! 💪",
-        "btn_start_workout": "Начать тренировку",
-
-        # Onboarding gate
-        "welcome_title": "📢 Добро пожаловать в Fitonomics!",
-        "welcome_body": "Твой универсальный фитнес-помощник для настоящих людей, реальных бюджетов и реальных результатов.\nМы предлагаем:\n✅ Локальные планы питания 🥗\n✅ Тренировки с учётом бюджета 💪\n✅ Ежедневную мотивацию и полезные привычки 🔁\nЧтобы начать путь трансформации, пожалуйста, подпишись на наш официальный канал",
-        "gate_join": "➕ Присоединиться ({channel})",
-        "gate_joined": "✅ Я подписался",
-        "gate_need_join": "Нужно подписаться на официальный канал, чтобы разблокировать Fitonomics. Начнём правильно! 🚀",
-        "gate_ok": "Отлично! Доступ открыт ✅",
-
-        # Onboarding steps
-        "onb_q1_name": "{step} 👤 Как тебя зовут?",
-        "onb_q2_age": "{step} 🎂 Сколько тебе лет? (например, 17)",
-        "onb_q3_height": "{step} 📏 Какой у тебя рост (см)?",
-        "onb_q4_weight": "{step} ⚖️ Какой у тебя вес (кг)?",
-        "onb_q5_budget": "{step} 💸 Каков твой месячный бюджет на фитнес?",
-        "onb_q6_workout_time": "{step} 🏋️ Когда тебе удобнее тренироваться?",
-        "onb_invalid_time": "Неверный формат времени. Пример: 06:30",
-        "onb_invalid_age": "Введите корректный возраст (число).",
-        "onb_invalid_height": "Введите рост в см (например, 176).",
-        "onb_invalid_weight": "Введите вес в кг (например, 70).",
-        "onb_calculating": "✅ Принято! Считаю ИМТ и подбираю план… 🔄",
-        "onb_final": "💥 Добро пожаловать в Fitonomics, {name}!",
-        "onb_bmi_title": "📊 Твой ИМТ: {bmi}",
-        "onb_bmi_desc": "ИМТ показывает, насколько твой вес соответствует росту. Это быстрый ориентир — не идеален, но полезен для целей.",
-        "onb_bmi_under": "🔵 У тебя недостаточная масса. Поможем набрать вес — питательные блюда и силовые тренировки.",
-        "onb_bmi_normal": "🟢 Нормальный диапазон — отлично! Сфокусируемся на закреплении, мышцах и энергии.",
-        "onb_bmi_over": "🟠 Избыточный вес. Всё ок — начнём с баланса питания и умных тренировок.",
-        "onb_bmi_other": "Интерпретация ИМТ вне стандартных диапазонов — ориентируемся на самочувствие и цели.",
-
-        # Sleep
-        "sleep_ask_sleep": "🌙 Во сколько ложился спать? (например, 23:30)",
-        "sleep_ask_wake": "⏰ Во сколько проснулся? (например, 06:30)",
-        "sleep_summary": "Сон: {sleep} → {wake} (⌛ {duration} ч)",
-        "sleep_eval_optimal": "💤 Отлично! Ты спал в оптимальном окне (23:00–06:00 ±30м).",
-        "sleep_eval_late": "⚠️ Время сна смещено. Попробуем сдвигать на 10 минут раньше.",
-        "sleep_eval_short": "⚠️ Мало сна (<6 ч). Это снижает фокус и восстановление.",
-        "sleep_eval_ok": "👍 Неплохо. улучшим постепенно.",
-        "sleep_suggest": "💡 Советы: {suggestion}",
-        # Sleep stats
-        "sleep_stats_title": "📊 Статистика сна",
-        "sleep_stats_avg": "Средняя длительность: {hours} ч",
-        "sleep_stats_optimal_pct": "% оптимальных ночей: {pct}%",
-        "sleep_stats_deviation": "Отклонение от идеала: {dev}",
-        # Sleep analysis (onboarding)
-        "sleep_analysis_title": "😴 Анализ сна",
-        "sleep_current": "🛌 Твой текущий сон: {sleep} – {wake}\n⏱️ Всего: {duration} ч",
-        "sleep_under_6": "⚠️ Недостаточно сна. Меньше 6 часов влияет на фокус, восстановление и настроение.\n\n🎯 Цель: 23:00 – 06:00 с ≥7 часами\n\nСледующие шаги:\n• Добавь ~10–15 минут сна начиная с сегодня.\n• Вечернее напоминание: {evening_reminder}\n• Утренняя проверка: {morning_reminder}",
-        "sleep_6_7": "ℹ️ Почти достаточно, но всё ещё не идеально. Давай добавим немного больше сна и выровняем время.\n\n🎯 Цель: 23:00 – 06:00 с 7–8 часами\n\nСледующие шаги:\n• Продли сон на ~10 минут.\n• Вечернее напоминание: {evening_reminder}\n• Утренняя проверка: {morning_reminder}",
-        "sleep_7_8_late_wake": "⚠️ Хорошая продолжительность, но ты просыпаешься слишком поздно. Давай сдвинем утро раньше.\n\n🎯 Цель: 23:00 – 06:00 (7 часов)\n\nСледующие шаги:\n• Завтра постарайся проснуться в {next_wake}.\n• Вечернее напоминание: {evening_reminder}\n• Утренняя проверка: {morning_reminder}\n\nМы будем корректировать на ~10 минут в день, пока не достигнем 06:00, сохраняя общий сон близким к 7 часам. 🌙",
-        "sleep_7_8_late_sleep": "⚠️ Хорошая продолжительность, но ты ложишься спать слишком поздно. Давай сдвинем время сна раньше.\n\n🎯 Цель: 23:00 – 06:00 (7 часов)\n\nСледующие шаги:\n• Сегодня постарайся лечь спать в {next_bedtime}.\n• Вечернее напоминание: {evening_reminder}\n• Утренняя проверка: {morning_reminder}\n\nМы будем корректировать на ~10 минут в день в сторону 23:00, сохраняя здоровые 7–8 часов. 🌙",
-        "sleep_7_8_correct": "💤 Отлично! Ты в идеальном окне: {sleep} – {wake}\n⏱️ Всего: {duration} ч\n\n✅ Поддерживай рутину стабильно.\n• Вечернее напоминание: {evening_reminder}\n• Утренняя проверка: {morning_reminder}",
-        "sleep_8_10": "ℹ️ Ты получаешь много отдыха. Давай стабилизируем время и мягко сократим до 7–8 часов.\n\n🎯 Цель: 23:00 – 06:00 (7–8 часов)\n\nСледующие шаги:\n• Стремись к {next_bedtime} / {next_wake} (−10 минут).\n• Вечернее напоминание: {evening_reminder}\n• Утренняя проверка: {morning_reminder}",
-        "sleep_over_10": "⚠️ Пересыпание может снизить дневную энергию. Давай подрежем и выровняем график.\n\n🎯 Цель: 23:00 – 06:00 (7 часов)\n\nСледующие шаги:\n• Завтра стремись к {next_wake} (−10 минут).\n• Вечернее напоминание: {evening_reminder}\n• Утренняя проверка: {morning_reminder}",
-        # Sleep notifications
-        "sleep_evening_title": "🌙 Напоминание о подготовке ко сну",
-        "sleep_evening_subtitle": "🕘 За 1 час до сна",
-        "sleep_evening_routine": "😌 Расслабляющая 5-минутная вечерняя рутина\n💤 Позволь телу расслабиться и подготовиться к качественному сну.\nВыполни эти успокаивающие движения:\n• 10x 🦵 Подъёмы ног\n• 15x 🚴 Велосипед\n• 10x 💪 Отжимания",
-        "sleep_evening_done": "➡️ 💬 Отлично, {name}! Ты завершил день сильным 💥",
-        "sleep_evening_unplug": "📵 Время отключиться\nИзбегай экранов сейчас, чтобы мозг отдохнул и мелатонин включился!",
-        "sleep_evening_read": "📖 Попробуй почитать 15–20 минут\n🛌 Исследования показывают, что чтение настоящей книги перед сном помогает быстрее заснуть и спать глубже.\n💡 Совет: Выбери что-то лёгкое и вдохновляющее — никаких экранов, только страницы ✨",
-        "sleep_morning_title": "💪 Доброе утро, {name}!",
-        "sleep_morning_subtitle": "Готов начать день как чемпион? Давай разожжём тело и мозг этой 5-минутной энергетической зарядкой 💥",
-        "sleep_morning_workout": "🔥 Сегодняшняя быстрая утренняя тренировка:\n• 🦵 10x Подъёмы ног – Разбуди пресс\n• 🚴 15x Велосипед – Сожги и скрути жир на животе\n• 💪 10x Отжимания – Построй утреннюю силу",
-        "sleep_morning_done": "🎉 Отлично, {name}!\nТы только что покорил первый вызов дня. Твоё тело теперь официально в движении!",
-        "sleep_morning_question": "😴 Удалось ли тебе лечь спать на 10 минут раньше прошлой ночью?",
-        "sleep_morning_yes": "🟢 Потрясающе! Твоё тело скажет тебе спасибо.\nТы на шаг ближе к здоровому режиму сна.\n⏭️ Завтра мы снова попробуем на 10 минут раньше – у тебя получится! 💪",
-        "sleep_morning_no": "🟡 Не беспокойся – прогресс не всегда идеален.\nДавай попробуем снова сегодня вечером. Просто постарайся лечь спать на 10 минут раньше.\nТвоё тело будет постепенно адаптироваться со временем 🕰💤",
-
-        # Sleep notifications
-        "sleep_evening_title": "🌙 Напоминание о подготовке ко сну",
-        "sleep_evening_subtitle": "🕘 За 1 час до сна",
-        "sleep_evening_routine": "😌 Расслабляющая 5-минутная вечерняя рутина\n💤 Позволь телу расслабиться и подготовиться к качественному сну.\nВыполни эти успокаивающие движения:\n• 10x 🦵 Подъёмы ног\n• 15x 🚴 Велосипед\n• 10x 💪 Отжимания",
-        "sleep_evening_done": "➡️ 💬 Отлично, {name}! Ты завершил день сильным 💥",
-        "sleep_evening_unplug": "📵 Время отключиться\nИзбегай экранов сейчас, чтобы мозг отдохнул и мелатонин включился!",
-        "sleep_evening_read": "📖 Попробуй почитать 15–20 минут\n🛌 Исследования показывают, что чтение настоящей книги перед сном помогает быстрее заснуть и спать глубже.\n💡 Совет: Выбери что-то лёгкое и вдохновляющее — никаких экранов, только страницы ✨",
-        "sleep_morning_title": "💪 Доброе утро, {name}!",
-        "sleep_morning_subtitle": "Готов начать день как чемпион? Давай разожжём тело и мозг этой 5-минутной энергетической зарядкой 💥",
-        "sleep_morning_workout": "🔥 Сегодняшняя быстрая утренняя тренировка:\n• 🦵 10x Подъёмы ног – Разбуди пресс\n• 🚴 15x Велосипед – Сожги и скрути жир на животе\n• 💪 10x Отжимания – Построй утреннюю силу",
-        "sleep_morning_done": "🎉 Отлично, {name}!\nТы только что покорил первый вызов дня. Твоё тело теперь официально в движении!",
-        "sleep_morning_question": "😴 Удалось ли тебе лечь спать на 10 минут раньше прошлой ночью?",
-        "sleep_morning_yes": "🟢 Потрясающе! Твоё тело скажет тебе спасибо.\nТы на шаг ближе к здоровому режиму сна.\n⏭️ Завтра мы снова попробуем на 10 минут раньше – у тебя получится! 💪",
-        "sleep_morning_no": "🟡 Не беспокойся – прогресс не всегда идеален.\nДавай попробуем снова сегодня вечером. Просто постарайся лечь спать на 10 минут раньше.\nТвоё тело будет постепенно адаптироваться со временем 🕰💤",
-        
-        # Reminders
-        "reminders.title": "⏰ Напоминания",
-        "reminders.coming_soon": "Функция напоминаний будет доступна в ближайшее время!",
-        
-        # Help
-        "help.title": "❓ Помощь",
-        "help.faq": "Часто задаваемые вопросы:\n\n• Как изменить язык? → Настройки → Сменить язык\n• Как отслеживать прогресс? → Прогресс\n• Как настроить напоминания? → Напоминания\n• Как изменить время сна? → Сон → Редактировать",
-        "help.contact": "📞 Поддержка: @fitonomics_support",
-        
-        # Sleep
-        "sleep.title": "💤 Анализ сна",
-        "sleep.no_data": "Данные о сне не найдены. Пройдите онбординг для настройки.",
-        "sleep.edit_times": "✏️ Изменить время сна",
-        
-        # Profile
-        "profile.title": "👤 Профиль",
-        "profile.field.name": "Имя",
-        "profile.field.age": "Возраст",
-        "profile.field.height": "Рост",
-        "profile.field.weight": "Вес",
-
-        "profile.field.budget": "Бюджет",
-        "profile.field.sleep": "Сон",
-        "profile.field.language": "Язык",
-        "profile.not_set": "— не задано",
-        "profile.edit_prompt_name": "Введите ваше имя:",
-        "profile.edit_prompt_age": "Введите ваш возраст:",
-        "profile.edit_prompt_height": "Введите ваш рост (в см):",
-        "profile.edit_prompt_weight": "Введите ваш вес (в кг):",
-        "profile.edit_prompt_budget": "Выберите бюджет:",
-        "profile.edit_prompt_sleep": "Введите время сна (ЧЧ:ММ):",
-        "profile.edit_prompt_wake": "Введите время пробуждения (ЧЧ:ММ):",
-        "profile.edit_prompt_language": "Выберите язык:",
-        "profile.edit": "✏️ Редактировать профиль",
-        "profile.edit_menu_title": "✏️ Редактирование профиля",
-        "profile.edit_menu_desc": "Выберите, что хотите изменить:",
-        "profile.edit_name": "✏️ Изменить имя",
-        "profile.edit_age": "✏️ Изменить возраст",
-        "profile.edit_height": "✏️ Изменить рост",
-        "profile.edit_weight": "✏️ Изменить вес",
-        "profile.edit_budget": "✏️ Изменить бюджет",
-        "profile.budget_saved": "Бюджет сохранен",
-        "profile.edit_sleep": "✏️ Редактировать сон",
-        "profile.back_to_main": "🔙 Главное меню",
-        "profile.no_data": "Профиль не найден",
-        "profile.invalid_name": "Неверное имя",
-        "profile.invalid_age": "Неверный возраст",
-        "profile.invalid_height": "Неверный рост",
-        "profile.invalid_weight": "Неверный вес",
-        "profile.invalid_budget": "Неверный бюджет",
-        "profile.invalid_time": "Неверный формат времени (ЧЧ:ММ)",
-
-        # Sleep section
-        "sleep.section_title": "🌙 Раздел «Сон»",
-        "sleep.section_desc": "Здесь ты можешь отмечать свой режим сна и получать советы.",
-        "sleep.choose_action": "Выбери действие:",
-        "sleep.log_sleep": "Отметить сон",
-        "sleep.my_progress": "Мой прогресс",
-        "sleep.daily_tip": "Совет дня",
-        "sleep.want_another_tip": "Хочу ещё совет",
-        "sleep.when_did_you_sleep": "Во сколько ты лёг вчера?",
-        "sleep.when_did_you_wake": "Во сколько ты проснулся?",
-        "sleep.electronics_question": "Использовал ли ты электронику перед сном?",
-        "sleep.quality_question": "Как оцениваешь качество сна?",
-        "sleep.recorded": "Записал ✅",
-        "sleep.duration": "Ты спал(а) {duration}",
-        "sleep.quality": "Качество сна: {emoji} {rating}",
-        "sleep.electronics_yes": "Вчера ты использовал электронику перед сном 🥲 Сегодня попробуй избегать её.",
-        "sleep.electronics_no": "Вчера ты не использовал электронику. Продолжай в том же духе! 💪",
-        "sleep.recommended_schedule": "Рекомендуемый режим сна: {schedule}",
-        "sleep.keep_it_up": "Продолжай в том же духе! 💪",
-        "sleep.stats_7_days": "Твоя статистика за последние 7 дней:",
-        "sleep.avg_duration": "Средняя продолжительность сна: {duration}",
-        "sleep.electronics_usage": "На этой неделе ты использовал электронику {count} раз перед сном.",
-        "sleep.electronics_great": "Отличная привычка — продолжай! ✅",
-        "sleep.electronics_ok": "Неплохо, но попробуй сократить. ⚖️",
-        "sleep.electronics_bad": "Слишком много — нужно сократить. ❌",
-        "sleep.avg_quality": "Средняя оценка качества: {emoji}",
-        "sleep.record_streak": "Рекордная серия: {days} дня подряд >7ч сна 🎉",
-        "sleep.daily_tip_title": "Совет дня 🌟",
-        "sleep.time_21": "21:00",
-        "sleep.time_22": "22:00",
-        "sleep.time_23": "23:00",
-        "sleep.time_06": "06:00",
-        "sleep.time_07": "07:00",
-        "sleep.time_08": "08:00",
-        "sleep.later": "Позже",
-        "sleep.enter_manually": "Ввести",
-        "sleep.yes": "Да",
-        "sleep.no": "Нет",
-        "sleep.quality_1": "😴 1",
-        "sleep.quality_2": "🙂 2",
-        "sleep.quality_3": "😀 3",
-        "sleep.quality_4": "🤩 4",
-        "sleep.quality_5": "🦸 5",
-        "sleep.quality_1_text": "Плохо",
-        "sleep.quality_2_text": "Нормально",
-        "sleep.quality_3_text": "Хорошо",
-        "sleep.quality_4_text": "Отлично",
-        "sleep.quality_5_text": "Превосходно",
-        "sleep.evening_reminder": "🌙 Время готовиться ко сну! Хочешь отметить, когда ляжешь?",
-        "sleep.morning_reminder": "☀️ Доброе утро! Отметим твой сон?",
-        "sleep.log_now": "Отметить",
-        "sleep.yes_log": "Да",
-        "sleep.no_log": "Нет",
-        "sleep_ask_sleep": "Введите время отхода ко сну (ЧЧ:ММ):",
-        "sleep_ask_wake": "Введите время пробуждения (ЧЧ:ММ):",
-
-        # Start/reset
-        "start.reset_title": "🔄 Перезапустить бота?",
-        "start.reset_desc": "Это удалит твои данные и прогресс. Продолжить?",
-        "btn_yes": "✅ Да",
-        "btn_no": "❌ Нет",
-    },
-    "uz": {
-        # Main menu
-        "menu.welcome": "🏠 Fitonomics Asosiy Menyu",
-        "menu.workouts": "🏋️ Mashg'ulotlar",
-        "menu.meals": "🍽️ Oziqlanish",
-        "menu.sleep": "💤 Uyqu",
-        "menu.progress": "📈 Taraqqiyot",
-        "menu.reminders": "⏰ Eslatmalar",
-        
-        # Reminders
-        "reminders.settings": "⚙️ Eslatmalarni sozlash",
-        "reminders.toggle_all": "🔕 Hammasini yoqish/o'chirish",
-        "reminders.workout_time": "Mashg'ulot vaqti",
-        "reminders.sleep_reminder": "Uyqu eslatmasi",
-        "reminders.breakfast_time": "Nonushta vaqti",
-        "reminders.lunch_time": "Tushlik vaqti",
-        "reminders.dinner_time": "Kechki ovqat vaqti",
-        "reminders.sleep_reminder_enter_time": "Uyqu eslatmasi vaqtini kiriting",
-        "reminders.breakfast_enter_time": "Nonushta eslatmasi vaqtini kiriting",
-        "reminders.lunch_enter_time": "Tushlik eslatmasi vaqtini kiriting",
-        "reminders.dinner_enter_time": "Kechki ovqat eslatmasi vaqtini kiriting",
-        "reminders.time_format_error": "Noto'g'ri vaqt formati. HH:MM formatida kiriting (masalan: 22:30)",
-        "reminders.time_saved": "Vaqt saqlandi!",
-        "reminders.standard": "standart",
-        "reminders.enabled": "Yoqilgan",
-        "reminders.disabled": "O'chirilgan",
-        "btn_back_to_main": "🏠 Asosiy Menyu",
-        "btn_back": "⬅️ Orqaga",
-        "menu.settings": "⚙️ Sozlamalar",
-        "menu.help": "❓ Yordam",
-        "menu.main": "🏠 Asosiy Menyu",
-        "menu.back_to_main": "🏠 Asosiy Menyu",
-        "menu.back": "⬅️ Orqaga",
-        "menu.profile": "👤 Profil",
-        
-        # Legacy keys for backward compatibility
-        "menu_welcome": "Asosiy menyu:",
-        "btn_workouts": "🏋️ Mashg'ulotlar",
-        "btn_meals": "🍽 Oziqlanish",
-        # Meals
-        "meals_title": "🍽️ Oziqlanish",
-        "meals.title": "🍽️ Oziqlanish",
-        "meals.section_desc": "Bu yerda siz sog'lom ovqat to'plamlarini ko'rishingiz va taraqqiyotingizni kuzatishingiz mumkin.",
-        "meals.choose_options": "Variantlarni tanlang:",
-        "meals_hint": "Avval maqsad va byudjetni tanlang.",
-        "meals_empty": "Tanlangan parametrlarga mos taom yo'q.",
-        "meals.choose_budget": "Byudjetni tanlang:",
-        "meals.choose_budget_first": "Avval oziqlanish byudjetingizni tanlang:",
-        "meals.budget.current": "Joriy byudjet",
-        "meals.budget.low": "💰 Tejamkor",
-        "meals.budget.mid": "💎 O'rta", 
-        "meals.budget.high": "👑 Premium",
-        "meals.change_budget": "Byudjetni o'zgartirish",
-        "meals.budget.saved": "Byudjet saqlandi: {budget}",
-        "meals.choose_category": "Kategoriyani tanlang:",
-        "meals.category.breakfast": "Nonushta",
-        "meals.category.lunch": "Tushlik",
-        "meals.category.dinner": "Kechki ovqat",
-        "meals.category.custom": "O'z taomingiz",
-        "meals.choose_pack": "Paketni tanlang:",
-        "meals.pack": "Paket",
-        "meals.ingredients": "Ingredientlar",
-        "meals.price": "Narx",
-        "meals.calories": "Kaloriya",
-        "meals.tags": "Teglar",
-        "meals.prep_time": "Tayyorlash vaqti",
-        "meals.done": "✅ Tayyor",
-        "meals.logged": "Taom yozib olindi!",
-        "meals.pack_not_found": "Paket topilmadi",
-        "meals.no_packs": "Bu kategoriyada paketlar yo'q",
-        "meals.custom.what_ate": "Nima yedingiz?",
-        "meals.custom.category": "Kategoriya:",
-        "meals.custom.health_rating": "Bu qanchalik sog'lom ekanligini baholang:",
-        "meals.custom.logged": "O'z taomingiz yozib olindi!",
-        "meals.health.healthy": "Sog'lom",
-        "meals.health.normal": "Men ishonchsizman",
-        "meals.health.unhealthy": "Sog'lom emas",
-        "meals.error.missing_data": "Xatolik: ma'lumotlar yetarli emas",
-        "meals.reminder.breakfast": "Tezkor tekshirish — nonushtada nima yedingiz?",
-        "meals.reminder.lunch": "Tezkor tekshirish — tushlikda nima yedingiz?",
-        "meals.reminder.dinner": "Tezkor tekshirish — kechki ovqatda nima yedingiz?",
-        "meals.reminder.question": "Tezkor tekshirish — {meal}da nima yedingiz?",
-        "meals.reminder.mark_now": "Hozir belgilash",
-        "meals.reminder.later": "Keyingi safar",
-        "meals.reminder.later_response": "Yaxshi, keyingi safar!",
-        "meals.reminder.quick_log": "Tezkor yozish:",
-        "meals.reminder.quick_pack": "📦 Paketni tanlash",
-        "meals.reminder.quick_custom": "🍽️ O'z taomi",
-        "meals.reminder.skip": "⏭️ O'tkazib yuborish",
-        "meals.reminder.quick_select": "Paketni tanlang:",
-        "meals.reminder.logged": "Yozib olindi!",
-        "meals.reminder.skipped": "O'tkazib yuborildi!",
-        "prev": "⬅️ Orqaga",
-        "next": "➡️ Keyingi",
-        "btn_progress": "📈 Progress",
-        # Progress
-        "progress.title": "📊 Progressingiz",
-        "progress.no_data": "Ko'rsatish uchun ma'lumot yo'q",
-        "progress.sleep.title": "Uyqu statistikasi",
-        "progress.sleep.avg_duration": "O'rtacha davomiylik",
-        "progress.sleep.optimal_nights": "Optimal tunlar",
-        "progress.sleep.deviation": "Og'ishishlar",
-        "progress.sleep.electronics": "Elektronika bilan",
-        "progress.sleep.nights": "tun",
-        "progress.sleep.no_data": "Uyqu ma'lumotlari yo'q",
-        "progress.workouts.title": "Mashg'ulot statistikasi",
-        "progress.workouts.this_week": "Bu hafta",
-        "progress.workouts.total": "Jami mashg'ulotlar",
-        "progress.meals.title": "Ovqatlanish statistikasi",
-        "progress.meals.this_week": "Bu hafta",
-        "progress.meals.avg_calories": "O'rtacha kaloriya",
-        "progress.meals.healthy": "Sog'lom",
-        "progress.meals.unsure": "Shubhali",
-        "progress.meals.unhealthy": "Sog'lom emas",
-        "progress.meals.healthiness": "Umumiy foydalilik",
-        "progress.meals.custom": "O'z taomlari",
-        "progress.details.workouts": "🏋️ Mashg'ulotlar",
-        "progress.details.sleep": "💤 Uyqu",
-        "progress.details.meals": "🍽️ Oziqlanish",
-        "progress.details.weight": "⚖️ Vazn",
-        "progress.details.workouts.title": "Mashg'ulot tafsilotlari",
-        "progress.details.workouts.summary": "Mashg'ulot xulosasi",
-        "progress.details.workouts.this_week": "Bu hafta",
-        "progress.details.workouts.total": "Jami mashg'ulotlar",
-        "progress.details.workouts.by_group": "Mushak guruhlari bo'yicha",
-        "progress.details.sleep.title": "Uyqu tafsilotlari",
-        "progress.details.sleep.last_7_days": "So'nggi 7 kun",
-        "progress.details.sleep.nights_tracked": "Kuzatilgan tunlar",
-        "progress.details.sleep.avg_duration": "O'rtacha davomiylik",
-        "progress.details.sleep.optimal_pct": "Optimal tunlar",
-        "progress.details.sleep.no_data": "Uyqu ma'lumotlari yo'q",
-        "progress.details.meals.title": "Ovqatlanish tafsilotlari",
-        "progress.details.meals.summary": "Ovqatlanish xulosasi",
-        "progress.details.meals.this_week": "Bu hafta",
-        "progress.details.meals.total": "Jami ovqatlar",
-        "progress.details.meals.avg_calories": "O'rtacha kaloriya",
-        "progress.details.meals.healthy": "Sog'lom",
-        "progress.details.meals.unsure": "Shubhali",
-        "progress.details.meals.unhealthy": "Sog'lom emas",
-        "progress.details.meals.healthiness": "Foydalilik",
-        "progress.details.meals.custom": "O'z taomlaringiz",
-        "progress.details.notifications": "🔔 Eslatmalar",
-        "progress.details.notifications.summary": "Eslatmalar statistikasi",
-        "progress.details.notifications.status": "Holat",
-        "progress.details.notifications.workout": "Mashg'ulotlar",
-        "progress.details.notifications.breakfast": "Nonushta",
-        "progress.details.notifications.lunch": "Tushlik",
-        "progress.details.notifications.dinner": "Kechki ovqat",
-        "progress.details.notifications.sleep": "Uyqu",
-        "progress.details.notifications.enabled": "Yoqilgan",
-        "progress.details.notifications.disabled": "O'chirilgan",
-        "progress.details.notifications.sent": "Yuborilgan",
-        "progress.details.notifications.responded": "Javob berilgan",
-        "progress.details.notifications.skipped": "O'tkazib yuborilgan",
-        "progress.details.weight.title": "Vazn tafsilotlari",
-        "progress.details.weight.current": "Joriy vazn",
-        "progress.details.weight.no_data": "Vazn ko'rsatilmagan",
-        
-        # Legacy keys for backward compatibility
-        "progress_title": "Sening taraqqiyoting",
-        "progress_total": "Jami mashg'ulotlar",
-        "progress_by_group": "Guruhlar bo'yicha",
-        "progress_last7": "So'nggi 7 kun",
-        "back_to_menu": "⬅️ Menyuga",
-        "none": "—",
-        "btn_settings": "⚙️ Sozlamalar",
-
-        # Settings
-        "settings_title": "⚙️ Sozlamalar",
-        "btn_change_language": "🌐 Tilni almashtirish",
-
-        "btn_set_profile": "👤 Profil",
-        "btn_set_reminder": "⏰ Eslatma vaqti",
-        "choose_language": "Tilni tanlang:",
-        "saved_language": "Til saqlandi",
-        "ask_name": "Ismingiz? Iltimos, yozing.",
-        "saved_name": "Ism saqlandi: {name}",
-
-        "ask_profile": "Yosh bo'y(cm) vazn(kg) — masalan: 28 176 70",
-        "invalid_input": "Noto'g'ri format. Masalan: 28 176 70",
-        "choose_budget": "Byudjetni tanlang:",
-        "budget_low": "🔘 200 000 so'mdan kam (Past byudjet)",
-        "budget_mid": "🔘 200 000–800 000 so'm (O'rta byudjet)",
-        "budget_high": "🔘 800 000+ so'm (Yuqori byudjet)",
-        "profile_saved": "Profil saqlandi ✅",
-        "choose_reminder_time": "Eslatma vaqtini tanlang:",
-        "rem_morning": "Ertalab (08:00)",
-        "rem_day": "Kunduzi (13:00)",
-        "rem_evening": "Kechqurun (19:00)",
-        "reminder_saved": "Eslatma sozlandi: {time}",
-
-        "workouts_title": "Mashg'ulot turini tanlang:",
-        "suggested_today": "Bugun tavsiya: {group}",
-        "btn_suggested": "✅ Tavsiya: {group}",
-        "btn_choose_body": "📚 Mushak guruhini tanlash",
-        "btn_cancel": "❌ Bekor qilish",
-
-        "choose_group": "Mushak guruhini tanlang:",
-        "group_arms": "Qo'llar",
-        "group_legs": "Oyoqlar",
-        "group_chest": "Ko'krak",
-        "group_back": "Orqa",
-        "group_core": "Korset",
-        "group_shoulders": "Yelkalar",
-        "group_full": "To'liq tana",
-
-        "w_start": "Mashg'ulot boshlanadi: {group}\nMashq {i}/{n}",
-        "w_next": "Keyingi ▶️",
-        "w_skip": "O'tkazib yuborish ⏭",
-        "w_done": "Tugadi ✅",
-        "w_finished": "Zo'r! {group} uchun mashg'ulot tugadi 👏",
-        "gif_missing": "⚠️ GIF topilmadi, tavsifni ko'rsataman.",
-
-        # Workouts new flow
-        "workouts.choose_mode_title": "🏃‍♂️ «Mashg'ulotlar» bo'limi\n\nBu yerda mashqlar bajarishingiz va taraqqiyotingizni kuzatishingiz mumkin\n\nVariantni tanlang:",
-        "workouts.mode_home": "🏠 Uy mashg'ulotlari",
-        "workouts.mode_gym": "🏋️ Zal",
-        "workouts.choose_body_with_last": "Mushak guruhini tanlang\n(Oxirgi safar {last} ustida ishladingiz)",
-
-        # Notifications
-        "notif.workout.line1": "“Har kuni kichik qadamlar katta natijalarga olib keladi.”",
-        "notif.workout.line2": "Mashg'ulot vaqti! 💪",
-        "btn_start_workout": "Mashg'ulotni boshlash",
-
-        # Onboarding gate
-        "welcome_title": "📢 Fitonomics ga xush kelibsiz!",
-        "welcome_body": "Haqiqiy odamlar, haqiqiy byudjetlar va haqiqiy natijalar uchun yaratilgan fitnes yordamchi.\nBiz taklif qilamiz:\n✅ Mahalliy ovqat rejalari 🥗\n✅ Byudjetga mos mashg'ulotlar 💪\n✅ Kunlik motivatsiya va sog'lom odatlar 🔁\nBoshlash uchun iltimos rasmiy kanalimizga qo'shiling",
-        "gate_join": "➕ Qo'shilish ({channel})",
-        "gate_joined": "✅ Qo'shildim",
-        "gate_need_join": "Fitonomics imkoniyatlarini ochish uchun rasmiy kanalga qo'shiling. Keling, to'g'ri boshlaymiz! 🚀",
-        "gate_ok": "Ajoyib! Kirish ochildi ✅",
-
-        # Onboarding steps
-        "onb_q1_name": "{step} 👤 Ismingiz?",
-        "onb_q2_age": "{step} 🎂 Necha yoshdasiz? (masalan, 17)",
-        "onb_q3_height": "{step} 📏 Bo'yingiz nechchi? (sm)",
-        "onb_q4_weight": "{step} ⚖️ Vazningiz nechchi? (kg)",
-        "onb_q5_budget": "{step} 💸 Oylik fitnes byudjetingiz?",
-        "onb_q6_workout_time": "{step} 🏋️ Qachon mashq qilish qulay?",
-        "onb_invalid_time": "Vaqt formati noto'g'ri. Masalan: 06:30",
-        "onb_invalid_age": "Yoshni to'g'ri kiriting (raqam).",
-        "onb_invalid_height": "Bo'yni sm da kiriting (masalan, 176).",
-        "onb_invalid_weight": "Vaznni kg da kiriting (masalan, 70).",
-        "onb_calculating": "✅ Qabul qilindi! BMI hisoblanmoqda va reja tayyorlanmoqda… 🔄",
-        "onb_final": "💥 Fitonomics ga xush kelibsiz, {name}!",
-        "onb_bmi_title": "📊 BMI: {bmi}",
-        "onb_bmi_desc": "BMI — bo'y va vazn nisbatini ko'rsatadi. Juda ideal bo'lmasa ham, maqsadlar uchun foydali.",
-        "onb_bmi_under": "🔵 Ozg'in toifa. Sog'lom ovqat va kuch mashqlari bilan vazn yig'amiz.",
-        "onb_bmi_normal": "🟢 Normal — zo'r! Endi barqarorlik, mushak va energiyani oshiramiz.",
-        "onb_bmi_over": "🟠 Ortiqcha vazn. Boshladik! Muvozanatli ovqat va aqlli mashqlar bilan natija qilamiz.",
-        "onb_bmi_other": "BMI standart emas. O'z holatingiz va maqsadlarga tayansak.",
-
-        # Sleep
-        "sleep_ask_sleep": "🌙 Soat nechada uxladiz? (masalan, 23:30)",
-        "sleep_ask_wake": "⏰ Soat nechada uyg'ondiz? (masalan, 06:30)",
-        "sleep_summary": "Uyqu: {sleep} → {wake} (⌛ {duration} soat)",
-        "sleep_eval_optimal": "💤 Zo'r! Ideal oraliqda uxladingiz (23:00–06:00 ±30 daqiqa).",
-        "sleep_eval_late": "⚠️ Uyqu vaqti kech. Har kuni 10 daqiqadan erta harakat qilamiz.",
-        "sleep_eval_short": "⚠️ Kam uyqu (<6 soat). Diqqat va tiklanish pasayadi.",
-        "sleep_eval_ok": "👍 Yaxshi. Asta-sekin yaxshilaymiz.",
-        "sleep_suggest": "💡 Tavsiya: {suggestion}",
-        # Sleep stats
-        "sleep_stats_title": "📊 Uyqu statistikasi",
-        "sleep_stats_avg": "O'rtacha davomiylik: {hours} soat",
-        "sleep_stats_optimal_pct": "Optimal kechalar ulushi: {pct}%",
-        "sleep_stats_deviation": "Idealga og'ish: {dev}",
-        # Sleep analysis (onboarding)
-        "sleep_analysis_title": "😴 Uyqu tahlili",
-        "sleep_current": "🛌 Hozirgi uyqu: {sleep} – {wake}\n⏱️ Jami: {duration} soat",
-        "sleep_under_6": "⚠️ Uyqu yetarli emas. 6 soatdan kam uyqu diqqat, tiklanish va kayfiyatga ta'sir qiladi.\n\n🎯 Maqsad: 23:00 – 06:00 ≥7 soat bilan\n\nKeyingi qadamlar:\n• Bugundan boshlab ~10–15 daqiqa uyqu qo'shing.\n• Kechki eslatma: {evening_reminder}\n• Tong tekshiruvi: {morning_reminder}",
-        "sleep_6_7": "ℹ️ Deyarli yetarli, lekin hali ham ideal emas. Keling, biroz ko'proq uyqu qo'shamiz va vaqtni tekislaymiz.\n\n🎯 Maqsad: 23:00 – 06:00 7–8 soat bilan\n\nKeyingi qadamlar:\n• Uyquni ~10 daqiqa uzaytiring.\n• Kechki eslatma: {evening_reminder}\n• Tong tekshiruvi: {morning_reminder}",
-        "sleep_7_8_late_wake": "⚠️ Yaxshi davomiylik, lekin juda kech uyg'onasiz. Keling, tongingizni erta siljitamiz.\n\n🎯 Maqsad: 23:00 – 06:00 (7 soat)\n\nKeyingi qadamlar:\n• Ertaga {next_wake} da uyg'onishga harakat qiling.\n• Kechki eslatma: {evening_reminder}\n• Tong tekshiruvi: {morning_reminder}\n\n06:00 ga yetguncha kuniga ~10 daqiqa tuzatamiz, umumiy uyquni 7 soatga yaqin saqlaymiz. 🌙",
-        "sleep_7_8_late_sleep": "⚠️ Yaxshi davomiylik, lekin juda kech yotasiz. Keling, uyqu vaqtini erta siljitamiz.\n\n🎯 Maqsad: 23:00 – 06:00 (7 soat)\n\nKeyingi qadamlar:\n• Bugun {next_bedtime} da yotishga harakat qiling.\n• Kechki eslatma: {evening_reminder}\n• Tong tekshiruvi: {morning_reminder}\n\n23:00 ga qarab kuniga ~10 daqiqa tuzatamiz, sog'lom 7–8 soatni saqlaymiz. 🌙",
-        "sleep_7_8_correct": "💤 Ajoyib! Ideal oynadasiz: {sleep} – {wake}\n⏱️ Jami: {duration} soat\n\n✅ Rutinani barqaror saqlang.\n• Kechki eslatma: {evening_reminder}\n• Tong tekshiruvi: {morning_reminder}",
-        "sleep_8_10": "ℹ️ Ko'p dam olyapsiz. Keling, vaqtni barqarorlashtiramiz va 7–8 soatga yumshoq kamaytiramiz.\n\n🎯 Maqsad: 23:00 – 06:00 (7–8 soat)\n\nKeyingi qadamlar:\n• {next_bedtime} / {next_wake} ga harakat qiling (−10 daqiqa).\n• Kechki eslatma: {evening_reminder}\n• Tong tekshiruvi: {morning_reminder}",
-        "sleep_over_10": "⚠️ Ortiqcha uyqu kunlik energiyani kamaytirishi mumkin. Keling, qisqartiramiz va jadvalni tekislaymiz.\n\n🎯 Maqsad: 23:00 – 06:00 (7 soat)\n\nKeyingi qadamlar:\n• Ertaga {next_wake} ga harakat qiling (−10 daqiqa).\n• Kechki eslatma: {evening_reminder}\n• Tong tekshiruvi: {morning_reminder}",
-        # Sleep notifications
-        "sleep_evening_title": "🌙 Uyquga tayyorgarlik eslatmasi",
-        "sleep_evening_subtitle": "🕘 Uyqu vaqtidan 1 soat oldin",
-        "sleep_evening_routine": "😌 5 daqiqalik tinchlantiruvchi kechki mashg'ulot\n💤 Tanangizni tinchlantiring va sifatli uyquga tayyorlang.\nBu tinchlantiruvchi harakatlarni bajaring:\n• 10x 🦵 Oyoq ko'tarishlar\n• 15x 🚴 Velosiped\n• 10x 💪 Tishlashlar",
-        "sleep_evening_done": "➡️ 💬 Ajoyib, {name}! Kundizni kuchli yakunladingiz 💥",
-        "sleep_evening_unplug": "📵 O'chirish vaqti\nEndi ekranlardan saqlaning, miyangiz dam olsin va melatonin ishga tushsin!",
-        "sleep_evening_read": "📖 15–20 daqiqa o'qishga harakat qiling\n🛌 Tadqiqotlar ko'rsatadiki, uyqu oldidan haqiqiy kitob o'qish tezroq uxlashga va chuqurroq uxlashga yordam beradi.\n💡 Maslahat: Yengil va ilhomlantiruvchi narsani tanlang — ekran yo'q, faqat sahifalar ✨",
-        "sleep_morning_title": "💪 Xayrli tong, {name}!",
-        "sleep_morning_subtitle": "Kundizni chempion kabi boshlashga tayyormisiz? Keling, tanangiz va miyangizni bu 5 daqiqalik energiya zaryadkasi bilan yoqamiz 💥",
-        "sleep_morning_workout": "🔥 Bugungi tezkor tong mashg'uloti:\n• 🦵 10x Oyoq ko'tarishlar – Qorin mushaklarini uyg'otish\n• 🚴 15x Velosiped – Qorin yog'ini yoqish va burish\n• 💪 10x Tishlashlar – Tong kuchini qurish",
-        "sleep_morning_done": "🎉 Ajoyib, {name}!\nSiz bugun birinchi muammoni hal qildingiz. Tanangiz endi rasman harakatda!",
-        "sleep_morning_question": "😴 Kecha uyqu vaqtidan 10 daqiqa erta yotishga muvaffaq bo'ldingizmi?",
-        "sleep_morning_yes": "🟢 Ajoyib! Tanangiz sizga rahmat aytadi.\nSiz sog'lom uyqu rejimiga bir qadam yaqinlashdingiz.\n⏭️ Ertaga yana 10 daqiqa erta harakat qilamiz – sizda bor! 💪",
-        "sleep_morning_no": "🟡 Tashvishlanmang – taraqqiyot har doim mukammal bo'lmaydi.\nKeling, bugun kechqurun yana urinib ko'ramiz. Faqat 10 daqiqa erta yotishga harakat qiling.\nTanangiz vaqt o'tishi bilan asta-sekin moslashadi 🕰💤",
-
-        # Sleep notifications
-        "sleep_evening_title": "🌙 Uyquga tayyorgarlik eslatmasi",
-        "sleep_evening_subtitle": "🕘 Uyqu vaqtidan 1 soat oldin",
-        "sleep_evening_routine": "😌 5 daqiqalik tinchlantiruvchi kechki mashg'ulot\n💤 Tanangizni tinchlantiring va sifatli uyquga tayyorlang.\nBu tinchlantiruvchi harakatlarni bajaring:\n• 10x 🦵 Oyoq ko'tarishlar\n• 15x 🚴 Velosiped\n• 10x 💪 Tishlashlar",
-        "sleep_evening_done": "➡️ 💬 Ajoyib, {name}! Kundizni kuchli yakunladingiz 💥",
-        "sleep_evening_unplug": "📵 O'chirish vaqti\nEndi ekranlardan saqlaning, miyangiz dam olsin va melatonin ishga tushsin!",
-        "sleep_evening_read": "📖 15–20 daqiqa o'qishga harakat qiling\n🛌 Tadqiqotlar ko'rsatadiki, uyqu oldidan haqiqiy kitob o'qish tezroq uxlashga va chuqurroq uxlashga yordam beradi.\n💡 Maslahat: Yengil va ilhomlantiruvchi narsani tanlang — ekran yo'q, faqat sahifalar ✨",
-        "sleep_morning_title": "💪 Xayrli tong, {name}!",
-        "sleep_morning_subtitle": "Kundizni chempion kabi boshlashga tayyormisiz? Keling, tanangiz va miyangizni bu 5 daqiqalik energiya zaryadkasi bilan yoqamiz 💥",
-        "sleep_morning_workout": "🔥 Bugungi tezkor tong mashg'uloti:\n• 🦵 10x Oyoq ko'tarishlar – Qorin mushaklarini uyg'otish\n• 🚴 15x Velosiped – Qorin yog'ini yoqish va burish\n• 💪 10x Tishlashlar – Tong kuchini qurish",
-        "sleep_morning_done": "🎉 Ajoyib, {name}!\nSiz bugun birinchi muammoni hal qildingiz. Tanangiz endi rasman harakatda!",
-        "sleep_morning_question": "😴 Kecha uyqu vaqtidan 10 daqiqa erta yotishga muvaffaq bo'ldingizmi?",
-        "sleep_morning_yes": "🟢 Ajoyib! Tanangiz sizga rahmat aytadi.\nSiz sog'lom uyqu rejimiga bir qadam yaqinlashdingiz.\n⏭️ Ertaga yana 10 daqiqa erta harakat qilamiz – sizda bor! 💪",
-        "sleep_morning_no": "🟡 Tashvishlanmang – taraqqiyot har doim mukammal bo'lmaydi.\nKeling, bugun kechqurun yana urinib ko'ramiz. Faqat 10 daqiqa erta yotishga harakat qiling.\nTanangiz vaqt o'tishi bilan asta-sekin moslashadi 🕰💤",
-        
-        # Reminders
-        "reminders.title": "⏰ Eslatmalar",
-        "reminders.coming_soon": "Eslatmalar funksiyasi yaqin vaqtda mavjud bo'ladi!",
-        
-        # Help
-        "help.title": "❓ Yordam",
-        "help.faq": "Ko'p so'raladigan savollar:\n\n• Tilni qanday o'zgartirish kerak? → Sozlamalar → Tilni almashtirish\n• Taraqqiyotni qanday kuzatish kerak? → Taraqqiyot\n• Eslatmalarni qanday sozlash kerak? → Eslatmalar\n• Uyqu vaqtini qanday o'zgartirish kerak? → Uyqu → Tahrirlash",
-        "help.contact": "📞 Qo'llab-quvvatlash: @fitonomics_support",
-        
-        # Sleep
-        "sleep.title": "💤 Uyqu tahlili",
-        "sleep.no_data": "Uyqu ma'lumotlari topilmadi. Sozlash uchun onboarding o'ting.",
-        "sleep.edit_times": "✏️ Uyqu vaqtini tahrirlash",
-        
-        # Profile
-        "profile.title": "👤 Profil",
-        "profile.field.name": "Ism",
-        "profile.field.age": "Yosh",
-        "profile.field.height": "Bo'y",
-        "profile.field.weight": "Vazn",
-
-        "profile.field.budget": "Byudjet",
-        "profile.field.sleep": "Uyqu",
-        "profile.field.language": "Til",
-        "profile.not_set": "— belgilanmagan",
-        "profile.edit_prompt_name": "Ismingizni kiriting:",
-        "profile.edit_prompt_age": "Yoshingizni kiriting:",
-        "profile.edit_prompt_height": "Bo'yingizni kiriting (sm da):",
-        "profile.edit_prompt_weight": "Vazningizni kiriting (kg da):",
-        "profile.edit_prompt_budget": "Byudjetni tanlang:",
-        "profile.edit_prompt_sleep": "Uyqu vaqtini kiriting (ЧЧ:ММ):",
-        "profile.edit_prompt_wake": "Uyg'onish vaqtini kiriting (ЧЧ:ММ):",
-        "profile.edit_prompt_language": "Tilni tanlang:",
-        "profile.edit": "✏️ Profilni tahrirlash",
-        "profile.edit_menu_title": "✏️ Profilni tahrirlash",
-        "profile.edit_menu_desc": "Nimani o'zgartirmoqchi ekanligingizni tanlang:",
-        "profile.edit_name": "✏️ Ismni o'zgartirish",
-        "profile.edit_age": "✏️ Yoshni o'zgartirish",
-        "profile.edit_height": "✏️ Bo'yni o'zgartirish",
-        "profile.edit_weight": "✏️ Vaznni o'zgartirish",
-        "profile.edit_budget": "✏️ Byudjetni o'zgartirish",
-        "profile.budget_saved": "Byudjet saqlandi",
-        "profile.edit_sleep": "✏️ Uyquni tahrirlash",
-        "profile.back_to_main": "🔙 Asosiy menyu",
-        "profile.no_data": "Profil topilmadi",
-        "profile.invalid_name": "Noto'g'ri ism",
-        "profile.invalid_age": "Noto'g'ri yosh",
-        "profile.invalid_height": "Noto'g'ri bo'y",
-        "profile.invalid_weight": "Noto'g'ri vazn",
-        "profile.invalid_budget": "Noto'g'ri byudjet",
-        "profile.invalid_time": "Noto'g'ri vaqt formati (ЧЧ:ММ)",
-
-        # Sleep section
-        "sleep.section_title": "🌙 «Uyqu» bo'limi",
-        "sleep.section_desc": "Bu yerda uyqu rejimingizni belgilashingiz va maslahatlar olishingiz mumkin.",
-        "sleep.choose_action": "Harakatni tanlang:",
-        "sleep.log_sleep": "Uyquni belgilash",
-        "sleep.my_progress": "Mening taraqqiyotim",
-        "sleep.daily_tip": "Kunlik maslahat",
-        "sleep.want_another_tip": "Yana maslahat kerak",
-        "sleep.when_did_you_sleep": "Kecha soat nechada uxladiz?",
-        "sleep.when_did_you_wake": "Soat nechada uyg'ondiz?",
-        "sleep.electronics_question": "Uyqu oldidan elektronika ishlatdingizmi?",
-        "sleep.quality_question": "Uyqu sifatini qanday baholaysiz?",
-        "sleep.recorded": "Yozib qoldim ✅",
-        "sleep.duration": "Siz {duration} uxladingiz",
-        "sleep.quality": "Uyqu sifati: {emoji} {rating}",
-        "sleep.electronics_yes": "Kecha uyqu oldidan elektronika ishlatdingiz 🥲 Bugun undan qochishga harakat qiling.",
-        "sleep.electronics_no": "Kecha elektronika ishlatmadingiz. Shu tarzda davom eting! 💪",
-        "sleep.recommended_schedule": "Tavsiya etilgan uyqu rejimi: {schedule}",
-        "sleep.keep_it_up": "Shu tarzda davom eting! 💪",
-        "sleep.stats_7_days": "So'nggi 7 kunlik statistikangiz:",
-        "sleep.avg_duration": "O'rtacha uyqu davomiyligi: {duration}",
-        "sleep.electronics_usage": "Bu hafta uyqu oldidan elektronikani {count} marta ishlatdingiz.",
-        "sleep.electronics_great": "Ajoyib odat — davom eting! ✅",
-        "sleep.electronics_ok": "Yaxshi, lekin kamaytirishga harakat qiling. ⚖️",
-        "sleep.electronics_bad": "Juda ko'p — kamaytirish kerak. ❌",
-        "sleep.avg_quality": "O'rtacha sifat bahosi: {emoji}",
-        "sleep.record_streak": "Rekord seriya: {days} kun ketma-ket >7 soat uyqu 🎉",
-        "sleep.daily_tip_title": "Kunlik maslahat 🌟",
-        "sleep.time_21": "21:00",
-        "sleep.time_22": "22:00",
-        "sleep.time_23": "23:00",
-        "sleep.time_06": "06:00",
-        "sleep.time_07": "07:00",
-        "sleep.time_08": "08:00",
-        "sleep.later": "Keyinroq",
-        "sleep.enter_manually": "Kiritish",
-        "sleep.yes": "Ha",
-        "sleep.no": "Yo'q",
-        "sleep.quality_1": "😴 1",
-        "sleep.quality_2": "🙂 2",
-        "sleep.quality_3": "😀 3",
-        "sleep.quality_4": "🤩 4",
-        "sleep.quality_5": "🦸 5",
-        "sleep.quality_1_text": "Yomon",
-        "sleep.quality_2_text": "O'rtacha",
-        "sleep.quality_3_text": "Yaxshi",
-        "sleep.quality_4_text": "Ajoyib",
-        "sleep.quality_5_text": "A'lo",
-        "sleep.evening_reminder": "🌙 Uyquga tayyorlanish vaqti! Uxlagan vaqtni belgilashni xohlaysizmi?",
-        "sleep.morning_reminder": "☀️ Xayrli tong! Uyquni belgilaymizmi?",
-        "sleep.log_now": "Belgilash",
-        "sleep.yes_log": "Ha",
-        "sleep.no_log": "Yo'q",
-        "sleep_ask_sleep": "Uxlagan vaqtni kiriting (ЧЧ:ММ):",
-        "sleep_ask_wake": "Uyg'onish vaqtini kiriting (ЧЧ:ММ):",
-
-        # Start/reset
-        "start.reset_title": "🔄 Botni qayta ishga tushirasizmi?",
-        "start.reset_desc": "Bu sizning ma'lumotlaringiz va taraqqiyotingizni o'chiradi. Davom etasizmi?",
-        "btn_yes": "✅ Ha",
-        "btn_no": "❌ Yo'q",
-    },
-    "en": {
-        # Main menu
-        "menu.welcome": "🏠 Fitonomics Main Menu",
-        "menu.workouts": "🏋️ Workouts",
-        "menu.meals": "🍽️ Meals",
-        "menu.sleep": "💤 Sleep",
-        "menu.progress": "📈 Progress",
-        "menu.reminders": "⏰ Reminders",
-        
-        # Reminders
-        "reminders.settings": "⚙️ Configure reminders",
-        "reminders.toggle_all": "🔕 Toggle all on/off",
-        "reminders.workout_time": "Workout time",
-        "reminders.sleep_reminder": "Sleep reminder",
-        "reminders.breakfast_time": "Breakfast time",
-        "reminders.lunch_time": "Lunch time",
-        "reminders.dinner_time": "Dinner time",
-        "reminders.sleep_reminder_enter_time": "Enter sleep reminder time",
-        "reminders.breakfast_enter_time": "Enter breakfast reminder time",
-        "reminders.lunch_enter_time": "Enter lunch reminder time",
-        "reminders.dinner_enter_time": "Enter dinner reminder time",
-        "reminders.time_format_error": "Invalid time format. Use HH:MM (e.g.: 22:30)",
-        "reminders.time_saved": "Time saved!",
-        "reminders.standard": "standard",
-        "reminders.enabled": "Enabled",
-        "reminders.disabled": "Disabled",
-        "btn_back_to_main": "🏠 Main Menu",
-        "btn_back": "⬅️ Back",
-        "menu.settings": "⚙️ Settings",
-        "menu.help": "❓ Help",
-        "menu.main": "🏠 Main Menu",
-        "menu.back_to_main": "🏠 Main Menu",
-        "menu.back": "⬅️ Back",
-        "menu.profile": "👤 Profile",
-        
-        # Legacy keys for backward compatibility
-        "menu_welcome": "Main menu:",
-        "btn_workouts": "🏋️ Workouts",
-        "btn_meals": "🍽 Meals",
-        # Meals
-        "meals_title": "🍽️ Meals",
-        "meals.title": "🍽️ Meals",
-        "meals.section_desc": "Here you can see healthy meal packs and track your progress.",
-        "meals.choose_options": "Choose options:",
-        "meals_hint": "Choose budget first.",
-        "meals_empty": "No meals for selected options.",
-        "meals.choose_budget": "Choose budget:",
-        "meals.choose_budget_first": "First, choose your meal budget:",
-        "meals.budget.current": "Current budget",
-        "meals.budget.low": "💰 Low",
-        "meals.budget.mid": "💎 Mid", 
-        "meals.budget.high": "👑 High",
-        "meals.change_budget": "Change budget",
-        "meals.budget.saved": "Budget saved: {budget}",
-        "meals.choose_category": "Choose category:",
-        "meals.category.breakfast": "Breakfast",
-        "meals.category.lunch": "Lunch",
-        "meals.category.dinner": "Dinner",
-        "meals.category.custom": "Custom meal",
-        "meals.choose_pack": "Choose pack:",
-        "meals.pack": "Pack",
-        "meals.ingredients": "Ingredients",
-        "meals.price": "Price",
-        "meals.calories": "Calories",
-        "meals.tags": "Tags",
-        "meals.prep_time": "Prep time",
-        "meals.done": "✅ Done",
-        "meals.logged": "Meal logged!",
-        "meals.pack_not_found": "Pack not found",
-        "meals.no_packs": "No packs in this category",
-        "meals.custom.what_ate": "What did you eat?",
-        "meals.custom.category": "Category:",
-        "meals.custom.health_rating": "Rate how healthy it was:",
-        "meals.custom.logged": "Custom meal logged!",
-        "meals.health.healthy": "Healthy",
-        "meals.health.normal": "I am unsure",
-        "meals.health.unhealthy": "Unhealthy",
-        "meals.error.missing_data": "Error: missing data",
-        "meals.reminder.breakfast": "Quick check — what did you have for breakfast?",
-        "meals.reminder.lunch": "Quick check — what did you have for lunch?",
-        "meals.reminder.dinner": "Quick check — what did you have for dinner?",
-        "meals.reminder.question": "Quick check — what did you have for {meal}?",
-        "meals.reminder.mark_now": "Mark now",
-        "meals.reminder.later": "Next time",
-        "meals.reminder.later_response": "Okay, next time!",
-        "meals.reminder.quick_log": "Quick logging:",
-        "meals.reminder.quick_pack": "📦 Choose pack",
-        "meals.reminder.quick_custom": "🍽️ Custom meal",
-        "meals.reminder.skip": "⏭️ Skip",
-        "meals.reminder.quick_select": "Choose pack:",
-        "meals.reminder.logged": "Logged!",
-        "meals.reminder.skipped": "Skipped!",
-        "prev": "⬅️ Back",
-        "next": "➡️ Next",
-        "btn_progress": "📈 Progress",
-        # Progress
-        "progress.title": "📊 Your Progress",
-        "progress.no_data": "No data to display",
-        "progress.sleep.title": "Sleep Statistics",
-        "progress.sleep.avg_duration": "Average duration",
-        "progress.sleep.optimal_nights": "Optimal nights",
-        "progress.sleep.deviation": "Deviations",
-        "progress.sleep.electronics": "With electronics",
-        "progress.sleep.nights": "nights",
-        "progress.sleep.no_data": "No sleep data",
-        "progress.workouts.title": "Workout Statistics",
-        "progress.workouts.this_week": "This week",
-        "progress.workouts.total": "Total workouts",
-        "progress.meals.title": "Meal Statistics",
-        "progress.meals.this_week": "This week",
-        "progress.meals.avg_calories": "Average calories",
-        "progress.meals.healthy": "Healthy",
-        "progress.meals.unsure": "Unsure",
-        "progress.meals.unhealthy": "Unhealthy",
-        "progress.meals.healthiness": "Overall healthiness",
-        "progress.meals.custom": "Custom meals",
-        "progress.details.workouts": "🏋️ Workouts",
-        "progress.details.sleep": "💤 Sleep",
-        "progress.details.meals": "🍽️ Meals",
-        "progress.details.weight": "⚖️ Weight",
-        "progress.details.workouts.title": "Workout Details",
-        "progress.details.workouts.summary": "Workout Summary",
-        "progress.details.workouts.this_week": "This week",
-        "progress.details.workouts.total": "Total workouts",
-        "progress.details.workouts.by_group": "By muscle groups",
-        "progress.details.sleep.title": "Sleep Details",
-        "progress.details.sleep.last_7_days": "Last 7 days",
-        "progress.details.sleep.nights_tracked": "Nights tracked",
-        "progress.details.sleep.avg_duration": "Average duration",
-        "progress.details.sleep.optimal_pct": "Optimal nights",
-        "progress.details.sleep.no_data": "No sleep data",
-        "progress.details.meals.title": "Meal Details",
-        "progress.details.meals.summary": "Meal Summary",
-        "progress.details.meals.this_week": "This week",
-        "progress.details.meals.total": "Total meals",
-        "progress.details.meals.avg_calories": "Average calories",
-        "progress.details.meals.healthy": "Healthy",
-        "progress.details.meals.unsure": "Unsure",
-        "progress.details.meals.unhealthy": "Unhealthy",
-        "progress.details.meals.healthiness": "Healthiness",
-        "progress.details.meals.custom": "Custom meals",
-        "progress.details.notifications": "🔔 Notifications",
-        "progress.details.notifications.summary": "Notification statistics",
-        "progress.details.notifications.status": "Status",
-        "progress.details.notifications.workout": "Workouts",
-        "progress.details.notifications.breakfast": "Breakfast",
-        "progress.details.notifications.lunch": "Lunch",
-        "progress.details.notifications.dinner": "Dinner",
-        "progress.details.notifications.sleep": "Sleep",
-        "progress.details.notifications.enabled": "Enabled",
-        "progress.details.notifications.disabled": "Disabled",
-        "progress.details.notifications.sent": "Sent",
-        "progress.details.notifications.responded": "Responded",
-        "progress.details.notifications.skipped": "Skipped",
-        "progress.details.weight.title": "Weight Details",
-        "progress.details.weight.current": "Current weight",
-        "progress.details.weight.no_data": "Weight not set",
-        
-        # Legacy keys for backward compatibility
-        "progress_title": "Your progress",
-        "progress_total": "Total workouts",
-        "progress_by_group": "By group",
-        "progress_last7": "Last 7 days",
-        "back_to_menu": "⬅️ Back to Menu",
-        "none": "—",
-        "btn_settings": "⚙️ Settings",
-
-        # Settings
-        "settings_title": "⚙️ Settings",
-        "btn_change_language": "🌐 Change Language",
-
-        "btn_set_profile": "👤 Profile",
-        "btn_set_reminder": "⏰ Reminder Time",
-        "choose_language": "Choose language:",
-        "saved_language": "Language saved",
-        "ask_name": "What is your name?",
-        "saved_name": "Name saved: {name}",
-
-        "ask_profile": "Provide: age height(cm) weight(kg). Example: 28 176 70",
-        "invalid_input": "Invalid format. Example: 28 176 70",
-        "choose_budget": "Choose budget:",
-        "budget_low": "🔘 Under 200,000 UZS (Low Budget)",
-        "budget_mid": "🔘 200,000–800,000 UZS (Mid Budget)",
-        "budget_high": "🔘 800,000+ UZS (High Budget)",
-        "profile_saved": "Profile saved ✅",
-        "choose_reminder_time": "Choose reminder time:",
-        "rem_morning": "Morning (08:00)",
-        "rem_day": "Day (13:00)",
-        "rem_evening": "Evening (19:00)",
-        "reminder_saved": "Reminder set to: {time}",
-
-        "workouts_title": "Choose your workout:",
-        "suggested_today": "Suggested today: {group}",
-        "btn_suggested": "✅ Suggested: {group}",
-        "btn_choose_body": "📚 Choose body part",
-        "btn_cancel": "❌ Cancel",
-
-        "choose_group": "Choose a muscle group:",
-        "group_arms": "Arms",
-        "group_legs": "Legs",
-        "group_chest": "Chest",
-        "group_back": "Back",
-        "group_core": "Core",
-        "group_shoulders": "Shoulders",
-        "group_full": "Full body",
-
-        "w_start": "Starting workout: {group}\nExercise {i}/{n}",
-        "w_next": "Next ▶️",
-        "w_skip": "Skip ⏭",
-        "w_done": "Done ✅",
-        "w_finished": "Great! You finished the {group} workout 👏",
-        "gif_missing": "⚠️ GIF file not found, showing text.",
-
-        # Workouts new flow
-        "workouts.choose_mode_title": "🏃‍♂️ Workouts Section\n\nHere you can do exercises and track your progress\n\nChoose option:",
-        "workouts.mode_home": "🏠 Home Workouts",
-        "workouts.mode_gym": "🏋️ Gym",
-        "workouts.choose_body_with_last": "Choose body part\n(You worked on {last} last time)",
-
-        # Notifications
-        "notif.workout.line1": "“Small steps every day build big results.”",
-        "notif.workout.line2": "Time for your workout! 💪",
-        "btn_start_workout": "Start Workout",
-
-        # Onboarding gate
-        "welcome_title": "📢 Welcome to Fitonomics!",
-        "welcome_body": "Your all-in-one fitness companion built for real people, real budgets, and real results.\nWe offer:\n✅ Local meal plans 🥗\n✅ Budget-based workout guidance 💪\n✅ Daily motivation & healthy habits 🔁\nTo begin your transformation journey, please join our official Telegram channel",
-        "gate_join": "➕ Join ({channel})",
-        "gate_joined": "✅ I have joined",
-        "gate_need_join": "You must join the official channel to unlock the Fitonomics experience. Let's get started right! 🚀",
-        "gate_ok": "Great! You're in ✅",
-
-        # Onboarding steps
-        "onb_q1_name": "{step} 👤 What's your name?",
-        "onb_q2_age": "{step} 🎂 How old are you? (e.g., 17)",
-        "onb_q3_height": "{step} 📏 What's your height (in cm)?",
-        "onb_q4_weight": "{step} ⚖️ What's your weight (in kg)?",
-        "onb_q5_budget": "{step} 💸 What's your monthly fitness budget?",
-        "onb_q6_workout_time": "{step} 🏋️ When is the best time for you to exercise?",
-        "onb_invalid_time": "Invalid time format. Example: 06:30",
-        "onb_invalid_age": "Please enter a valid age (number).",
-        "onb_invalid_height": "Enter height in cm (e.g., 176).",
-        "onb_invalid_weight": "Enter weight in kg (e.g., 70).",
-        "onb_calculating": "✅ Got it! Now calculating your BMI and preparing your plan… 🔄",
-        "onb_final": "💥 Welcome to Fitonomics, {name}!",
-        "onb_bmi_title": "📊 Your BMI is: {bmi}",
-        "onb_bmi_desc": "BMI shows if your weight is healthy for your height. It's not perfect, but a useful guide.",
-        "onb_bmi_under": "🔵 Underweight: we'll focus on gaining healthy weight with nutrient-dense meals and strength training.",
-        "onb_bmi_normal": "🟢 Normal range — great! Let's keep you consistent, build muscle, and boost daily energy.",
-        "onb_bmi_over": "🟠 Overweight: no stress. Balanced eating and smart workouts will help reduce fat and lift energy.",
-        "onb_bmi_other": "BMI outside standard ranges — we'll tailor based on how you feel.",
-
-        # Sleep
-        "sleep_ask_sleep": "🌙 What time did you go to bed? (e.g., 23:30)",
-        "sleep_ask_wake": "⏰ What time did you wake up? (e.g., 06:30)",
-        "sleep_summary": "Sleep: {sleep} → {wake} (⌛ {duration} h)",
-        "sleep_eval_optimal": "💤 Awesome! You slept in the optimal window (23:00–06:00 ±30m).",
-        "sleep_eval_late": "⚠️ Sleep timing is late. Let's shift 10 minutes earlier each day.",
-        "sleep_eval_short": "⚠️ Short sleep (<6h). This reduces focus and recovery.",
-        "sleep_eval_ok": "👍 Not bad. We'll improve gradually.",
-        "sleep_suggest": "💡 Tip: {suggestion}",
-        # Sleep stats
-        "sleep_stats_title": "📊 Sleep stats",
-        "sleep_stats_avg": "Average duration: {hours} h",
-        "sleep_stats_optimal_pct": "% optimal nights: {pct}%",
-        "sleep_stats_deviation": "Deviation from ideal: {dev}",
-        # Sleep analysis (onboarding)
-        "sleep_analysis_title": "😴 Sleep Analysis",
-        "sleep_current": "🛌 Your current sleep: {sleep} – {wake}\n⏱️ Total: {duration} h",
-        "sleep_under_6": "⚠️ Not enough sleep. Less than 6 hours impacts focus, recovery, and mood.\n\n🎯 Target: 23:00 – 06:00 with ≥7 hours\n\nNext steps:\n• Add ~10–15 minutes of sleep starting tonight.\n• Evening reminder: {evening_reminder}\n• Morning check-in: {morning_reminder}",
-        "sleep_6_7": "ℹ️ Almost there, but still not ideal. Let's add a bit more sleep and align timing.\n\n🎯 Target: 23:00 – 06:00 with 7–8 hours\n\nNext steps:\n• Extend sleep by ~10 minutes.\n• Evening reminder: {evening_reminder}\n• Morning check-in: {morning_reminder}",
-        "sleep_7_8_late_wake": "⚠️ Good duration, but you wake up too late. Let's shift your morning earlier.\n\n🎯 Target: 23:00 – 06:00 (7 hours)\n\nNext steps:\n• Tomorrow aim to wake at {next_wake}.\n• Evening reminder: {evening_reminder}\n• Morning check-in: {morning_reminder}\n\nWe'll adjust by ~10 minutes per day until you reach 06:00, keeping total sleep close to 7 hours. 🌙",
-        "sleep_7_8_late_sleep": "⚠️ Good duration, but you go to bed too late. Let's move bedtime earlier.\n\n🎯 Target: 23:00 – 06:00 (7 hours)\n\nNext steps:\n• Tonight aim to sleep at {next_bedtime}.\n• Evening reminder: {evening_reminder}\n• Morning check-in: {morning_reminder}\n\nWe'll adjust by ~10 minutes per day toward 23:00 while keeping a healthy 7–8 hours. 🌙",
-        "sleep_7_8_correct": "💤 Great! You're in the ideal window: {sleep} – {wake}\n⏱️ Total: {duration} h\n\n✅ Keep the routine steady.\n• Evening reminder: {evening_reminder}\n• Morning check-in: {morning_reminder}",
-        "sleep_8_10": "ℹ️ You're getting plenty of rest. Let's stabilize timing and gently reduce toward 7–8 hours.\n\n🎯 Target: 23:00 – 06:00 (7–8 hours)\n\nNext steps:\n• Aim for {next_bedtime} / {next_wake} (−10 minutes).\n• Evening reminder: {evening_reminder}\n• Morning check-in: {morning_reminder}",
-        "sleep_over_10": "⚠️ Oversleeping can reduce daytime energy. Let's trim and align your schedule.\n\n🎯 Target: 23:00 – 06:00 (7 hours)\n\nNext steps:\n• Tomorrow aim for {next_wake} (−10 minutes).\n• Evening reminder: {evening_reminder}\n• Morning check-in: {morning_reminder}",
-        # Sleep notifications
-        "sleep_evening_title": "🌙 Sleep Prep Reminder",
-        "sleep_evening_subtitle": "🕘 1 hour before bedtime",
-        "sleep_evening_routine": "😌 Wind Down with This 5-Min Night Routine\n💤 Let your body relax and prepare for quality sleep.\nDo these calming moves:\n• 10x 🦵 Leg Raises\n• 15x 🚴 Bicycle Crunches\n• 10x 💪 Push-Ups",
-        "sleep_evening_done": "➡️ 💬 Well done, {name}! You've ended the day strong 💥",
-        "sleep_evening_unplug": "📵 Time to unplug\nAvoid screens now to let your brain chill out and melatonin kick in!",
-        "sleep_evening_read": "📖 Try reading for 15–20 minutes\n🛌 Studies show that reading a real book before bed helps you fall asleep faster and sleep deeper.\n💡 Tip: Choose something light and inspiring — no screen, just page ✨",
-        "sleep_morning_title": "💪 Good morning, {name}!",
-        "sleep_morning_subtitle": "Ready to start your day like a champion? Let's fire up your body and brain with this 5-minute energy blast 💥",
-        "sleep_morning_workout": "🔥 Today's Quick Wake-Up Workout:\n• 🦵 10x Leg Raises – Wake up that core\n• 🚴 15x Bicycle Crunches – Burn and twist the belly fat\n• 💪 10x Push-Ups – Build morning power",
-        "sleep_morning_done": "🎉 Well done, {name}!\nYou just conquered the first challenge of the day. Your body is now officially in motion!",
-        "sleep_morning_question": "😴 Did you manage to sleep 10 minutes earlier last night?",
-        "sleep_morning_yes": "🟢 Awesome! Your body will thank you for it.\nYou're one step closer to a healthier sleep routine.\n⏭️ Tomorrow, we will aim for 10 minutes earlier again – you've got this! 💪",
-        "sleep_morning_no": "🟡 No worries – progress isn't always perfect.\nLet's try again tonight. Just aim for sleeping 10 minutes earlier.\nYour body will adjust gently over time 🕰💤",
-
-        # Sleep notifications
-        "sleep_evening_title": "🌙 Sleep Prep Reminder",
-        "sleep_evening_subtitle": "🕘 1 hour before bedtime",
-        "sleep_evening_routine": "😌 Wind Down with This 5-Min Night Routine\n💤 Let your body relax and prepare for quality sleep.\nDo these calming moves:\n• 10x 🦵 Leg Raises\n• 15x 🚴 Bicycle Crunches\n• 10x 💪 Push-Ups",
-        "sleep_evening_done": "➡️ 💬 Well done, {name}! You've ended the day strong 💥",
-        "sleep_evening_unplug": "📵 Time to unplug\nAvoid screens now to let your brain chill out and melatonin kick in!",
-        "sleep_evening_read": "📖 Try reading for 15–20 minutes\n🛌 Studies show that reading a real book before bed helps you fall asleep faster and sleep deeper.\n💡 Tip: Choose something light and inspiring — no screen, just page ✨",
-        "sleep_morning_title": "💪 Good morning, {name}!",
-        "sleep_morning_subtitle": "Ready to start your day like a champion? Let's fire up your body and brain with this 5-minute energy blast 💥",
-        "sleep_morning_workout": "🔥 Today's Quick Wake-Up Workout:\n• 🦵 10x Leg Raises – Wake up that core\n• 🚴 15x Bicycle Crunches – Burn and twist the belly fat\n• 💪 10x Push-Ups – Build morning power",
-        "sleep_morning_done": "🎉 Well done, {name}!\nYou just conquered the first challenge of the day. Your body is now officially in motion!",
-        "sleep_morning_question": "😴 Did you manage to sleep 10 minutes earlier last night?",
-        "sleep_morning_yes": "🟢 Awesome! Your body will thank you for it.\nYou're one step closer to a healthier sleep routine.\n⏭️ Tomorrow, we will aim for 10 minutes earlier again – you've got this! 💪",
-        "sleep_morning_no": "🟡 No worries – progress isn't always perfect.\nLet's try again tonight. Just aim for sleeping 10 minutes earlier.\nYour body will adjust gently over time 🕰💤",
-        
-        # Reminders
-        "reminders.title": "⏰ Reminders",
-        "reminders.coming_soon": "Reminders feature will be available soon!",
-        
-        # Help
-        "help.title": "❓ Help",
-        "help.faq": "Frequently Asked Questions:\n\n• How to change language? → Settings → Change Language\n• How to track progress? → Progress\n• How to set reminders? → Reminders\n• How to change sleep time? → Sleep → Edit",
-        "help.contact": "📞 Support: @fitonomics_support",
-        
-        # Sleep
-        "sleep.title": "💤 Sleep Analysis",
-        "sleep.no_data": "Sleep data not found. Complete onboarding to set up.",
-        "sleep.edit_times": "✏️ Edit Sleep Times",
-        
-        # Profile
-        "profile.title": "👤 Profile",
-        "profile.field.name": "Name",
-        "profile.field.age": "Age",
-        "profile.field.height": "Height",
-        "profile.field.weight": "Weight",
-
-        "profile.field.budget": "Budget",
-        "profile.field.sleep": "Sleep",
-        "profile.field.language": "Language",
-        "profile.not_set": "— not set",
-        "profile.edit_prompt_name": "Enter your name:",
-        "profile.edit_prompt_age": "Enter your age:",
-        "profile.edit_prompt_height": "Enter your height (in cm):",
-        "profile.edit_prompt_weight": "Enter your weight (in kg):",
-        "profile.edit_prompt_budget": "Choose budget:",
-        "profile.edit_prompt_sleep": "Enter sleep time (HH:MM):",
-        "profile.edit_prompt_wake": "Enter wake time (HH:MM):",
-        "profile.edit_prompt_language": "Choose language:",
-        "profile.edit": "✏️ Edit Profile",
-        "profile.edit_menu_title": "✏️ Edit Profile",
-        "profile.edit_menu_desc": "Choose what you want to edit:",
-        "profile.edit_name": "✏️ Edit Name",
-        "profile.edit_age": "✏️ Edit Age",
-        "profile.edit_height": "✏️ Edit Height",
-        "profile.edit_weight": "✏️ Edit Weight",
-        "profile.edit_budget": "✏️ Edit Budget",
-        "profile.budget_saved": "Budget saved",
-        "profile.edit_sleep": "✏️ Edit Sleep",
-        "profile.back_to_main": "🔙 Main Menu",
-        "profile.no_data": "Profile not found",
-        "profile.invalid_name": "Invalid name",
-        "profile.invalid_age": "Invalid age",
-        "profile.invalid_height": "Invalid height",
-        "profile.invalid_weight": "Invalid weight",
-        "profile.invalid_budget": "Invalid budget",
-        "profile.invalid_time": "Invalid time format (HH:MM)",
-
-        # Sleep section
-        "sleep.section_title": "🌙 Sleep Section",
-        "sleep.section_desc": "Here you can log your sleep schedule and get advice.",
-        "sleep.choose_action": "Choose action:",
-        "sleep.log_sleep": "Log Sleep",
-        "sleep.my_progress": "My Progress",
-        "sleep.daily_tip": "Daily Tip",
-        "sleep.want_another_tip": "Want another tip",
-        "sleep.when_did_you_sleep": "What time did you go to bed yesterday?",
-        "sleep.when_did_you_wake": "What time did you wake up?",
-        "sleep.electronics_question": "Did you use electronics before sleeping?",
-        "sleep.quality_question": "How do you rate your sleep quality?",
-        "sleep.recorded": "Recorded ✅",
-        "sleep.duration": "You slept {duration}",
-        "sleep.quality": "Sleep quality: {emoji} {rating}",
-        "sleep.electronics_yes": "Yesterday you used electronics before sleep 🥲 Today try to avoid them.",
-        "sleep.electronics_no": "You did not use electronics yesterday. Keep it up! 💪",
-        "sleep.recommended_schedule": "Recommended sleep schedule: {schedule}",
-        "sleep.keep_it_up": "Keep it up! 💪",
-        "sleep.stats_7_days": "Your stats for the last 7 days:",
-        "sleep.avg_duration": "Average sleep duration: {duration}",
-        "sleep.electronics_usage": "This week you used electronics {count} times before sleep.",
-        "sleep.electronics_great": "Great habit — keep it up! ✅",
-        "sleep.electronics_ok": "Not bad, but try to reduce. ⚖️",
-        "sleep.electronics_bad": "Too much — you must cut down. ❌",
-        "sleep.avg_quality": "Average quality rating: {emoji}",
-        "sleep.record_streak": "Record streak: {days} days in a row >7h sleep 🎉",
-        "sleep.daily_tip_title": "Daily Tip 🌟",
-        "sleep.time_21": "21:00",
-        "sleep.time_22": "22:00",
-        "sleep.time_23": "23:00",
-        "sleep.time_06": "06:00",
-        "sleep.time_07": "07:00",
-        "sleep.time_08": "08:00",
-        "sleep.later": "Later",
-        "sleep.enter_manually": "Enter",
-        "sleep.yes": "Yes",
-        "sleep.no": "No",
-        "sleep.quality_1": "😴 1",
-        "sleep.quality_2": "🙂 2",
-        "sleep.quality_3": "😀 3",
-        "sleep.quality_4": "🤩 4",
-        "sleep.quality_5": "🦸 5",
-        "sleep.quality_1_text": "Poor",
-        "sleep.quality_2_text": "Fair",
-        "sleep.quality_3_text": "Good",
-        "sleep.quality_4_text": "Great",
-        "sleep.quality_5_text": "Excellent",
-        "sleep.evening_reminder": "🌙 Time to prepare for sleep! Want to log when you go to bed?",
-        "sleep.morning_reminder": "☀️ Good morning! Let's log your sleep?",
-        "sleep.log_now": "Log",
-        "sleep.yes_log": "Yes",
-        "sleep.no_log": "No",
-        "sleep_ask_sleep": "Enter sleep time (HH:MM):",
-        "sleep_ask_wake": "Enter wake time (HH:MM):",
-
-        # Start/reset
-        "start.reset_title": "🔄 Restart the bot?",
-        "start.reset_desc": "This will delete your data and progress. Continue?",
-        "btn_yes": "✅ Yes",
-        "btn_no": "❌ No",
-    },
-}
+def report_catalog() -> None:
+    """Log catalog gaps once at startup instead of showing raw keys to users."""
+    problems = catalog_problems()
+    for problem in problems:
+        logger.warning("i18n: %s", problem)
+    if not problems:
+        logger.info("i18n: %d keys in %d languages, no gaps", len(T[DEFAULT_LANG]), len(T))
+
 
 def t(lang: str, key: str, **kwargs) -> str:
-    lang = lang if lang in T else "ru"
-    txt = T[lang].get(key, key)
-    return txt.format(**kwargs) if kwargs else txt
\ No newline at end of file
+    catalog = _CATALOG.get(lang) or _CATALOG[DEFAULT_LANG]
+    entry = catalog.get(key)
+    if entry is None:
+        if key not in _unknown_keys:
+            _unknown_keys.add(key)
+            logger.warning("i18n: unknown key %r", key)
+        return key
+    if type(entry) is str:
+        return entry
+    return entry.format(kwargs)
@@ -0,0 +1,59 @@
+"""
+Keyboard cache.
+
+A markup built once for a given (language, screen, page) is shared by every
+update. Builders are decorated with `cached_markup`; builders that also read
+the database use `ttl_cached` so their output is refreshed periodically.
+
+aiogram markups are ordinary (mutable) pydantic models and the cache returns
+the shared instance, not a copy: callers must not change a cached markup or
+its rows. To extend one, build a new markup from its rows.
+"""
+from __future__ import annotations
+
+import time
+from functools import lru_cache, wraps
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_caches: List[Any] = []
+
+
+def cached_markup(func: F) -> F:
+    """Build the markup once per distinct (hashable) argument tuple."""
+    cached = lru_cache(maxsize=512)(func)
+    _caches.append(cached)
+    return cached  # type: ignore[return-value]
+
+
+def ttl_cached(seconds: float) -> Callable[[F], F]:
+    """Cache results per argument tuple for `seconds`."""
+    def decorator(func: F) -> F:
+        entries: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            value = func(*args, **kwargs)
+            with lock:
+                entries[key] = (now + seconds, value)
+            return value
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        _caches.append(wrapper)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def clear_keyboard_caches() -> None:
+    """Drop every cached markup, e.g. after translations change."""
+    for cached in _caches:
+        cached.cache_clear()
@@ -0,0 +1,147 @@
+"""
+Meal search over an inverted index.
+
+The index is built once from the meal catalog: every pack is tokenized by its
+names, ingredient lines and tags (category, budget) in ru, uz and en. Query
+tokens are matched by prefix against a sorted vocabulary, so "tux" finds
+"tuxum" and "овсян" finds "овсянка"; all query tokens must match.
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from app.services.meals import load_meals_data
+
+LANGS = ("ru", "uz", "en")
+MIN_TOKEN_LEN = 2
+# Prefixes come from user input, so their match cache is bounded (LRU)
+PREFIX_CACHE_SIZE = 4096
+
+# Localized tags so "завтрак" / "nonushta" / "breakfast" all match the category
+CATEGORY_TAGS = {
+    "breakfast": ("breakfast", "завтрак", "nonushta"),
+    "lunch": ("lunch", "обед", "tushlik"),
+    "dinner": ("dinner", "ужин", "kechki"),
+}
+BUDGET_TAGS = {
+    "budget_low": ("budget", "cheap", "эконом", "tejamkor"),
+    "budget_mid": ("medium", "средний", "o'rta"),
+    "budget_high": ("premium", "премиум"),
+}
+INGREDIENT_LABELS = ("Ингредиенты:", "Kerakli narsalar:", "Ingredients:")
+
+_APOSTROPHES = str.maketrans({"‘": "'", "’": "'", "ʻ": "'", "ʼ": "'", "`": "'", "´": "'", "ё": "е"})
+_TOKEN_RE = re.compile(r"[^\W\d_][\w']*")
+
+
+class MealSearchIndex:
+    def __init__(self, data: Dict[str, List[Dict]]):
+        self._meals: Dict[str, Dict] = {}
+        self._order: Dict[str, int] = {}
+        self._budget: Dict[str, str] = {}
+        self._name_tokens: Dict[str, FrozenSet[str]] = {}
+        postings: Dict[str, set] = {}
+        for budget_key, meals in data.items():
+            for meal in meals:
+                meal_id = meal.get("id")
+                if not meal_id:
+                    continue
+                self._meals[meal_id] = meal
+                self._order[meal_id] = len(self._order)
+                self._budget[meal_id] = budget_key
+                name_tokens = set()
+                for lang in LANGS:
+                    name_tokens.update(tokenize(meal.get(f"name_{lang}", "")))
+                tokens = set(name_tokens)
+                for lang in LANGS:
+                    tokens.update(tokenize(_ingredients_line(meal.get(f"text_{lang}", ""))))
+                tokens.update(CATEGORY_TAGS.get(meal.get("category"), ()))
+                tokens.update(BUDGET_TAGS.get(budget_key, ()))
+                self._name_tokens[meal_id] = frozenset(name_tokens)
+                for token in tokens:
+                    postings.setdefault(token, set()).add(meal_id)
+        self._postings: Dict[str, FrozenSet[str]] = {k: frozenset(v) for k, v in postings.items()}
+        self._vocab: Tuple[str, ...] = tuple(sorted(self._postings))
+        self._prefix_cache: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+
+    def _match_prefix(self, prefix: str) -> FrozenSet[str]:
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            self._prefix_cache.move_to_end(prefix)
+            return cached
+        ids: set = set()
+        i = bisect_left(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            ids |= self._postings[self._vocab[i]]
+            i += 1
+        result = frozenset(ids)
+        self._prefix_cache[prefix] = result
+        if len(self._prefix_cache) > PREFIX_CACHE_SIZE:
+            self._prefix_cache.popitem(last=False)
+        return result
+
+    def search(self, query: str, budget_key: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """Packs matching every query token; name matches first, then catalog order."""
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+        ids: Optional[FrozenSet[str]] = None
+        for token in query_tokens:
+            matched = self._match_prefix(token)
+            ids = matched if ids is None else ids & matched
+            if not ids:
+                return []
+        if budget_key:
+            ids = frozenset(i for i in ids if self._budget[i] == budget_key)
+
+        def rank(meal_id: str) -> Tuple[int, int]:
+            names = self._name_tokens[meal_id]
+            in_name = all(any(n.startswith(q) for n in names) for q in query_tokens)
+            return (0 if in_name else 1, self._order[meal_id])
+
+        return [self._meals[i] for i in sorted(ids, key=rank)[:limit]]
+
+
+def normalize(text: str) -> str:
+    """Casefold, fold ё into е and unify Uzbek apostrophe variants."""
+    return (text or "").casefold().translate(_APOSTROPHES)
+
+
+@lru_cache(maxsize=1024)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Normalized word tokens, without numbers and one-letter words."""
+    tokens = []
+    for token in _TOKEN_RE.findall(normalize(text)):
+        token = token.strip("'")
+        if len(token) >= MIN_TOKEN_LEN and token not in tokens:
+            tokens.append(token)
+    return tuple(tokens)
+
+
+def _ingredients_line(text_content: str) -> str:
+    for line in (text_content or "").split("\n"):
+        for label in INGREDIENT_LABELS:
+            if label in line:
+                return line.split(label, 1)[1]
+    return ""
+
+
+_index: Optional[MealSearchIndex] = None
+
+
+def get_search_index() -> MealSearchIndex:
+    """Return the meal search index, building it on first use."""
+    global _index
+    if _index is None:
+        _index = MealSearchIndex(load_meals_data())
+    return _index
+
+
+def search_meals(query: str, budget_level: Optional[str] = None, limit: int = 10) -> List[Dict]:
+    """Search meal packs, optionally within one budget level ('low', 'mid', 'high')."""
+    budget_key = f"budget_{budget_level}" if budget_level else None
+    return get_search_index().search(query, budget_key=budget_key, limit=limit)
@@ -2,6 +2,7 @@
 Meals service for loading and filtering meal data.
 """
 import json
+import logging
 import os
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
@@ -9,53 +10,39 @@ from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models.meal_log import MealLog, UserMealSettings
 from app.models.user import User
+from app.services.content_bundle import enrich_meals, load_bundle
 
+logger = logging.getLogger(__name__)
 
-def _extract_calories_from_text(text_content: str) -> str:
-    """Extract calories from text content."""
-    if not text_content:
-        return 'N/A'
-    
-    try:
-        # Look for "Calories:" pattern in English text
-        for line in text_content.split('\n'):
-            if 'Calories:' in line:
-                calories_text = line.split('Calories:')[1].strip()
-                return calories_text
-        return 'N/A'
-    except Exception as e:
-        print(f"Error extracting calories: {e}")
-        return 'N/A'
-
-
-def _extract_price_from_text(text_content: str) -> str:
-    """Extract price from text content."""
-    if not text_content:
-        return 'N/A'
-    
-    try:
-        # Look for "Price:" pattern in English text
-        for line in text_content.split('\n'):
-            if 'Price:' in line:
-                price_text = line.split('Price:')[1].strip()
-                return price_text
-        return 'N/A'
-    except Exception as e:
-        print(f"Error extracting price: {e}")
-        return 'N/A'
+_meals_data: Optional[Dict[str, List[Dict]]] = None
+_meals_by_id: Dict[str, Dict] = {}
 
 
 def load_meals_data() -> Dict:
-    """Load meals data from JSON file."""
-    try:
-        json_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "meals.json")
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"budget_low": [], "budget_mid": [], "budget_high": []}
-    except Exception as e:
-        print(f"Error loading meals data: {e}")
-        return {"budget_low": [], "budget_mid": [], "budget_high": []}
+    """Meals grouped by budget key, with nutrition fields pre-parsed.
+
+    Served from the compiled content bundle when it is up to date, otherwise
+    read from meals.json and enriched once. The result is cached.
+    """
+    global _meals_data, _meals_by_id
+    if _meals_data is not None:
+        return _meals_data
+    bundle = load_bundle()
+    if bundle is not None:
+        data = bundle["meals"]
+    else:
+        try:
+            json_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "meals.json")
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = enrich_meals(json.load(f))
+        except FileNotFoundError:
+            data = {"budget_low": [], "budget_mid": [], "budget_high": []}
+        except Exception:
+            logger.exception("Failed to load meals data")
+            data = {"budget_low": [], "budget_mid": [], "budget_high": []}
+    _meals_data = data
+    _meals_by_id = {meal.get("id"): meal for meals in data.values() for meal in meals}
+    return _meals_data
 
 
 def get_user_budget(user_id: int) -> Optional[str]:
@@ -87,23 +74,13 @@ def set_user_budget(user_id: int, budget_level: str) -> None:
             session.add(settings)
         session.commit()
 
+    from app.services.recommendations import request_user_refresh
+    request_user_refresh(user_id)
+
 
 def get_meals_by_budget(budget_level: str) -> List[Dict]:
     """Get all meals for a specific budget level."""
-    data = load_meals_data()
-    budget_key = f"budget_{budget_level}"
-    meals = data.get(budget_key, [])
-    
-    # Add media paths to each meal
-    for meal in meals:
-        category = meal.get("category", "")
-        pack_number = meal.get("pack_number", "")
-        if category and pack_number:
-            # Build media path: media/meals/budget_mid/breakfast/1.png
-            media_filename = f"media/meals/{budget_key}/{category}/{pack_number}.png"
-            meal["image"] = media_filename
-    
-    return meals
+    return list(load_meals_data().get(f"budget_{budget_level}", []))
 
 
 def get_meals_by_category(budget_level: str, category: str) -> List[Dict]:
@@ -116,12 +93,8 @@ def get_meals_by_category(budget_level: str, category: str) -> List[Dict]:
 
 def get_meal_by_id(meal_id: str) -> Optional[Dict]:
     """Get a specific meal by ID from any budget."""
-    data = load_meals_data()
-    for budget_key in ["budget_low", "budget_mid", "budget_high"]:
-        for meal in data.get(budget_key, []):
-            if meal.get("id") == meal_id:
-                return meal
-    return None
+    load_meals_data()
+    return _meals_by_id.get(meal_id)
 
 
 def log_meal_pack(user_id: int, pack_id: str, meal_type: str) -> None:
@@ -130,10 +103,6 @@ def log_meal_pack(user_id: int, pack_id: str, meal_type: str) -> None:
     if not meal_data:
         return
     
-    # Extract calories and price from text
-    calories_text = _extract_calories_from_text(meal_data.get('text_en', ''))
-    price_text = _extract_price_from_text(meal_data.get('text_en', ''))
-    
     with SessionLocal() as session:
         meal_log = MealLog(
             user_id=user_id,
@@ -141,14 +110,17 @@ def log_meal_pack(user_id: int, pack_id: str, meal_type: str) -> None:
             is_pack=True,
             pack_id=pack_id,
             pack_name=meal_data.get("name_en"),  # Use English name as default
-            calories=calories_text,
-            price=price_text,
+            calories=meal_data.get("calories_text"),
+            price=meal_data.get("price_text"),
             prep_time=meal_data.get("prep_time_min"),
             flags=meal_data.get("flags")
         )
         session.add(meal_log)
         session.commit()
 
+    from app.services.recommendations import request_user_refresh
+    request_user_refresh(user_id)
+
 
 def log_custom_meal(user_id: int, description: str, category: str, health_rating: str) -> None:
     """Log a custom meal choice."""
@@ -164,6 +136,9 @@ def log_custom_meal(user_id: int, description: str, category: str, health_rating
         session.add(meal_log)
         session.commit()
 
+    from app.services.recommendations import request_user_refresh
+    request_user_refresh(user_id)
+
 
 def get_meal_stats(user_id: int, days: int = 7) -> Dict:
     """Get meal statistics for the last N days."""
@@ -0,0 +1,195 @@
+"""
+Telegram file_id cache.
+
+The first time a local file is sent it is uploaded and the file_id from
+Telegram's response is stored under (path, sha256). Later sends pass the
+file_id instead of the bytes. If Telegram rejects a cached id the entry is
+dropped and the file is uploaded again.
+
+Lookups only read an in-memory copy of the table. The copy is reloaded once
+it is older than FILE_ID_TTL_SECONDS, so worker processes pick up file_ids
+that the scheduler leader pre-warmed or another worker uploaded. Reloads and
+table writes run in order on one background thread, never on the event
+loop; `load_file_ids()` does the first load at startup.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import FSInputFile, Message
+
+from app.database import SessionLocal
+from app.models.media_file import MediaFile
+from app.services.media_manifest import lookup_sha256, media_key
+
+logger = logging.getLogger(__name__)
+
+MediaSend = Callable[[Union[str, FSInputFile]], Awaitable[Any]]
+
+FILE_ID_TTL_SECONDS = 60
+
+# (path, sha256) -> file_id, mirrored from the media_files table
+_file_ids: Optional[Dict[Tuple[str, str], str]] = None
+_loaded_at = 0.0
+_reloading = False
+# One thread, so a reload never overtakes a queued write
+_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="media-cache")
+
+# path -> ((size, mtime_ns), sha256) so unchanged files are hashed once
+_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def file_sha256(path: str) -> str:
+    """Content hash of a file: from the media manifest, or hashed once per size/mtime."""
+    sha256 = lookup_sha256(path)
+    if sha256:
+        return sha256
+    st = os.stat(path)
+    stamp = (st.st_size, st.st_mtime_ns)
+    cached = _hashes.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    _hashes[path] = (stamp, digest.hexdigest())
+    return _hashes[path][1]
+
+
+def _reload() -> None:
+    global _file_ids, _loaded_at, _reloading
+    try:
+        with SessionLocal() as session:
+            rows = session.query(MediaFile.path, MediaFile.sha256, MediaFile.file_id).all()
+        _file_ids = {(path, sha256): file_id for path, sha256, file_id in rows}
+        _loaded_at = time.monotonic()
+    except Exception as exc:
+        logger.error("Failed to load cached file_ids: %s", exc)
+    finally:
+        _reloading = False
+
+
+def _in_background(func: Callable[..., None], *args: Any) -> None:
+    """Run `func` on the media cache thread; inline when not on the event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        func(*args)
+        return
+    _worker.submit(func, *args)
+
+
+def _load() -> Dict[Tuple[str, str], str]:
+    global _reloading
+    if _file_ids is None:
+        _reload()
+    elif time.monotonic() - _loaded_at > FILE_ID_TTL_SECONDS and not _reloading:
+        # Serve the current copy; the fresh one replaces it when ready
+        _reloading = True
+        _in_background(_reload)
+    return _file_ids if _file_ids is not None else {}
+
+
+async def load_file_ids() -> None:
+    """Dispatcher startup hook: first load of the mirror, off the event loop."""
+    await asyncio.get_running_loop().run_in_executor(_worker, _load)
+
+
+def get_file_id(path: str, sha256: str) -> Optional[str]:
+    return _load().get((path, sha256))
+
+
+def _write_file_id(path: str, sha256: str, file_id: str) -> None:
+    try:
+        with SessionLocal() as session:
+            row = session.query(MediaFile).filter(MediaFile.path == path, MediaFile.sha256 == sha256).first()
+            if row:
+                row.file_id = file_id
+            else:
+                session.add(MediaFile(path=path, sha256=sha256, file_id=file_id))
+            session.commit()
+    except Exception as exc:
+        logger.error("Failed to store file_id for %s: %s", path, exc)
+
+
+def _delete_file_id(path: str, sha256: str) -> None:
+    try:
+        with SessionLocal() as session:
+            session.query(MediaFile).filter(MediaFile.path == path, MediaFile.sha256 == sha256).delete()
+            session.commit()
+    except Exception as exc:
+        logger.error("Failed to drop file_id for %s: %s", path, exc)
+
+
+def remember_file_id(path: str, sha256: str, file_id: str) -> None:
+    cache = _load()
+    if cache.get((path, sha256)) == file_id:
+        return
+    cache[(path, sha256)] = file_id
+    _in_background(_write_file_id, path, sha256, file_id)
+
+
+def forget_file_id(path: str, sha256: str) -> None:
+    _load().pop((path, sha256), None)
+    _in_background(_delete_file_id, path, sha256)
+
+
+def extract_file_id(result: Any) -> Optional[str]:
+    """file_id of the media in a sent/edited message (largest photo size)."""
+    if not isinstance(result, Message):
+        return None
+    if result.photo:
+        return result.photo[-1].file_id
+    for media in (result.animation, result.video, result.document):
+        if media is not None:
+            return media.file_id
+    return None
+
+
+def _is_stale_file_id(exc: TelegramBadRequest) -> bool:
+    text = str(exc).lower()
+    return "file" in text and ("identifier" in text or "reference" in text or "wrong" in text)
+
+
+def cached_file_id(path: str) -> Optional[str]:
+    """Cached file_id for the current content of a local file, if any."""
+    try:
+        return get_file_id(media_key(path), file_sha256(path))
+    except OSError:
+        return None
+
+
+async def send_cached(path: str, send: MediaSend, upload: bool = True) -> Any:
+    """Send a local file via `send`, using the cached file_id when there is one.
+
+    `send` receives either a file_id string or an FSInputFile and returns what
+    the Bot API call returned. With `upload=False` nothing is uploaded: if
+    there is no usable file_id the result is None.
+    """
+    key = media_key(path)
+    sha256 = file_sha256(path)
+    file_id = get_file_id(key, sha256)
+    if file_id:
+        try:
+            return await send(file_id)
+        except TelegramBadRequest as exc:
+            if not _is_stale_file_id(exc):
+                raise
+            logger.warning("Cached file_id for %s rejected (%s), uploading again", key, exc)
+            forget_file_id(key, sha256)
+
+    if not upload:
+        return None
+    result = await send(FSInputFile(path))
+    new_file_id = extract_file_id(result)
+    if new_file_id:
+        remember_file_id(key, sha256, new_file_id)
+    return result
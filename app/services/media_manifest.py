@@ -0,0 +1,141 @@
+"""
+Media manifest.
+
+Built once at startup from every media reference in the meals and workouts
+catalogs: the file that will actually be served (optimized variant when
+available), its size, sha256 and cache key. Request-time lookups are dict
+hits on the served path as the manifest returned it; only paths from outside
+the manifest are resolved on disk. Broken references are reported once at
+boot.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from app.services.content import ROOT, WORKOUTS_MEDIA_DIR
+
+logger = logging.getLogger(__name__)
+
+_manifest: Optional["MediaManifest"] = None
+
+
+@dataclass(frozen=True)
+class MediaEntry:
+    ref: str                 # reference as written in the catalog
+    path: Optional[Path]     # resolved file to send; None if missing
+    size: int = 0
+    sha256: Optional[str] = None
+    key: Optional[str] = None  # served path relative to ROOT (media_key)
+
+
+@dataclass
+class MediaManifest:
+    meals: Dict[str, MediaEntry] = field(default_factory=dict)     # image ref -> entry
+    workouts: Dict[str, MediaEntry] = field(default_factory=dict)  # media filename -> entry
+    by_key: Dict[str, MediaEntry] = field(default_factory=dict)    # served path relative to ROOT -> entry
+    by_path: Dict[str, MediaEntry] = field(default_factory=dict)   # str(served path) -> entry
+    missing: List[str] = field(default_factory=list)
+    total_bytes: int = 0
+
+
+def media_key(path: Union[str, Path]) -> str:
+    """Path relative to the project root, with forward slashes."""
+    entry = get_media_manifest().by_path.get(str(path))
+    if entry is not None:
+        return entry.key  # type: ignore[return-value]
+    return _relative_key(path)
+
+
+def _relative_key(path: Union[str, Path]) -> str:
+    path = Path(path)
+    if not path.is_absolute():
+        path = Path.cwd() / path
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _entry(ref: str, candidates: List[Path], manifest: MediaManifest, label: str) -> MediaEntry:
+    for path in candidates:
+        if path.is_file():
+            key = _relative_key(path)
+            entry = MediaEntry(ref=ref, path=path, size=path.stat().st_size, sha256=_sha256(path), key=key)
+            manifest.by_key[key] = entry
+            manifest.by_path[str(path)] = entry
+            manifest.total_bytes += entry.size
+            return entry
+    manifest.missing.append(f"{label}: {ref}")
+    return MediaEntry(ref=ref, path=None)
+
+
+def build_media_manifest() -> MediaManifest:
+    """Resolve, stat and hash every media file referenced by the catalogs."""
+    from app.services.content import _read_workouts_json
+    from app.services.media_pipeline import optimized_variant
+    from app.services.meals import load_meals_data
+
+    manifest = MediaManifest()
+    for meals in load_meals_data().values():
+        for meal in meals:
+            ref = meal.get("image")
+            if not ref or ref in manifest.meals:
+                continue
+            candidates = [p for p in (optimized_variant(ref), ROOT / ref) if p is not None]
+            manifest.meals[ref] = _entry(ref, candidates, manifest, f"meal {meal.get('id')}")
+
+    for group, items in _read_workouts_json().items():
+        if not isinstance(items, list):
+            continue
+        for item in items:
+            ref = item.get("media") if isinstance(item, dict) else None
+            if not ref or ref in manifest.workouts:
+                continue
+            manifest.workouts[ref] = _entry(ref, [WORKOUTS_MEDIA_DIR / ref], manifest, f"workout {group}")
+    return manifest
+
+
+def get_media_manifest() -> MediaManifest:
+    """Return the media manifest, building it on first use."""
+    global _manifest
+    if _manifest is None:
+        _manifest = build_media_manifest()
+    return _manifest
+
+
+def install_media_manifest(manifest: MediaManifest) -> None:
+    """Use a manifest built elsewhere (by the front process for shard workers)."""
+    global _manifest
+    _manifest = manifest
+
+
+def load_media_manifest() -> MediaManifest:
+    """Build the manifest at startup and log a summary of broken references."""
+    manifest = get_media_manifest()
+    found = len(manifest.by_key)
+    logger.info(
+        "Media manifest: %d files (%.1f MB), %d missing",
+        found, manifest.total_bytes / (1024 * 1024), len(manifest.missing),
+    )
+    for ref in manifest.missing:
+        logger.warning("Missing media file for %s", ref)
+    return manifest
+
+
+def lookup_sha256(path: Union[str, Path]) -> Optional[str]:
+    """Content hash recorded for a served media file, if it is in the manifest."""
+    manifest = get_media_manifest()
+    entry = manifest.by_path.get(str(path)) or manifest.by_key.get(_relative_key(path))
+    return entry.sha256 if entry else None
@@ -0,0 +1,186 @@
+"""
+Meal image optimization.
+
+`optimize_meal_media()` turns every source image under media/meals into
+size-capped variants under media/optimized/meals:
+
+- `<name>.jpg`       progressive JPEG, longest side <= 1280 px (what Telegram displays);
+- `<name>.webp`      WebP of the same size;
+- `<name>.thumb.jpg` 320 px thumbnail.
+
+Results are recorded in media/optimized/manifest.json together with the
+source's sha256, so a rerun only reprocesses images whose content changed.
+Pillow is only needed to run the pipeline, not to serve its output.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.services.content import ROOT, MEALS_MEDIA_DIR
+
+OPTIMIZED_DIR = ROOT / "media" / "optimized"
+MANIFEST_PATH = OPTIMIZED_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+SOURCE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+MAX_SIDE = 1280
+THUMB_SIDE = 320
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+THUMB_QUALITY = 75
+
+logger = logging.getLogger(__name__)
+
+_manifest: Optional[Dict] = None
+
+
+@dataclass
+class PipelineReport:
+    processed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+    source_bytes: int = 0
+    output_bytes: int = 0
+
+
+def _rel(path: Path) -> str:
+    return path.relative_to(ROOT).as_posix()
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _variant_paths(source: Path) -> Dict[str, Path]:
+    base = OPTIMIZED_DIR / source.relative_to(ROOT / "media").with_suffix("")
+    return {
+        "jpeg": base.with_suffix(".jpg"),
+        "webp": base.with_suffix(".webp"),
+        "thumb": base.with_name(base.name + ".thumb.jpg"),
+    }
+
+
+def read_manifest() -> Dict:
+    """Manifest from disk (empty if missing or unreadable)."""
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {"version": MANIFEST_VERSION, "files": {}}
+
+
+def _write_manifest(manifest: Dict) -> None:
+    OPTIMIZED_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    tmp_path.replace(MANIFEST_PATH)
+
+
+def _render_variants(source: Path, variants: Dict[str, Path]) -> Dict:
+    from PIL import Image  # pipeline-only dependency
+
+    with Image.open(source) as img:
+        img.load()
+        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+            rgba = img.convert("RGBA")
+            flat = Image.new("RGB", rgba.size, (255, 255, 255))
+            flat.paste(rgba, mask=rgba.split()[-1])
+            img = flat
+        else:
+            img = img.convert("RGB")
+
+        full = img.copy()
+        full.thumbnail((MAX_SIDE, MAX_SIDE), Image.LANCZOS)
+        thumb = img.copy()
+        thumb.thumbnail((THUMB_SIDE, THUMB_SIDE), Image.LANCZOS)
+
+    variants["jpeg"].parent.mkdir(parents=True, exist_ok=True)
+    full.save(variants["jpeg"], "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    full.save(variants["webp"], "WEBP", quality=WEBP_QUALITY, method=6)
+    thumb.save(variants["thumb"], "JPEG", quality=THUMB_QUALITY, optimize=True)
+
+    return {
+        "width": full.width,
+        "height": full.height,
+        "variants": {
+            name: {"path": _rel(path), "bytes": path.stat().st_size}
+            for name, path in variants.items()
+        },
+    }
+
+
+def optimize_meal_media(force: bool = False) -> PipelineReport:
+    """Generate variants for new or changed meal images and update the manifest."""
+    report = PipelineReport()
+    manifest = read_manifest()
+    files: Dict[str, Dict] = manifest["files"]
+    sources = sorted(
+        p for p in MEALS_MEDIA_DIR.rglob("*")
+        if p.is_file() and p.suffix.lower() in SOURCE_EXTENSIONS
+    ) if MEALS_MEDIA_DIR.exists() else []
+
+    seen = set()
+    for source in sources:
+        rel = _rel(source)
+        seen.add(rel)
+        sha256 = _sha256(source)
+        variants = _variant_paths(source)
+        entry = files.get(rel)
+        report.source_bytes += source.stat().st_size
+        if (
+            not force and entry and entry.get("sha256") == sha256
+            and all(path.is_file() for path in variants.values())
+        ):
+            report.skipped.append(rel)
+            report.output_bytes += entry["variants"]["jpeg"]["bytes"]
+            continue
+        try:
+            entry = _render_variants(source, variants)
+        except Exception as exc:
+            report.failed[rel] = str(exc)
+            continue
+        entry["sha256"] = sha256
+        entry["source_bytes"] = source.stat().st_size
+        files[rel] = entry
+        report.processed.append(rel)
+        report.output_bytes += entry["variants"]["jpeg"]["bytes"]
+
+    for rel in sorted(set(files) - seen):
+        for variant in files[rel]["variants"].values():
+            (ROOT / variant["path"]).unlink(missing_ok=True)
+        del files[rel]
+        report.removed.append(rel)
+
+    _write_manifest(manifest)
+    global _manifest
+    _manifest = None
+    return report
+
+
+def optimized_variant(filename: str, variant: str = "jpeg") -> Optional[Path]:
+    """Optimized variant of a source image (path relative to ROOT), if generated."""
+    global _manifest
+    if _manifest is None:
+        _manifest = read_manifest()
+    entry = _manifest["files"].get(filename)
+    if not entry:
+        return None
+    info = entry["variants"].get(variant)
+    if not info:
+        return None
+    path = ROOT / info["path"]
+    return path if path.is_file() else None
@@ -0,0 +1,153 @@
+"""
+Media pre-warm.
+
+At startup every meal image and workout animation of the catalog is uploaded
+to a private storage chat (MEDIA_STORAGE_CHAT_ID) so its file_id is cached
+before any user asks for it. User-facing handlers send through
+`send_prewarmed`, which only ever uses cached file_ids: on a miss it returns
+None (the caller shows text) and queues a background upload.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, List, Optional, Set
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.types import FSInputFile
+
+from app.config import MEDIA_STORAGE_CHAT_ID
+from app.services.content import get_meal_media_path, get_workouts_catalog
+from app.services.media_cache import (
+    MediaSend,
+    cached_file_id,
+    extract_file_id,
+    file_sha256,
+    media_key,
+    remember_file_id,
+    send_cached,
+)
+from app.services.meals import load_meals_data
+from app.services.overload import is_degraded
+
+logger = logging.getLogger(__name__)
+
+PREWARM_CONCURRENCY = 3
+ANIMATION_EXTENSIONS = {".gif", ".mp4"}
+
+_semaphore: Optional[asyncio.Semaphore] = None
+_pending: Set[str] = set()
+_tasks: Set[asyncio.Task] = set()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(PREWARM_CONCURRENCY)
+    return _semaphore
+
+
+def catalog_media_paths() -> List[str]:
+    """Existing media files referenced by the meals and workouts catalogs."""
+    paths = []
+    for meals in load_meals_data().values():
+        for meal in meals:
+            image = get_meal_media_path(meal.get("image"))
+            if image and str(image) not in paths:
+                paths.append(str(image))
+    for exercises in get_workouts_catalog().values():
+        for exercise in exercises:
+            path = exercise.get("media_path")
+            if path and str(path) not in paths:
+                paths.append(str(path))
+    return paths
+
+
+async def upload_to_storage(bot: Bot, path: str) -> Optional[str]:
+    """Upload one file to the storage chat and cache its file_id."""
+    if MEDIA_STORAGE_CHAT_ID is None:
+        return None
+    file_id = cached_file_id(path)
+    if file_id:
+        return file_id
+    is_animation = os.path.splitext(path)[1].lower() in ANIMATION_EXTENSIONS
+    async with _get_semaphore():
+        for _ in range(3):
+            try:
+                if is_animation:
+                    result = await bot.send_animation(MEDIA_STORAGE_CHAT_ID, FSInputFile(path), disable_notification=True)
+                else:
+                    result = await bot.send_photo(MEDIA_STORAGE_CHAT_ID, FSInputFile(path), disable_notification=True)
+                break
+            except TelegramRetryAfter as exc:
+                await asyncio.sleep(exc.retry_after)
+            except Exception as exc:
+                logger.error("Failed to upload %s to storage chat: %s", path, exc)
+                return None
+        else:
+            return None
+    file_id = extract_file_id(result)
+    if file_id:
+        remember_file_id(media_key(path), file_sha256(path), file_id)
+    return file_id
+
+
+async def prewarm_media(bot: Bot) -> int:
+    """Upload every catalog file that has no cached file_id yet."""
+    if MEDIA_STORAGE_CHAT_ID is None:
+        logger.info("MEDIA_STORAGE_CHAT_ID is not set, media pre-warm skipped")
+        return 0
+    missing = [path for path in catalog_media_paths() if not cached_file_id(path)]
+    if not missing:
+        logger.info("Media pre-warm: all files already cached")
+        return 0
+    logger.info("Media pre-warm: uploading %d files", len(missing))
+    results = await asyncio.gather(*(upload_to_storage(bot, path) for path in missing))
+    uploaded = sum(1 for file_id in results if file_id)
+    logger.info("Media pre-warm finished: %d/%d uploaded", uploaded, len(missing))
+    return uploaded
+
+
+def _spawn(coro) -> None:
+    task = asyncio.create_task(coro)
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+def schedule_upload(bot: Bot, path: str) -> None:
+    """Queue a background upload of one file (deduplicated)."""
+    if MEDIA_STORAGE_CHAT_ID is None or path in _pending:
+        return
+    _pending.add(path)
+
+    async def _run():
+        try:
+            await upload_to_storage(bot, path)
+        finally:
+            _pending.discard(path)
+
+    _spawn(_run())
+
+
+async def start_media_prewarm(bot: Bot) -> None:
+    """Dispatcher startup hook: run the pre-warm in the background."""
+    _spawn(prewarm_media(bot))
+
+
+async def send_prewarmed(bot: Bot, path: str, send: MediaSend) -> Any:
+    """Send media by cached file_id only; None if it is not cached yet.
+
+    Without a storage chat configured there is nowhere to pre-warm to, so the
+    file is uploaded directly as before. While the bot is overloaded nothing
+    is uploaded: callers fall back to a text screen.
+    """
+    if is_degraded():
+        return await send_cached(path, send, upload=False)
+    if MEDIA_STORAGE_CHAT_ID is None:
+        return await send_cached(path, send)
+    result = await send_cached(path, send, upload=False)
+    if result is None:
+        schedule_upload(bot, path)
+    return result
@@ -0,0 +1,95 @@
+"""
+In-place message editing helpers.
+
+Navigation edits the message the user tapped instead of deleting it and
+sending a new one. A text message can only be edited as text and a photo
+message only via its caption or media, so the helpers pick the right call.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Optional, Set
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import InputMediaAnimation, InputMediaPhoto, Message
+
+from app.services.media_prewarm import send_prewarmed
+
+logger = logging.getLogger(__name__)
+
+_tasks: Set[asyncio.Task] = set()
+
+
+def has_media(message: Message) -> bool:
+    return bool(message.photo or message.animation or message.video or message.document)
+
+
+async def _delete(message: Message) -> None:
+    try:
+        await message.delete()
+    except Exception as exc:
+        logger.debug("Failed to delete message %s: %s", message.message_id, exc)
+
+
+def delete_in_background(message: Message) -> None:
+    """Delete a message without making the user wait for it."""
+    task = asyncio.create_task(_delete(message))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def edit_screen(message: Message, text: str, reply_markup: Any = None) -> None:
+    """Replace the message's text (or caption, for media messages) and keyboard."""
+    try:
+        if has_media(message):
+            await message.edit_caption(caption=text, reply_markup=reply_markup)
+        else:
+            await message.edit_text(text, reply_markup=reply_markup)
+    except TelegramBadRequest as exc:
+        if "message is not modified" not in str(exc):
+            raise
+
+
+async def replace_with_text(message: Message, text: str, reply_markup: Any = None) -> None:
+    """Show a text screen: edit in place for text messages, resend for media ones."""
+    if has_media(message):
+        await message.answer(text, reply_markup=reply_markup)
+        delete_in_background(message)
+    else:
+        await edit_screen(message, text, reply_markup)
+
+
+async def show_photo(bot: Bot, message: Message, path: str, caption: str, reply_markup: Any = None) -> Optional[Message]:
+    """Show a photo in place of `message`, by cached file_id.
+
+    A photo message gets one edit_media call; a text message is replaced by a
+    new photo message. Returns None when the photo is not available yet.
+    """
+    if message.photo:
+        result = await send_prewarmed(bot, path, lambda media: message.edit_media(
+            InputMediaPhoto(media=media, caption=caption), reply_markup=reply_markup
+        ))
+    else:
+        result = await send_prewarmed(bot, path, lambda photo: message.answer_photo(
+            photo=photo, caption=caption, reply_markup=reply_markup
+        ))
+        if result is not None:
+            delete_in_background(message)
+    return result
+
+
+async def show_animation(bot: Bot, message: Message, path: str, caption: str, reply_markup: Any = None) -> Optional[Message]:
+    """Same as `show_photo` for GIF animations."""
+    if message.animation:
+        result = await send_prewarmed(bot, path, lambda media: message.edit_media(
+            InputMediaAnimation(media=media, caption=caption), reply_markup=reply_markup
+        ))
+    else:
+        result = await send_prewarmed(bot, path, lambda animation: message.answer_animation(
+            animation=animation, caption=caption, reply_markup=reply_markup
+        ))
+        if result is not None:
+            delete_in_background(message)
+    return result
@@ -0,0 +1,203 @@
+"""
+Overload controller.
+
+During a reminder burst or a broadcast every interactive handler slows
+down. A monitor task samples three signals once a second:
+
+- event-loop lag: how late short timed sleeps wake up;
+- DB latency: mean statement time per check, smoothed across checks (an
+  idle check counts as zero, so the signal decays once traffic drops);
+- outbound depth: Telegram API requests started and not yet answered.
+
+When any signal passes its threshold the bot enters degraded mode and
+handlers take cheaper paths: media goes out only by cached file_id (never
+uploaded), progress screens come from the last snapshot, and non-critical
+writes such as `log_notification` are queued instead of run (past
+DEFERRED_LIMIT queued writes they run right away again). Once every
+signal stays below half its threshold for RECOVERY_SECONDS the bot leaves
+degraded mode and the queued writes are run in the background.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, NamedTuple, Optional, Tuple
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
+from sqlalchemy import event
+
+from app.config import OVERLOAD_DB_LATENCY_MS, OVERLOAD_LOOP_LAG_MS, OVERLOAD_OUTBOUND_REQUESTS
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+CHECK_INTERVAL_SECONDS = 1.0
+LAG_PROBE_SECONDS = 0.1
+RECOVERY_SECONDS = 15.0
+DEFERRED_LIMIT = 10_000
+# Weight of the latest check window in the DB latency moving average
+_DB_EWMA_ALPHA = 0.5
+
+
+class LoadSignals(NamedTuple):
+    loop_lag_ms: float
+    db_latency_ms: float
+    outbound: int
+
+
+_degraded = False
+_degraded_since: Optional[float] = None
+_calm_since: Optional[float] = None
+_signals = LoadSignals(0.0, 0.0, 0)
+_db_latency_ms = 0.0
+# Statement time and count since the previous check
+_db_time_ms = 0.0
+_db_statements = 0
+_outbound = 0
+_deferred: Deque[Tuple[Callable[..., Any], Tuple[Any, ...]]] = deque()
+_overflow_logged = False
+_monitor: Optional[asyncio.Task] = None
+
+
+def is_degraded() -> bool:
+    return _degraded
+
+
+def run_or_defer(func: Callable[..., Any], *args: Any) -> None:
+    """Call `func(*args)` now, or later if the bot is in degraded mode.
+
+    Only for writes nothing reads back right away. Thread-safe: the reminder
+    jobs call it from scheduler threads.
+    """
+    global _overflow_logged
+    if _degraded and len(_deferred) < DEFERRED_LIMIT:
+        _deferred.append((func, args))
+        return
+    if _degraded and not _overflow_logged:
+        _overflow_logged = True
+        logger.warning("Overload: %d writes deferred, running further writes right away", len(_deferred))
+    func(*args)
+
+
+def run_deferred() -> int:
+    """Run the queued writes (blocking); returns how many ran."""
+    done = 0
+    while _deferred:
+        func, args = _deferred.popleft()
+        try:
+            func(*args)
+        except Exception:
+            logger.exception("Deferred write %s failed", getattr(func, "__name__", func))
+        done += 1
+    return done
+
+
+# --- signals ---
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info["overload_started"] = time.perf_counter()
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    global _db_time_ms, _db_statements
+    started = conn.info.pop("overload_started", None)
+    if started is None:
+        return
+    _db_time_ms += (time.perf_counter() - started) * 1000
+    _db_statements += 1
+
+
+def _db_latency() -> float:
+    """Fold the statements since the previous check into the moving average."""
+    global _db_latency_ms, _db_time_ms, _db_statements
+    window_ms = _db_time_ms / _db_statements if _db_statements else 0.0
+    _db_time_ms, _db_statements = 0.0, 0
+    _db_latency_ms += _DB_EWMA_ALPHA * (window_ms - _db_latency_ms)
+    return _db_latency_ms
+
+
+def _install_db_timing() -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_execute):
+        event.listen(engine, "before_cursor_execute", _before_execute)
+        event.listen(engine, "after_cursor_execute", _after_execute)
+
+
+class OutboundRequestCounter(BaseRequestMiddleware):
+    """Bot session middleware counting Telegram requests in flight."""
+
+    async def __call__(self, make_request, bot, method):
+        global _outbound
+        _outbound += 1
+        try:
+            return await make_request(bot, method)
+        finally:
+            _outbound -= 1
+
+
+# --- controller ---
+
+def _update(signals: LoadSignals, now: float) -> None:
+    global _degraded, _degraded_since, _calm_since, _signals, _overflow_logged
+    _signals = signals
+    limits = (OVERLOAD_LOOP_LAG_MS, OVERLOAD_DB_LATENCY_MS, OVERLOAD_OUTBOUND_REQUESTS)
+    if any(value > limit for value, limit in zip(signals, limits)):
+        _calm_since = None
+        if not _degraded:
+            _degraded, _degraded_since = True, now
+            logger.warning("Overload: entering degraded mode (%s)", signals)
+        return
+    if not _degraded:
+        return
+    if any(value > limit / 2 for value, limit in zip(signals, limits)):
+        _calm_since = None
+    elif _calm_since is None:
+        _calm_since = now
+    elif now - _calm_since >= RECOVERY_SECONDS:
+        _degraded, _degraded_since, _calm_since = False, None, None
+        _overflow_logged = False
+        logger.info("Overload: load dropped, leaving degraded mode (%d deferred writes)", len(_deferred))
+        asyncio.get_running_loop().run_in_executor(None, run_deferred)
+
+
+async def _monitor_loop() -> None:
+    loop = asyncio.get_running_loop()
+    probes = max(1, round(CHECK_INTERVAL_SECONDS / LAG_PROBE_SECONDS))
+    while True:
+        # Worst lag of several short sleeps, so a stall anywhere in the interval shows up
+        lag_ms = 0.0
+        for _ in range(probes):
+            started = loop.time()
+            await asyncio.sleep(LAG_PROBE_SECONDS)
+            lag_ms = max(lag_ms, (loop.time() - started - LAG_PROBE_SECONDS) * 1000)
+        _update(LoadSignals(lag_ms, _db_latency(), _outbound), time.monotonic())
+
+
+async def start_overload_monitor() -> None:
+    """Dispatcher startup hook."""
+    global _monitor
+    _install_db_timing()
+    if _monitor is None:
+        _monitor = asyncio.create_task(_monitor_loop())
+
+
+async def stop_overload_monitor() -> None:
+    """Dispatcher shutdown hook: stop sampling and run the queued writes."""
+    global _monitor
+    if _monitor is not None:
+        _monitor.cancel()
+        _monitor = None
+    if _deferred:
+        await asyncio.to_thread(run_deferred)
+
+
+def overload_status() -> Dict[str, Any]:
+    return {
+        "degraded": _degraded,
+        "degraded_for_s": round(time.monotonic() - _degraded_since, 1) if _degraded_since is not None else None,
+        "loop_lag_ms": round(_signals.loop_lag_ms, 1),
+        "db_latency_ms": round(_signals.db_latency_ms, 1),
+        "outbound": _signals.outbound,
+        "deferred_writes": len(_deferred),
+    }
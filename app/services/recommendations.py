@@ -0,0 +1,247 @@
+"""
+Personal meal pack recommendations.
+
+Packs of the user's budget are scored from their history and stored as a
+ranked list in `MealRecommendation`:
+
+- repeat preference: packs the user logged before rank higher;
+- category affinity: categories the user logs often (packs or custom meals);
+- skipped categories: categories whose meal reminders the user skips;
+- health nudge: where the user's custom meals are rated unhealthy, lighter
+  packs of that category rank higher.
+
+`refresh_all_recommendations()` runs nightly and aggregates the history of all
+users with a few GROUP BY queries; `request_user_refresh()` re-scores one
+user in a worker thread after a new log. The pack grid then needs a single
+row lookup.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+
+from app.database import SessionLocal
+from app.models.meal_log import MealLog, UserMealSettings
+from app.models.meal_recommendation import MealRecommendation
+from app.models.notification_log import NotificationLog
+from app.models.user import User
+from app.services.meals import get_meals_by_budget, get_meals_by_category
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DAYS = 60
+CATEGORIES = ("breakfast", "lunch", "dinner")
+
+REPEAT_WEIGHT = 3.0
+CATEGORY_WEIGHT = 1.0
+SKIP_WEIGHT = 1.0
+HEALTH_WEIGHT = 1.5
+
+
+@dataclass
+class _History:
+    pack_counts: Dict[str, int] = field(default_factory=dict)
+    category_counts: Dict[str, int] = field(default_factory=dict)
+    unhealthy_counts: Dict[str, int] = field(default_factory=dict)
+    custom_counts: Dict[str, int] = field(default_factory=dict)
+    reminders_sent: Dict[str, int] = field(default_factory=dict)  # reminders delivered, not responses
+    reminders_skipped: Dict[str, int] = field(default_factory=dict)
+
+
+def _lightness_by_pack(budget_level: str) -> Dict[str, float]:
+    """0..1 per pack: 1 for the lightest pack of its category, 0 for the heaviest."""
+    by_category: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+    for meal in get_meals_by_budget(budget_level):
+        if meal.get("kcal") is not None:
+            by_category[meal.get("category")].append((meal["id"], meal["kcal"]))
+    lightness: Dict[str, float] = {}
+    for items in by_category.values():
+        lo = min(k for _, k in items)
+        hi = max(k for _, k in items)
+        for pack_id, kcal in items:
+            lightness[pack_id] = (hi - kcal) / (hi - lo) if hi > lo else 0.0
+    return lightness
+
+
+def rank_packs(budget_level: str, history: _History) -> List[str]:
+    """Pack ids of a budget ordered by descending score (catalog order on ties)."""
+    meals = get_meals_by_budget(budget_level)
+    lightness = _lightness_by_pack(budget_level)
+    total_logs = sum(history.category_counts.values()) or 1
+
+    category_score: Dict[str, float] = {}
+    for category in CATEGORIES:
+        affinity = history.category_counts.get(category, 0) / total_logs
+        sent = history.reminders_sent.get(category, 0)
+        # Capped: a skip can answer a reminder sent before the history window
+        skip_rate = min(1.0, history.reminders_skipped.get(category, 0) / sent) if sent else 0.0
+        category_score[category] = CATEGORY_WEIGHT * affinity - SKIP_WEIGHT * skip_rate
+
+    scored = []
+    for order, meal in enumerate(meals):
+        pack_id = meal["id"]
+        category = meal.get("category")
+        custom = history.custom_counts.get(category, 0)
+        unhealthy_share = history.unhealthy_counts.get(category, 0) / custom if custom else 0.0
+        score = (
+            REPEAT_WEIGHT * math.log1p(history.pack_counts.get(pack_id, 0))
+            + category_score.get(category, 0.0)
+            + HEALTH_WEIGHT * unhealthy_share * lightness.get(pack_id, 0.0)
+        )
+        scored.append((-score, order, pack_id))
+    scored.sort()
+    return [pack_id for _, _, pack_id in scored]
+
+
+def _load_histories(session, user_ids: Optional[Iterable[int]] = None) -> Dict[int, _History]:
+    """Aggregate meal logs and reminder reactions per user with GROUP BY queries."""
+    since = datetime.utcnow() - timedelta(days=HISTORY_DAYS)
+    histories: Dict[int, _History] = defaultdict(_History)
+
+    def scoped(query, column):
+        return query.filter(column.in_(list(user_ids))) if user_ids is not None else query
+
+    packs = scoped(session.query(MealLog.user_id, MealLog.pack_id, func.count(MealLog.id)), MealLog.user_id).filter(
+        MealLog.is_pack.is_(True), MealLog.created_at >= since
+    ).group_by(MealLog.user_id, MealLog.pack_id)
+    for user_id, pack_id, count in packs:
+        histories[user_id].pack_counts[pack_id] = count
+
+    meals = scoped(session.query(
+        MealLog.user_id, MealLog.meal_type, MealLog.is_pack, MealLog.health_rating, func.count(MealLog.id)
+    ), MealLog.user_id).filter(
+        MealLog.created_at >= since
+    ).group_by(MealLog.user_id, MealLog.meal_type, MealLog.is_pack, MealLog.health_rating)
+    for user_id, meal_type, is_pack, health_rating, count in meals:
+        history = histories[user_id]
+        history.category_counts[meal_type] = history.category_counts.get(meal_type, 0) + count
+        if not is_pack:
+            history.custom_counts[meal_type] = history.custom_counts.get(meal_type, 0) + count
+            if health_rating == "unhealthy":
+                history.unhealthy_counts[meal_type] = history.unhealthy_counts.get(meal_type, 0) + count
+
+    reminders = scoped(session.query(
+        NotificationLog.user_id, NotificationLog.notification_type, NotificationLog.action, func.count(NotificationLog.id)
+    ), NotificationLog.user_id).filter(
+        NotificationLog.notification_type.in_(CATEGORIES), NotificationLog.created_at >= since
+    ).group_by(NotificationLog.user_id, NotificationLog.notification_type, NotificationLog.action)
+    for user_id, category, action, count in reminders:
+        history = histories[user_id]
+        # A sent reminder is logged without an action; logged/skipped rows are the user's responses
+        if action is None:
+            history.reminders_sent[category] = history.reminders_sent.get(category, 0) + count
+        elif action == "skipped":
+            history.reminders_skipped[category] = history.reminders_skipped.get(category, 0) + count
+
+    return histories
+
+
+def _load_budgets(session, user_ids: Optional[Iterable[int]] = None) -> Dict[int, str]:
+    """Budget per user: meal settings first, then the onboarding answer."""
+    budgets: Dict[int, str] = {}
+    users = session.query(User.tg_id, User.budget).filter(User.budget.isnot(None))
+    settings = session.query(UserMealSettings.user_id, UserMealSettings.budget_level)
+    if user_ids is not None:
+        users = users.filter(User.tg_id.in_(list(user_ids)))
+        settings = settings.filter(UserMealSettings.user_id.in_(list(user_ids)))
+    for tg_id, budget in users:
+        budgets[tg_id] = budget
+    for user_id, budget in settings:
+        if budget:
+            budgets[user_id] = budget
+    return budgets
+
+
+def _store(session, user_id: int, budget_level: str, ranked: List[str]) -> None:
+    row = session.query(MealRecommendation).filter(MealRecommendation.user_id == user_id).first()
+    if row is None:
+        row = MealRecommendation(user_id=user_id)
+        session.add(row)
+    row.budget_level = budget_level
+    row.ranked_pack_ids = ",".join(ranked)
+    row.updated_at = datetime.utcnow()
+
+
+def refresh_all_recommendations() -> int:
+    """Nightly batch: re-rank packs for every user with history or a budget."""
+    with SessionLocal() as session:
+        histories = _load_histories(session)
+        budgets = _load_budgets(session)
+        user_ids = set(histories) | set(budgets)
+        for user_id in user_ids:
+            budget = budgets.get(user_id, "mid")
+            _store(session, user_id, budget, rank_packs(budget, histories.get(user_id, _History())))
+        session.commit()
+    logger.info("Meal recommendations refreshed for %d users", len(user_ids))
+    return len(user_ids)
+
+
+def refresh_user_recommendations(user_id: int) -> None:
+    """Re-rank packs for one user, e.g. right after a new meal log."""
+    try:
+        with SessionLocal() as session:
+            history = _load_histories(session, [user_id]).get(user_id, _History())
+            budget = _load_budgets(session, [user_id]).get(user_id, "mid")
+            _store(session, user_id, budget, rank_packs(budget, history))
+            session.commit()
+    except Exception as exc:
+        logger.error("Failed to refresh recommendations for user_id=%s: %s", user_id, exc)
+
+
+# Users with a refresh queued in the executor; repeated taps share one refresh
+_pending_refresh: Set[int] = set()
+_pending_lock = threading.Lock()
+
+
+def _run_pending_refresh(user_id: int) -> None:
+    with _pending_lock:
+        _pending_refresh.discard(user_id)
+    refresh_user_recommendations(user_id)
+
+
+def request_user_refresh(user_id: int) -> None:
+    """Re-rank one user without blocking the event loop.
+
+    From async code the refresh runs in the default executor; logs made while
+    it is queued are picked up by the same run. Without a running loop (e.g.
+    a scheduler thread) it runs inline.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        refresh_user_recommendations(user_id)
+        return
+    with _pending_lock:
+        if user_id in _pending_refresh:
+            return
+        _pending_refresh.add(user_id)
+    loop.run_in_executor(None, _run_pending_refresh, user_id)
+
+
+def get_ranked_pack_ids(user_id: int, budget_level: str) -> Optional[List[str]]:
+    """Stored ranking for the user, or None if missing or computed for another budget."""
+    with SessionLocal() as session:
+        row = session.query(MealRecommendation.budget_level, MealRecommendation.ranked_pack_ids).filter(
+            MealRecommendation.user_id == user_id
+        ).first()
+    if row is None or row.budget_level != budget_level or not row.ranked_pack_ids:
+        return None
+    return row.ranked_pack_ids.split(",")
+
+
+def get_personalized_meals(user_id: int, budget_level: str, category: str) -> List[Dict]:
+    """Packs of a category in the user's personal order (catalog order without a ranking)."""
+    packs = get_meals_by_category(budget_level, category)
+    ranked = get_ranked_pack_ids(user_id, budget_level)
+    if not ranked:
+        return packs
+    position = {pack_id: i for i, pack_id in enumerate(ranked)}
+    return sorted(packs, key=lambda pack: position.get(pack["id"], len(position)))
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-from datetime import time as dtime
-from typing import Optional
+from datetime import datetime, time as dtime
+from typing import Callable, Dict, Optional, Tuple
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -16,32 +16,40 @@ from app.models.user_settings import UserSettings
 from app.models.meal_log import UserMealSettings
 from app.models.notification_log import NotificationLog
 from app.services.i18n import t
+from app.services.overload import run_or_defer
 from app.services.sleep_tips import EVENING_REMINDER_TIME, MORNING_REMINDER_TIME
 
 
 logger = logging.getLogger(__name__)
 
-def log_notification(user_id: int, notification_type: str, action: str = None):
-    """Log notification to database."""
+def _write_notification_log(user_id: int, notification_type: str, action: Optional[str], at: datetime) -> None:
     try:
         with SessionLocal() as session:
-            from datetime import datetime
             log_entry = NotificationLog(
                 user_id=user_id,
                 notification_type=notification_type,
-                sent_at=datetime.now(),
+                sent_at=at,
                 responded=action is not None,
                 action=action,
-                created_at=datetime.now()
+                created_at=at
             )
             session.add(log_entry)
             session.commit()
     except Exception as e:
         logger.error("Failed to log notification: %s", e)
 
+
+def log_notification(user_id: int, notification_type: str, action: str = None):
+    """Log notification to database (deferred while the bot is overloaded)."""
+    run_or_defer(_write_notification_log, user_id, notification_type, action, datetime.now())
+
 _scheduler: Optional[BackgroundScheduler] = None
+_scheduler_leader = True
 _bot_instance = None
 
+# Per-user job ids are "<prefix>:<user_id>"
+USER_JOB_PREFIXES = ("reminder:", "sleep_evening:", "sleep_morning:", "meal_breakfast:", "meal_lunch:", "meal_dinner:")
+
 
 def set_bot_instance(bot):
     global _bot_instance
@@ -55,7 +63,20 @@ def get_scheduler() -> BackgroundScheduler:
     return _scheduler
 
 
+def set_scheduler_leader(is_leader: bool) -> None:
+    """With several bot processes only the leader runs scheduled jobs.
+
+    On other processes the schedule_* functions do nothing: their scheduler
+    never starts, so jobs added there would only pile up as pending. The
+    leader picks settings changes up from the database on its periodic resync.
+    """
+    global _scheduler_leader
+    _scheduler_leader = is_leader
+
+
 def start_scheduler() -> None:
+    if not _scheduler_leader:
+        return
     scheduler = get_scheduler()
     if not scheduler.running:
         scheduler.start()
@@ -89,7 +110,7 @@ def _reminder_job(user_id: int) -> None:
                 return
             lang = user.language or "ru"
         kb = InlineKeyboardBuilder()
-        kb.button(text=t(lang, "btn_start_workout"), callback_data="w:start_workout")
+        kb.button(text=t(lang, "btn_start_workout"), callback_data=pack_callback("w", "start_workout"))
         kb.adjust(1)
         text = f"{t(lang, 'notif.workout.line1')}\n{t(lang, 'notif.workout.line2')}"
         import asyncio
@@ -120,7 +141,7 @@ def _sleep_evening_job(user_id: int) -> None:
         name = user.name or "Friend"
         
         kb = InlineKeyboardBuilder()
-        kb.button(text=t(lang, "sleep.log_now"), callback_data="sleep:log")
+        kb.button(text=t(lang, "sleep.log_now"), callback_data=pack_callback("sleep", "log"))
         kb.adjust(1)
         
         text = t(lang, "sleep.evening_reminder")
@@ -173,8 +194,8 @@ def _sleep_morning_job(user_id: int) -> None:
         name = user.name or "Friend"
         
         kb = InlineKeyboardBuilder()
-        kb.button(text=t(lang, "sleep.yes_log"), callback_data="sleep:log")
-        kb.button(text=t(lang, "sleep.no_log"), callback_data="sleep:morning:no")
+        kb.button(text=t(lang, "sleep.yes_log"), callback_data=pack_callback("sleep", "log"))
+        kb.button(text=t(lang, "sleep.no_log"), callback_data=pack_callback("sleep", "morning", "no"))
         kb.adjust(2)
         
         text = t(lang, "sleep.morning_reminder")
@@ -217,6 +238,8 @@ def schedule_daily_reminder(user_id: int, when: str) -> None:
     hour = _TIME_MAP.get(when)
     if hour is None:
         raise ValueError(f"Unknown reminder time: {when}")
+    if not _scheduler_leader:
+        return
     scheduler = get_scheduler()
     job_id = f"reminder:{user_id}"
     trigger = CronTrigger(hour=hour, minute=0)
@@ -224,31 +247,137 @@ def schedule_daily_reminder(user_id: int, when: str) -> None:
     logger.info("Scheduled daily reminder for user_id=%s at %02d:00", user_id, hour)
 
 
+def schedule_recommendations_refresh() -> None:
+    """Re-rank meal packs for all users every night."""
+    from app.services.recommendations import refresh_all_recommendations
+
+    if not _scheduler_leader:
+        return
+    scheduler = get_scheduler()
+    scheduler.add_job(
+        refresh_all_recommendations,
+        trigger=CronTrigger(hour=3, minute=30),
+        id="recommendations:nightly",
+        replace_existing=True,
+    )
+    logger.info("Scheduled nightly meal recommendations refresh at 03:30")
+
+
 def load_and_schedule_all() -> None:
-    """Load all users that have reminder_time set and schedule their jobs."""
+    """Start the scheduler and schedule every job the database asks for."""
     start_scheduler()
-    with SessionLocal() as session:
-        users = session.query(User).filter(User.reminder_time.isnot(None)).all()
-        for u in users:
-            try:
-                schedule_daily_reminder(u.tg_id, u.reminder_time)
-            except Exception as exc:
-                logger.exception("Failed to schedule reminder for user_id=%s: %s", u.tg_id, exc)
+    if not _scheduler_leader:
+        return
+    schedule_recommendations_refresh()
+    _sync_user_jobs()
 
-        # Sleep schedules from user settings
+
+def resync_all_schedules() -> None:
+    """Pick up reminder settings changed by other processes."""
+    if _scheduler_leader:
+        _sync_user_jobs()
+
+
+def _parse_hhmm(value: str) -> Tuple[int, int]:
+    hour, minute = map(int, value.split(":"))
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"Time out of range: {value!r}")
+    return hour, minute
+
+
+def _evening_slot(sleep_time: str) -> Tuple[int, int]:
+    """Evening sleep reminder: one hour before bedtime."""
+    sh, sm = _parse_hhmm(sleep_time)
+    return (sh - 1) % 24, sm
+
+
+def _morning_slot(wake_time: str) -> Tuple[int, int]:
+    """Morning sleep check-in: five minutes after waking up."""
+    wh, wm = _parse_hhmm(wake_time)
+    return (wh + (wm + 5) // 60) % 24, (wm + 5) % 60
+
+
+def _wanted_user_jobs() -> Dict[str, Tuple[Callable[..., None], int, int, int]]:
+    """Per-user jobs the database asks for: job id -> (func, user_id, hour, minute)."""
+    with SessionLocal() as session:
+        reminder_times = dict(session.query(User.tg_id, User.reminder_time).all())
         settings = session.query(UserSettings).all()
-        for s in settings:
+
+    jobs: Dict[str, Tuple[Callable[..., None], int, int, int]] = {}
+    for user_id, when in reminder_times.items():
+        if when is None:
+            continue
+        if when not in _TIME_MAP:
+            logger.error("Unknown reminder time %r for user_id=%s", when, user_id)
+            continue
+        jobs[f"reminder:{user_id}"] = (_reminder_job, user_id, _TIME_MAP[when], 0)
+
+    for s in settings:
+        slots = []
+        if s.sleep_time:
+            slots.append(("sleep_evening", _sleep_evening_job, _evening_slot, s.sleep_time))
+        if s.wake_time:
+            slots.append(("sleep_morning", _sleep_morning_job, _morning_slot, s.wake_time))
+        # Meal reminders need the user row, as in schedule_meal_reminders
+        if s.user_id in reminder_times:
+            meals = (
+                ("meal_breakfast", _meal_breakfast_job, s.breakfast_time),
+                ("meal_lunch", _meal_lunch_job, s.lunch_time),
+                ("meal_dinner", _meal_dinner_job, s.dinner_time),
+            )
+            slots.extend((prefix, func, _parse_hhmm, value) for prefix, func, value in meals if value)
+        for prefix, func, parse, value in slots:
             try:
-                schedule_sleep_notifications(s.user_id, s.sleep_time, s.wake_time)
-                # Also schedule meal reminders for this user
-                schedule_meal_reminders(s.user_id)
-            except Exception as exc:
-                logger.exception("Failed to schedule sleep/meals for user_id=%s: %s", s.user_id, exc)
+                hour, minute = parse(value)
+            except ValueError:
+                logger.error("Invalid %s time %r for user_id=%s", prefix, value, s.user_id)
+                continue
+            jobs[f"{prefix}:{s.user_id}"] = (func, s.user_id, hour, minute)
+    return jobs
+
+
+def _sync_user_jobs() -> None:
+    """Bring the per-user jobs in line with the database.
+
+    Only jobs whose time changed are rescheduled and only jobs that are no
+    longer wanted are removed, so unchanged jobs keep their next fire time.
+    """
+    scheduler = get_scheduler()
+    wanted = _wanted_user_jobs()
+    current = {job.id: job for job in scheduler.get_jobs() if job.id.startswith(USER_JOB_PREFIXES)}
+
+    stale = current.keys() - wanted.keys()
+    for job_id in stale:
+        scheduler.remove_job(job_id)
+
+    added = moved = 0
+    for job_id, (func, user_id, hour, minute) in wanted.items():
+        trigger = CronTrigger(hour=hour, minute=minute)
+        job = current.get(job_id)
+        if job is None:
+            scheduler.add_job(func, trigger=trigger, id=job_id, kwargs={"user_id": user_id})
+            added += 1
+        elif str(job.trigger) != str(trigger):
+            scheduler.reschedule_job(job_id, trigger=trigger)
+            moved += 1
+    if added or moved or stale:
+        logger.info("Schedule sync: %d added, %d rescheduled, %d removed", added, moved, len(stale))
+
+
+def schedule_resync(minutes: int = 5) -> None:
+    get_scheduler().add_job(
+        resync_all_schedules,
+        trigger="interval",
+        minutes=minutes,
+        id="schedules:resync",
+        replace_existing=True,
+    )
+    logger.info("Scheduled reminder resync every %d minutes", minutes)
 
 
 def schedule_sleep_notifications(user_id: int, sleep_time: str | None, wake_time: str | None) -> None:
     """Schedule sleep notifications: evening (1 hour before sleep), morning (+5 min after wake)."""
-    if not sleep_time and not wake_time:
+    if not _scheduler_leader or (not sleep_time and not wake_time):
         return
     scheduler = get_scheduler()
     # cancel existing
@@ -260,10 +389,7 @@ def schedule_sleep_notifications(user_id: int, sleep_time: str | None, wake_time
             pass
 
     if sleep_time:
-        sh, sm = [int(x) for x in sleep_time.split(":")]
-        # 1 hour before
-        hour = (sh - 1) % 24
-        minute = sm
+        hour, minute = _evening_slot(sleep_time)
         scheduler.add_job(
             _sleep_evening_job,
             trigger=CronTrigger(hour=hour, minute=minute),
@@ -274,9 +400,7 @@ def schedule_sleep_notifications(user_id: int, sleep_time: str | None, wake_time
         logger.info("Scheduled sleep-evening for user=%s at %02d:%02d", user_id, hour, minute)
 
     if wake_time:
-        wh, wm = [int(x) for x in wake_time.split(":")]
-        minute = (wm + 5) % 60
-        hour = (wh + (wm + 5) // 60) % 24
+        hour, minute = _morning_slot(wake_time)
         scheduler.add_job(
             _sleep_morning_job,
             trigger=CronTrigger(hour=hour, minute=minute),
@@ -297,8 +421,8 @@ def _meal_breakfast_job(user_id: int):
     text = f"☀️ {t(lang, 'meals.reminder.breakfast')}"
     
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "meals.reminder.mark_now"), callback_data="meals:reminder:breakfast")
-    kb.button(text=t(lang, "meals.reminder.later"), callback_data="meals:reminder:later")
+    kb.button(text=t(lang, "meals.reminder.mark_now"), callback_data=pack_callback("meals", "reminder", "breakfast"))
+    kb.button(text=t(lang, "meals.reminder.later"), callback_data=pack_callback("meals", "reminder", "later"))
     kb.adjust(1)
     
     try:
@@ -359,8 +483,8 @@ def _meal_lunch_job(user_id: int):
     text = f"☀️ {t(lang, 'meals.reminder.lunch')}"
     
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "meals.reminder.mark_now"), callback_data="meals:reminder:lunch")
-    kb.button(text=t(lang, "meals.reminder.later"), callback_data="meals:reminder:later")
+    kb.button(text=t(lang, "meals.reminder.mark_now"), callback_data=pack_callback("meals", "reminder", "lunch"))
+    kb.button(text=t(lang, "meals.reminder.later"), callback_data=pack_callback("meals", "reminder", "later"))
     kb.adjust(1)
     
     try:
@@ -421,8 +545,8 @@ def _meal_dinner_job(user_id: int):
     text = f"🌙 {t(lang, 'meals.reminder.dinner')}"
     
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "meals.reminder.mark_now"), callback_data="meals:reminder:dinner")
-    kb.button(text=t(lang, "meals.reminder.later"), callback_data="meals:reminder:later")
+    kb.button(text=t(lang, "meals.reminder.mark_now"), callback_data=pack_callback("meals", "reminder", "dinner"))
+    kb.button(text=t(lang, "meals.reminder.later"), callback_data=pack_callback("meals", "reminder", "later"))
     kb.adjust(1)
     
     try:
@@ -476,6 +600,8 @@ def _meal_dinner_job(user_id: int):
 
 def schedule_meal_reminders(user_id: int):
     """Schedule meal reminders for user based on their settings."""
+    if not _scheduler_leader:
+        return
     with SessionLocal() as session:
         user = session.query(User).filter(User.tg_id == user_id).first()
         if not user:
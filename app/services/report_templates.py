@@ -0,0 +1,80 @@
+"""
+Report templates for text-heavy screens (progress, admin statistics).
+
+A screen used to be built by appending dozens of f-strings with a t() call
+in each. A ReportTemplate describes the screen once: `[[key]]` inserts a
+translation, `{slot}` a value from the stats dict, and a Section is shown
+only when its `when` slot is truthy (with optional `otherwise` text).
+
+On first use in a language the translations are resolved into format
+strings, and unconditional text is merged, so rendering is a few
+`str.format_map` calls. A missing slot falls back to a checked render that
+logs it.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from app.services.i18n import DEFAULT_LANG, compile_text, t
+
+_TEXT_REF = re.compile(r"\[\[([\w.]+)\]\]")
+
+
+class Section(NamedTuple):
+    body: str
+    when: Optional[str] = None  # slot that must be truthy to show `body`
+    otherwise: str = ""
+
+
+# (when, body, otherwise) format strings of one language; `when` is None for plain text
+Step = Tuple[Optional[str], str, str]
+
+
+def _resolve(text: str, lang: str) -> str:
+    def translate(match: "re.Match[str]") -> str:
+        # Translations are literal text here, not slots
+        return t(lang, match.group(1)).replace("{", "{{").replace("}", "}}")
+
+    return _TEXT_REF.sub(translate, text)
+
+
+class ReportTemplate:
+    """A screen layout resolved once per language into format strings."""
+
+    def __init__(self, *sections: Union[str, Section]) -> None:
+        self.sections = tuple(section if isinstance(section, Section) else Section(section) for section in sections)
+        self._steps: Dict[str, Tuple[Step, ...]] = {}
+
+    def _compile(self, lang: str) -> Tuple[Step, ...]:
+        steps: List[Step] = []
+        pending = ""  # unconditional text is merged into one step
+        for section in self.sections:
+            if section.when is None:
+                pending += _resolve(section.body, lang)
+                continue
+            if pending:
+                steps.append((None, pending, ""))
+                pending = ""
+            steps.append((section.when, _resolve(section.body, lang), _resolve(section.otherwise, lang)))
+        if pending:
+            steps.append((None, pending, ""))
+        return self._steps.setdefault(lang, tuple(steps))
+
+    def render(self, values: Mapping[str, Any], lang: str = DEFAULT_LANG) -> str:
+        steps = self._steps.get(lang) or self._compile(lang)
+        try:
+            return "".join(
+                (body if when is None or values[when] else otherwise).format_map(values)
+                for when, body, otherwise in steps
+            )
+        except KeyError:
+            return self._render_checked(steps, values)
+
+    @staticmethod
+    def _render_checked(steps: Tuple[Step, ...], values: Mapping[str, Any]) -> str:
+        out = []
+        for when, body, otherwise in steps:
+            part = compile_text(body if when is None or values.get(when) else otherwise)
+            out.append(part if type(part) is str else part.format(values))
+        return "".join(out)
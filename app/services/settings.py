@@ -6,20 +6,21 @@ from typing import Optional, Tuple
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from app.services.i18n import t
+from app.services.callback_protocol import pack_callback
 
 
 def build_settings_menu_kb(lang: str) -> InlineKeyboardBuilder:
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "btn_change_language"), callback_data="settings:lang")
+    kb.button(text=t(lang, "btn_change_language"), callback_data=pack_callback("settings", "lang"))
     kb.adjust(1)
     return kb
 
 
 def build_language_kb(lang: str) -> InlineKeyboardBuilder:
     kb = InlineKeyboardBuilder()
-    kb.button(text="🇷🇺 Русский", callback_data="lang:ru")
-    kb.button(text="🇺🇿 O‘zbekcha", callback_data="lang:uz")
-    kb.button(text="🇺🇸 English", callback_data="lang:en")
+    kb.button(text="🇷🇺 Русский", callback_data=pack_callback("lang", "ru"))
+    kb.button(text="🇺🇿 O‘zbekcha", callback_data=pack_callback("lang", "uz"))
+    kb.button(text="🇺🇸 English", callback_data=pack_callback("lang", "en"))
     kb.adjust(1)
     return kb
 
@@ -29,9 +30,9 @@ def build_language_kb(lang: str) -> InlineKeyboardBuilder:
 
 def build_budget_kb(lang: str) -> InlineKeyboardBuilder:
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "budget_low"), callback_data="budget:low")
-    kb.button(text=t(lang, "budget_mid"), callback_data="budget:mid")
-    kb.button(text=t(lang, "budget_high"), callback_data="budget:high")
+    kb.button(text=t(lang, "budget_low"), callback_data=pack_callback("budget", "low"))
+    kb.button(text=t(lang, "budget_mid"), callback_data=pack_callback("budget", "mid"))
+    kb.button(text=t(lang, "budget_high"), callback_data=pack_callback("budget", "high"))
     kb.adjust(1)
     return kb
 
@@ -58,9 +59,9 @@ def parse_profile_text(text: str) -> Optional[Tuple[int, int, int]]:
 
 def build_reminder_kb(lang: str) -> InlineKeyboardBuilder:
     kb = InlineKeyboardBuilder()
-    kb.button(text=t(lang, "rem_morning"), callback_data="reminder:morning")
-    kb.button(text=t(lang, "rem_day"), callback_data="reminder:day")
-    kb.button(text=t(lang, "rem_evening"), callback_data="reminder:evening")
+    kb.button(text=t(lang, "rem_morning"), callback_data=pack_callback("reminder", "morning"))
+    kb.button(text=t(lang, "rem_day"), callback_data=pack_callback("reminder", "day"))
+    kb.button(text=t(lang, "rem_evening"), callback_data=pack_callback("reminder", "evening"))
     kb.adjust(1)
     return kb
 
@@ -1,26 +1,108 @@
+import asyncio
 import json
 import random
+from functools import lru_cache
+from math import gcd
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+from app.database import SessionLocal
+from app.models.sleep_tip_cursor import SleepTipCursor
+from app.services.content_bundle import load_bundle
+
+LANGS = ("ru", "uz", "en")
+DEFAULT_LANG = "ru"
+
+DEFAULT_TIP = {
+    "ru": "Старайся ложиться спать и вставать в одно и то же время — так твоё тело легче высыпается.",
+    "uz": "Uxlagan va uyg'onish vaqtini bir xil qilib turing — shunda tanangiz osonroq uyquga ketadi.",
+    "en": "Try to go to bed and wake up at the same time — this way your body falls asleep more easily."
+}
+
+# Per-language tip tuples, built once on first use
+_tips_by_lang: Optional[Dict[str, Tuple[str, ...]]] = None
+
 
 def load_sleep_tips() -> List[dict]:
-    """Load sleep tips from JSON file."""
+    """Load sleep tips from the compiled bundle, or from the JSON file."""
+    bundle = load_bundle()
+    if bundle is not None:
+        return bundle["sleep_tips"]
     tips_file = Path(__file__).parent.parent.parent / "data" / "sleep_tips.json"
     try:
         with open(tips_file, 'r', encoding='utf-8') as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
-        return [{
-            "ru": "Старайся ложиться спать и вставать в одно и то же время — так твоё тело легче высыпается.",
-            "uz": "Uxlagan va uyg'onish vaqtini bir xil qilib turing — shunda tanangiz osonroq uyquga ketadi.",
-            "en": "Try to go to bed and wake up at the same time — this way your body falls asleep more easily."
-        }]
+        return [DEFAULT_TIP]
+
+def get_tips_by_lang() -> Dict[str, Tuple[str, ...]]:
+    """Return tips as per-language tuples of equal length (loaded once).
+
+    A tip missing in some language falls back to Russian, so the same index
+    points at the same tip in every language. An empty tip list is replaced
+    by DEFAULT_TIP, so no pool is ever empty.
+    """
+    global _tips_by_lang
+    if _tips_by_lang is None:
+        tips = load_sleep_tips() or [DEFAULT_TIP]
+        _tips_by_lang = {
+            lang: tuple(tip.get(lang, tip.get("ru", "Sleep tip not available")) for tip in tips)
+            for lang in LANGS
+        }
+    return _tips_by_lang
+
+
+def _pool(lang: str) -> Tuple[str, ...]:
+    tips = get_tips_by_lang()
+    return tips.get(lang) or tips[DEFAULT_LANG] or (DEFAULT_TIP[DEFAULT_LANG],)
+
 
 def get_random_tip(lang: str = "ru") -> str:
     """Get a random sleep tip in the specified language."""
-    tips = load_sleep_tips()
-    tip = random.choice(tips)
-    return tip.get(lang, tip.get("ru", "Sleep tip not available"))
+    return random.choice(_pool(lang))
+
+
+@lru_cache(maxsize=8)
+def _coprime_strides(n: int) -> Tuple[int, ...]:
+    """Strides that visit every index of a pool of size n exactly once."""
+    return tuple(k for k in range(1, n) if gcd(k, n) == 1) or (1,)
+
+
+def _rotation_index(user_id: int, cursor: int, n: int) -> int:
+    """Map a user's cursor to a tip index without repeats inside a cycle.
+
+    Each cycle of n tips is a permutation `start + pos * stride (mod n)` with a
+    stride coprime to n; start and stride are derived from (user, cycle).
+    """
+    cycle, pos = divmod(cursor, n)
+    rnd = random.Random(user_id * 1_000_003 + cycle)
+    start = rnd.randrange(n)
+    stride = rnd.choice(_coprime_strides(n))
+    return (start + pos * stride) % n
+
+
+def _advance_cursor(user_id: int) -> int:
+    """Return the user's rotation cursor and store the next one."""
+    with SessionLocal() as session:
+        row = session.get(SleepTipCursor, user_id)
+        if row is None:
+            row = SleepTipCursor(user_id=user_id, cursor=0)
+            session.add(row)
+        cursor = row.cursor or 0
+        row.cursor = cursor + 1
+        session.commit()
+    return cursor
+
+
+async def get_next_tip(user_id: int, lang: str = "ru") -> str:
+    """Get the next sleep tip for a user; no repeats until the pool is exhausted.
+
+    The cursor is stored in the database, so the rotation survives restarts
+    and is the same on every worker process.
+    """
+    pool = _pool(lang)
+    cursor = await asyncio.to_thread(_advance_cursor, user_id)
+    return pool[_rotation_index(user_id, cursor, len(pool))]
 
 def get_sleep_stats(user_id: int) -> dict:
     """Get sleep statistics for the last 7 days."""
@@ -0,0 +1,165 @@
+"""
+Multi-process update sharding.
+
+With BOT_WORKERS > 1 the web process only receives webhook requests and
+forwards each raw update to one of N worker processes over a local
+multiprocessing queue. The worker is picked by chat id (sticky sharding),
+so one chat's updates always reach the same worker in arrival order while
+different chats are processed in parallel on different cores.
+
+Workers share the FSM through DatabaseStorage. Worker 0 is the scheduler
+leader: it alone sends reminders and pre-warms media, and it periodically
+resyncs jobs that users changed through other workers.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+SHARD_QUEUE_SIZE = 1000
+SCHEDULE_RESYNC_MINUTES = 5
+
+# Update fields that carry the chat (or, failing that, the user) the update belongs to
+_CHAT_SOURCES = (
+    "message", "edited_message", "channel_post", "edited_channel_post",
+    "business_message", "edited_business_message", "my_chat_member",
+    "chat_member", "chat_join_request", "message_reaction",
+)
+_USER_SOURCES = ("callback_query", "inline_query", "chosen_inline_result", "pre_checkout_query", "shipping_query", "poll_answer")
+
+
+def update_chat_id(update: Dict[str, Any]) -> Optional[int]:
+    """Chat id of a raw update; the user id for updates without a chat."""
+    for field in _CHAT_SOURCES:
+        event = update.get(field)
+        if event and event.get("chat"):
+            return event["chat"]["id"]
+    callback = update.get("callback_query")
+    if callback and (callback.get("message") or {}).get("chat"):
+        return callback["message"]["chat"]["id"]
+    for field in _USER_SOURCES:
+        event = update.get(field)
+        user = event and (event.get("from") or event.get("user"))
+        if user:
+            return user["id"]
+    return None
+
+
+def shard_for(update: Dict[str, Any], workers: int) -> int:
+    chat_id = update_chat_id(update)
+    if chat_id is None:
+        chat_id = update.get("update_id", 0)
+    return chat_id % workers
+
+
+class ShardedFeeder:
+    """Front-side pool of worker processes with one queue each."""
+
+    def __init__(self, workers: int) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        self.workers = workers
+        self._ctx = ctx
+        self.queues: List[Any] = [ctx.Queue(maxsize=SHARD_QUEUE_SIZE) for _ in range(workers)]
+        self.processes: List[Any] = []
+
+    def start(self) -> None:
+        from app.database import Base, engine
+        import app.models  # noqa: F401
+        from app.services.media_manifest import load_media_manifest
+
+        # Create tables once here so the workers do not race on a fresh database
+        Base.metadata.create_all(bind=engine)
+        # Hash the media tree once; every worker gets a copy of the manifest
+        manifest = load_media_manifest()
+        self.processes = [
+            self._ctx.Process(
+                target=run_worker, args=(index, self.workers, q, manifest), name=f"bot-worker-{index}", daemon=True,
+            )
+            for index, q in enumerate(self.queues)
+        ]
+        for process in self.processes:
+            process.start()
+        logger.info("Started %d bot worker processes", self.workers)
+
+    def submit(self, update: Dict[str, Any]) -> bool:
+        """Queue an update on its shard; False if that worker is backed up."""
+        try:
+            self.queues[shard_for(update, self.workers)].put_nowait(update)
+            return True
+        except queue.Full:
+            return False
+
+    def alive(self) -> int:
+        return sum(1 for process in self.processes if process.is_alive())
+
+    def queue_sizes(self) -> List[Optional[int]]:
+        sizes = []
+        for q in self.queues:
+            try:
+                sizes.append(q.qsize())
+            except NotImplementedError:  # macOS
+                sizes.append(None)
+        return sizes
+
+    def stop(self, timeout: float = 10.0) -> None:
+        for q in self.queues:
+            try:
+                q.put_nowait(None)
+            except queue.Full:
+                pass
+        for process in self.processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+
+
+def run_worker(index: int, workers: int, updates: Any, media_manifest: Any = None) -> None:
+    """Worker process entry point."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"%(asctime)s %(levelname)s [worker {index}] %(name)s: %(message)s",
+    )
+    asyncio.run(_worker_main(index, workers, updates, media_manifest))
+
+
+async def _feed(dp, bot, update: Dict[str, Any]) -> None:
+    try:
+        await dp.feed_raw_update(bot, update)
+    except Exception:
+        logger.exception("Failed to process update %s", update.get("update_id"))
+
+
+async def _worker_main(index: int, workers: int, updates: Any, media_manifest: Any = None) -> None:
+    from app.bot import build_dispatcher, create_bot
+    from app.services.reminders import schedule_resync, set_scheduler_leader
+
+    leader = index == 0
+    set_scheduler_leader(leader)
+    bot = create_bot()
+    dp = build_dispatcher(bot, leader=leader, media_manifest=media_manifest)
+    if leader and workers > 1:
+        schedule_resync(SCHEDULE_RESYNC_MINUTES)
+    await dp.emit_startup(bot=bot, dispatcher=dp)
+    logger.info("Worker %d/%d ready%s", index, workers, " (scheduler leader)" if leader else "")
+
+    loop = asyncio.get_running_loop()
+    # Per-chat order is kept by ChatOrderingIsolation: tasks are started in arrival order
+    tasks: Set[asyncio.Task] = set()
+    try:
+        while True:
+            update = await loop.run_in_executor(None, updates.get)
+            if update is None:
+                break
+            task = asyncio.create_task(_feed(dp, bot, update))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+    finally:
+        await dp.emit_shutdown(bot=bot, dispatcher=dp)
+        await bot.session.close()
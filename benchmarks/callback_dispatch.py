@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк маршрутизации callback-запросов.
+Прогоняет смесь реальных callback_data (legacy и компактный формат) через
+Dispatcher с роутерами бота и сравнивает:
+  - flat: каждый callback по очереди предлагается всем роутерам (как раньше);
+  - namespace: роутер выбирается по namespace через dict (NamespaceRouter).
+Хендлеры не вызываются: inner-middleware останавливает обработку сразу после
+того, как фильтры выбрали хендлер, поэтому в сеть ничего не уходит.
+Запуск: python benchmarks/callback_dispatch.py [--rounds 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import types as pytypes
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+# База SQLite создаётся относительно текущей папки: работаем во временной
+os.chdir(tempfile.mkdtemp(prefix="fitonomics-bench-"))
+
+from aiogram import Bot, Dispatcher, Router  # noqa: E402
+from aiogram.types import CallbackQuery, Chat, Message, Update, User  # noqa: E402
+
+from app.database import Base, engine  # noqa: E402
+import app.models  # noqa: E402,F401
+from app import handlers  # noqa: E402
+from app.services.callback_protocol import pack_callback, unpack_callback  # noqa: E402
+
+# (callback_data, вес) — примерно как нажимают пользователи
+CALLBACKS = [
+    (pack_callback("meals", "pack", "low_breakfast_1"), 20),
+    (pack_callback("meals", "page", "lunch", 1), 10),
+    (pack_callback("meals", "category", "dinner"), 10),
+    (pack_callback("meals", "done", "mid_lunch_3"), 6),
+    (pack_callback("w", "start", "full"), 8),
+    (pack_callback("w", "mode", "gym"), 6),
+    ("meals:reminder:breakfast", 6),
+    ("sleep:log", 6),
+    ("sleep:quality:4", 4),
+    ("reminders:settings", 4),
+    ("reminder:morning", 3),
+    ("progress:details:week", 3),
+    ("profile:edit_menu", 3),
+    ("lang:ru", 2),
+    ("gate:joined", 2),
+    ("settings:lang", 2),
+    ("back_to_main", 2),
+    ("admin:stats", 1),
+    ("unknown:action", 1),
+]
+
+SKIPPED = object()
+
+
+async def _stop_before_handler(handler, event, data):
+    return SKIPPED
+
+
+def _make_updates(rounds: int):
+    rnd = random.Random(42)
+    population = [data for data, _ in CALLBACKS]
+    weights = [weight for _, weight in CALLBACKS]
+    user = User(id=100500, is_bot=False, first_name="Bench")
+    chat = Chat(id=100500, type="private")
+    message = Message(message_id=1, date=0, chat=chat, text="bench")
+    updates = []
+    for i, data in enumerate(rnd.choices(population, weights, k=rounds)):
+        query = CallbackQuery(id=str(i), from_user=user, chat_instance="bench", message=message, data=data)
+        updates.append(Update(update_id=i, callback_query=query))
+    return updates
+
+
+def _legacy(data: str) -> str:
+    return unpack_callback(data).data
+
+
+async def _replay(dp: Dispatcher, bot: Bot, updates) -> float:
+    started = time.perf_counter()
+    for update in updates:
+        await dp.feed_update(bot, update)
+    return time.perf_counter() - started
+
+
+async def run(rounds: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    bot = Bot("123456:bench")
+    dp = Dispatcher()
+    dp.include_router(handlers.router)
+    handlers.router.callback_query.middleware(_stop_before_handler)
+
+    updates = _make_updates(rounds)
+    await _replay(dp, bot, updates[:200])  # прогрев кэшей и фильтров
+
+    namespace_time = await _replay(dp, bot, updates)
+
+    # flat: тот же роутер, но с обычным последовательным обходом всех под-роутеров
+    handlers.router._propagate_event = pytypes.MethodType(Router._propagate_event, handlers.router)
+    flat_updates = [
+        Update(update_id=u.update_id, callback_query=u.callback_query.model_copy(
+            update={"data": _legacy(u.callback_query.data)}))
+        for u in updates
+    ]
+    flat_time = await _replay(dp, bot, flat_updates)
+    await bot.session.close()
+
+    print("⚡ Маршрутизация callback-запросов:")
+    print("=" * 50)
+    print(f"📨 Callback'ов: {rounds}")
+    print(f"🐢 flat:      {flat_time * 1e6 / rounds:8.1f} мкс/callback")
+    print(f"🚀 namespace: {namespace_time * 1e6 / rounds:8.1f} мкс/callback")
+    print(f"📈 Ускорение: x{flat_time / namespace_time:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Callback dispatch benchmark")
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.rounds))
+
+
+if __name__ == "__main__":
+    main()
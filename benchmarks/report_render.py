@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк отрисовки экранов прогресса и админ-статистики.
+Сравнивает для одного и того же словаря статистики:
+  - concat: текст собирается через text += f"...{t(...)}..." (как раньше);
+  - template: ReportTemplate, разобранный один раз на язык в format-строки.
+Перед замером проверяется, что оба способа дают одинаковый текст.
+База данных не нужна: статистика собирается в памяти.
+Запуск: python benchmarks/report_render.py [--rounds 20000]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.handlers.admin import STATS_GENERAL_REPORT, _bot_stats_values  # noqa: E402
+from app.handlers.progress import MENU_SUMMARY_REPORT, _progress_values  # noqa: E402
+from app.services.i18n import LANGS, t  # noqa: E402
+
+PROGRESS_STATS = {
+    "sleep": {"total_nights": 6, "avg_duration": 7.2, "optimal_nights": 4, "deviation": 2},
+    "workouts": {"this_week": 3, "total": 27},
+    "meals": {
+        "this_week": 15, "healthy": 11, "unsure": 2, "unhealthy": 2,
+        "healthiness_percentage": 73, "custom_meals": 5,
+    },
+}
+
+BOT_STATS = {
+    "total_users": 12840, "active_users": 3121, "users_this_week": 412, "users_this_month": 1630,
+    "language_distribution": {"ru": 7011, "uz": 4302, "en": 1527},
+    "budget_distribution": {"low": 5120, "mid": 4977, "high": 1203, "none": 1540},
+    "reminder_time_distribution": {"morning": 6120, "day": 2440, "evening": 3011, "none": 1269},
+    "computed_at": datetime(2025, 1, 1, 12, 0),
+}
+
+
+def legacy_menu_summary(stats: dict, lang: str) -> str:
+    """Старая сборка экрана прогресса из главного меню."""
+    text = f"{t(lang, 'progress.title')}\n\n"
+    sleep = stats["sleep"]
+    if sleep["total_nights"] > 0:
+        text += f"😴 {t(lang, 'progress.sleep.title')}:\n"
+        text += f"   • {t(lang, 'progress.sleep.avg_duration')}: {sleep['avg_duration']}h\n"
+        text += f"   • {t(lang, 'progress.sleep.optimal_nights')}: {sleep['optimal_nights']}/{sleep['total_nights']}\n"
+        if sleep["deviation"] > 0:
+            text += f"   • {t(lang, 'progress.sleep.deviation')}: {sleep['deviation']} {t(lang, 'progress.sleep.nights')}\n"
+    else:
+        text += f"😴 {t(lang, 'progress.sleep.no_data')}\n"
+    workouts = stats["workouts"]
+    text += f"\n🏋️ {t(lang, 'progress.workouts.title')}:\n"
+    text += f"   • {t(lang, 'progress.workouts.this_week')}: {workouts['this_week']}\n"
+    text += f"   • {t(lang, 'progress.workouts.total')}: {workouts['total']}\n"
+    meals = stats["meals"]
+    text += f"\n🍽️ {t(lang, 'progress.meals.title')}:\n"
+    text += f"   • {t(lang, 'progress.meals.this_week')}: {meals['this_week']}\n"
+    text += f"   • {t(lang, 'progress.meals.healthy')}: {meals['healthy']}\n"
+    text += f"   • {t(lang, 'progress.meals.unsure')}: {meals['unsure']}\n"
+    text += f"   • {t(lang, 'progress.meals.unhealthy')}: {meals['unhealthy']}\n"
+    text += f"   • {t(lang, 'progress.meals.healthiness')}: {meals['healthiness_percentage']}%\n"
+    text += f"   • {t(lang, 'progress.meals.custom')}: {meals['custom_meals']}\n"
+    return text
+
+
+def legacy_admin_general(stats: dict) -> str:
+    """Старая сборка экрана общей статистики админки."""
+    return f"""📈 Общая статистика
+
+👥 Пользователи:
+• Всего: {stats['total_users']}
+• Активных (7 дней): {stats['active_users']}
+• Рост за неделю: +{stats['users_this_week']}
+• Рост за месяц: +{stats['users_this_month']}
+
+🌍 Языки:
+• Русский: {stats['language_distribution'].get('ru', 0)}
+• English: {stats['language_distribution'].get('en', 0)}
+• O'zbek: {stats['language_distribution'].get('uz', 0)}"""
+
+
+def _timed(render, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        render()
+    return time.perf_counter() - started
+
+
+def run(rounds: int) -> None:
+    cases = []
+    for lang in LANGS:
+        cases.append((
+            f"Прогресс ({lang})",
+            lambda lang=lang: legacy_menu_summary(PROGRESS_STATS, lang),
+            lambda lang=lang: MENU_SUMMARY_REPORT.render(_progress_values(PROGRESS_STATS), lang),
+        ))
+    # Бот считает значения один раз на снимок статистики, а не на каждый экран
+    admin_values = _bot_stats_values(BOT_STATS)
+    cases.append((
+        "Админ: общая статистика",
+        lambda: legacy_admin_general(BOT_STATS),
+        lambda: STATS_GENERAL_REPORT.render(admin_values),
+    ))
+
+    print("⚡ Отрисовка отчётов:")
+    print("=" * 50)
+    print(f"🔁 Повторов на экран: {rounds}")
+    for name, legacy, template in cases:
+        assert legacy() == template(), f"{name}: тексты отличаются"
+        concat_time = _timed(legacy, rounds)
+        template_time = _timed(template, rounds)
+        print(f"\n📄 {name}")
+        print(f"🐢 concat:   {concat_time * 1e6 / rounds:8.2f} мкс/экран")
+        print(f"🚀 template: {template_time * 1e6 / rounds:8.2f} мкс/экран")
+        print(f"📈 Ускорение: x{concat_time / template_time:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report rendering benchmark")
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.rounds)
+
+
+if __name__ == "__main__":
+    main()
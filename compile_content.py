@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Скрипт для сборки контента (meals, workouts, sleep tips) в один бандл.
+Проверяет схему JSON, наличие медиафайлов и заранее разбирает калории/цены.
+Запускайте при деплое: python compile_content.py [--allow-missing-media]
+"""
+
+import argparse
+import sys
+
+from app.services.content_bundle import BUNDLE_PATH, compile_bundle
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compile content bundle")
+    parser.add_argument("--allow-missing-media", action="store_true",
+                        help="build the bundle even if some media files are missing")
+    args = parser.parse_args()
+
+    print("📦 Сборка контента:")
+    print("=" * 50)
+
+    report = compile_bundle(allow_missing_media=args.allow_missing_media)
+
+    for name, count in report.counts.items():
+        print(f"✅ {name}: {count}")
+    for warning in report.warnings:
+        print(f"⚠️ {warning}")
+    if report.missing_media:
+        print(f"🖼 Отсутствуют медиафайлы: {len(report.missing_media)}")
+        for path in report.missing_media:
+            print(f"   - {path}")
+    for error in report.errors:
+        print(f"❌ {error}")
+
+    print("=" * 50)
+    if report.errors:
+        print("❌ Ошибки в контенте, бандл не собран")
+        return 1
+    if report.missing_media and not args.allow_missing_media:
+        print("❌ Не хватает медиафайлов, бандл не собран (используйте --allow-missing-media)")
+        return 1
+    print(f"✅ Бандл записан: {BUNDLE_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
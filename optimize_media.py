@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Скрипт для оптимизации картинок питания (media/meals).
+Создаёт сжатые JPEG/WebP (до 1280px) и превью в media/optimized и пишет manifest.json.
+Повторный запуск обрабатывает только изменённые картинки.
+Запуск: python optimize_media.py [--force]
+"""
+
+import argparse
+import sys
+
+from app.services.media_pipeline import MANIFEST_PATH, optimize_meal_media
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Optimize meal images")
+    parser.add_argument("--force", action="store_true", help="reprocess all images")
+    args = parser.parse_args()
+
+    print("🖼 Оптимизация картинок питания:")
+    print("=" * 50)
+
+    try:
+        report = optimize_meal_media(force=args.force)
+    except ImportError:
+        print("❌ Pillow не установлен: pip install -r requirements.txt")
+        return 1
+
+    print(f"✅ Обработано: {len(report.processed)}")
+    print(f"⏭ Без изменений: {len(report.skipped)}")
+    if report.removed:
+        print(f"🗑 Удалено устаревших: {len(report.removed)}")
+    for path, error in report.failed.items():
+        print(f"❌ {path}: {error}")
+
+    mb = 1024 * 1024
+    print(f"📦 Исходники: {report.source_bytes / mb:.1f} MB → JPEG: {report.output_bytes / mb:.1f} MB")
+    print("=" * 50)
+    print(f"✅ Манифест: {MANIFEST_PATH}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
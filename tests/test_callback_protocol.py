@@ -0,0 +1,112 @@
+import asyncio
+import inspect
+
+import pytest
+from aiogram.dispatcher.event.bases import UNHANDLED
+
+from app.services.callback_protocol import MAX_CALLBACK_BYTES, NAMESPACE_CODES, pack_callback, unpack_callback
+
+
+def test_pack_is_compact_and_round_trips():
+    data = pack_callback("meals", "page", "lunch", 2)
+    assert data == "Mpage:lunch:2"
+    callback = unpack_callback(data)
+    assert callback.compact
+    assert callback.namespace == "meals"
+    assert callback.action == "page"
+    assert callback.data == "meals:page:lunch:2"
+    assert callback.int_field(1) == 2
+
+
+def test_typed_fields():
+    callback = unpack_callback(pack_callback("settings", "toggle", True, False, "x"))
+    assert callback.flag(0) and not callback.flag(1)
+    assert callback.field(2) == "x"
+    assert callback.int_field(2, default=-1) == -1
+    assert callback.field(5, default="none") == "none"
+
+
+def test_legacy_data_is_parsed_as_is():
+    callback = unpack_callback("meals:pack:low_breakfast_1")
+    assert not callback.compact
+    assert (callback.namespace, callback.action, callback.fields) == ("meals", "pack", ("low_breakfast_1",))
+    assert unpack_callback("back_to_main").data == "back_to_main"
+
+
+def test_every_namespace_code_is_unique_uppercase_byte():
+    codes = list(NAMESPACE_CODES.values())
+    assert len(set(codes)) == len(codes)
+    assert all(len(code) == 1 and code.isupper() for code in codes)
+    for namespace in NAMESPACE_CODES:
+        assert unpack_callback(pack_callback(namespace, "act")).namespace == namespace
+
+
+def test_invalid_fields_are_rejected():
+    with pytest.raises(ValueError):
+        pack_callback("meals", "pack", "a:b")
+    with pytest.raises(ValueError):
+        pack_callback("meals", "pack", "x" * MAX_CALLBACK_BYTES)
+    with pytest.raises(KeyError):
+        pack_callback("unknown", "act")
+
+
+def test_aiogram_propagate_event_signature_is_unchanged():
+    # NamespaceRouter overrides this private aiogram method (aiogram is pinned in requirements.txt)
+    from aiogram import Router
+
+    params = list(inspect.signature(Router._propagate_event).parameters.values())
+    assert [p.name for p in params] == ["self", "observer", "update_type", "event", "kwargs"]
+    assert params[-1].kind is inspect.Parameter.VAR_KEYWORD
+
+
+def test_namespace_router_dispatches_compact_data():
+    from aiogram import Bot, Dispatcher, F, Router
+    from aiogram.types import Update
+
+    from app.services.callback_protocol import NamespaceRouter
+
+    sleep, meals = Router(name="sleep"), Router(name="meals")
+    seen = []
+
+    @sleep.callback_query(F.data.startswith("sleep:time:"))
+    async def on_time(call):
+        seen.append(("sleep", call.data))
+        return "sleep"
+
+    @meals.callback_query()
+    async def on_meals(call):
+        seen.append(("meals", call.data))
+        return "meals"
+
+    root = NamespaceRouter(name="root")
+    root.include_namespaced(sleep, "sleep")
+    root.include_namespaced(meals, "meals")
+    dp = Dispatcher()
+    dp.include_router(root)
+    bot = Bot(token="42:TEST")
+
+    def update(data):
+        return Update.model_validate({
+            "update_id": 1,
+            "callback_query": {
+                "id": "1",
+                "from": {"id": 7, "is_bot": False, "first_name": "u"},
+                "chat_instance": "c",
+                "data": data,
+            },
+        }, context={"bot": bot})
+
+    async def run():
+        try:
+            return [
+                await dp.feed_update(bot, update(pack_callback("sleep", "time", "21", "00"))),
+                await dp.feed_update(bot, update("sleep:time:22:00")),
+                await dp.feed_update(bot, update(pack_callback("profile", "edit_menu"))),
+            ]
+        finally:
+            await bot.session.close()
+
+    results = asyncio.run(run())
+    assert results[:2] == ["sleep", "sleep"]
+    assert results[2] is UNHANDLED
+    assert seen == [("sleep", "sleep:time:21:00"), ("sleep", "sleep:time:22:00")]
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+
+from app.models.fsm_state import FsmState
+from app.services import fsm_storage
+from app.services.fsm_storage import DatabaseStorage, storage_key
+
+KEY = StorageKey(bot_id=1, chat_id=10, user_id=10)
+OTHER = StorageKey(bot_id=1, chat_id=20, user_id=20)
+
+
+@pytest.fixture
+def sessions(session_factory, monkeypatch):
+    monkeypatch.setattr(fsm_storage, "SessionLocal", session_factory)
+    return session_factory
+
+
+def rows(sessions):
+    with sessions() as session:
+        return {row.key: (row.state, row.data) for row in session.query(FsmState)}
+
+
+def test_writes_are_deferred_until_flush(sessions):
+    async def scenario():
+        storage = DatabaseStorage(flush_interval=60)
+        await storage.set_state(KEY, "Onboarding:age")
+        await storage.set_data(KEY, {"age": "30"})
+        assert await storage.get_state(KEY) == "Onboarding:age"
+        assert rows(sessions) == {}
+        await storage.flush()
+        assert rows(sessions) == {storage_key(KEY): ("Onboarding:age", '{"age":"30"}')}
+        await storage.close()
+
+    asyncio.run(scenario())
+
+
+def test_state_survives_a_new_storage(sessions):
+    async def scenario():
+        storage = DatabaseStorage(flush_interval=60)
+        await storage.set_state(KEY, "Sleep:time")
+        await storage.close()
+        restarted = DatabaseStorage()
+        assert await restarted.get_state(KEY) == "Sleep:time"
+        assert await restarted.get_data(OTHER) == {}
+
+    asyncio.run(scenario())
+
+
+def test_cleared_record_is_deleted(sessions):
+    async def scenario():
+        storage = DatabaseStorage(flush_interval=60)
+        await storage.set_state(KEY, "Sleep:time")
+        await storage.flush()
+        await storage.set_state(KEY, None)
+        await storage.set_data(KEY, {})
+        await storage.close()
+
+    asyncio.run(scenario())
+    assert rows(sessions) == {}
+
+
+def test_full_batch_is_flushed_early(sessions):
+    async def scenario():
+        storage = DatabaseStorage(flush_interval=60, batch_size=2)
+        await storage.set_state(KEY, "a")
+        await storage.set_state(OTHER, "b")
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if len(rows(sessions)) == 2:
+                break
+        assert len(rows(sessions)) == 2
+        await storage.close()
+
+    asyncio.run(scenario())
+
+
+def test_unserializable_data_does_not_stop_the_flusher(sessions):
+    async def scenario():
+        storage = DatabaseStorage(flush_interval=0.01)
+        await storage.set_data(KEY, {"bad": object()})
+        await storage.set_state(OTHER, "ok")
+        await asyncio.sleep(0.05)
+        assert not storage._flusher.done()
+        assert rows(sessions) == {storage_key(OTHER): ("ok", None)}
+        await storage.set_state(OTHER, "later")
+        await storage.close()
+        assert rows(sessions)[storage_key(OTHER)] == ("later", None)
+
+    asyncio.run(scenario())
+
+
+def test_get_data_returns_a_copy(sessions):
+    async def scenario():
+        storage = DatabaseStorage(flush_interval=60)
+        await storage.set_data(KEY, {"n": 1})
+        (await storage.get_data(KEY))["n"] = 2
+        assert await storage.get_data(KEY) == {"n": 1}
+        await storage.close()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_share_one_read(sessions, monkeypatch):
+    with sessions() as session:
+        session.add(FsmState(key=storage_key(KEY), state="Sleep:time", data=None))
+        session.commit()
+    reads = []
+    read = DatabaseStorage._read
+
+    def counting_read(db_key):
+        reads.append(db_key)
+        return read(db_key)
+
+    monkeypatch.setattr(DatabaseStorage, "_read", staticmethod(counting_read))
+
+    async def scenario():
+        storage = DatabaseStorage(flush_interval=60)
+        states = await asyncio.gather(*(storage.get_state(KEY) for _ in range(5)))
+        assert states == ["Sleep:time"] * 5
+        assert await storage.get_state(KEY) == "Sleep:time"
+        await storage.close()
+
+    asyncio.run(scenario())
+    assert reads == [storage_key(KEY)]
+
+
+def test_write_during_a_read_wins(sessions):
+    with sessions() as session:
+        session.add(FsmState(key=storage_key(KEY), state="old", data=None))
+        session.commit()
+
+    async def scenario():
+        storage = DatabaseStorage(flush_interval=60)
+        reader = asyncio.ensure_future(storage.get_data(KEY))
+        await asyncio.sleep(0)
+        storage._put(storage_key(KEY), ("new", {}))
+        await reader
+        assert await storage.get_state(KEY) == "new"
+        await storage.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,41 @@
+import logging
+
+from app.services import i18n
+from app.services.i18n import DEFAULT_LANG, LANGS, T, Template, catalog_problems, compile_text, t
+
+
+def test_shipped_catalog_has_no_gaps():
+    assert catalog_problems() == []
+    assert set(T) == set(LANGS)
+
+
+def test_static_strings_are_not_templates():
+    assert compile_text("Hello") == "Hello"
+    assert isinstance(compile_text("Hi {name}"), Template)
+
+
+def test_template_formats_with_spec_and_conversion():
+    template = Template("{name!r} has {score:.1f}%")
+    assert template.fields == frozenset({"name", "score"})
+    assert template.format({"name": "Ann", "score": 12.345}) == "'Ann' has 12.3%"
+
+
+def test_missing_placeholder_is_kept_and_logged(caplog):
+    with caplog.at_level(logging.ERROR, logger=i18n.__name__):
+        assert Template("{a} and {b}").format({"a": 1}) == "1 and {b}"
+    assert "Missing placeholder {b}" in caplog.text
+
+
+def test_unknown_language_and_key_fall_back():
+    assert t("xx", "btn_meals") == t(DEFAULT_LANG, "btn_meals")
+    assert t("en", "no.such.key") == "no.such.key"
+
+
+def test_placeholder_mismatch_is_reported(monkeypatch):
+    strings = {lang: dict(T[lang]) for lang in LANGS}
+    strings["en"]["w_start"] = "Workout {group}"
+    del strings["uz"]["btn_meals"]
+    monkeypatch.setattr(i18n, "T", strings)
+    problems = catalog_problems()
+    assert any(problem.startswith("uz: 1 missing keys: btn_meals") for problem in problems)
+    assert any(problem.startswith("w_start: placeholders differ") for problem in problems)
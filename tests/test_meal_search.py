@@ -0,0 +1,75 @@
+from app.services import meal_search
+from app.services.meal_search import MealSearchIndex, tokenize
+
+DATA = {
+    "budget_low": [
+        {
+            "id": "low_breakfast_1",
+            "category": "breakfast",
+            "name_ru": "Овсянка с бананом",
+            "name_uz": "Bananli suli bo‘tqasi",
+            "name_en": "Oatmeal with banana",
+            "text_ru": "Ингредиенты: овсяные хлопья, банан, молоко",
+            "text_en": "Ingredients: oat flakes, banana, milk",
+        },
+        {
+            "id": "low_lunch_1",
+            "category": "lunch",
+            "name_ru": "Омлет",
+            "name_uz": "Tuxum omlet",
+            "name_en": "Omelette",
+            "text_ru": "Ингредиенты: яйца 2 шт, молоко",
+        },
+    ],
+    "budget_high": [
+        {
+            "id": "high_dinner_1",
+            "category": "dinner",
+            "name_ru": "Лосось с рисом",
+            "name_en": "Salmon with rice",
+            "text_ru": "Ингредиенты: лосось, рис, банан",
+        },
+    ],
+}
+
+
+def ids(meals):
+    return [meal["id"] for meal in meals]
+
+
+def test_tokenize_normalizes_case_apostrophes_and_yo():
+    assert tokenize("Bo‘tqa ЁЖИК 2 a") == ("bo'tqa", "ежик")
+
+
+def test_prefix_match_in_every_language():
+    index = MealSearchIndex(DATA)
+    assert ids(index.search("овсян")) == ["low_breakfast_1"]
+    assert ids(index.search("tux")) == ["low_lunch_1"]
+    assert ids(index.search("OMEL")) == ["low_lunch_1"]
+
+
+def test_all_tokens_must_match():
+    index = MealSearchIndex(DATA)
+    assert ids(index.search("молоко банан")) == ["low_breakfast_1"]
+    assert index.search("молоко лосось") == []
+
+
+def test_name_matches_rank_before_ingredient_matches():
+    index = MealSearchIndex(DATA)
+    # Banana is in the name of the breakfast and only in the salmon ingredients
+    assert ids(index.search("банан")) == ["low_breakfast_1", "high_dinner_1"]
+
+
+def test_tags_and_budget_filter():
+    index = MealSearchIndex(DATA)
+    assert ids(index.search("ужин")) == ["high_dinner_1"]
+    assert ids(index.search("банан", budget_key="budget_high")) == ["high_dinner_1"]
+    assert index.search("") == []
+
+
+def test_prefix_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(meal_search, "PREFIX_CACHE_SIZE", 3)
+    index = MealSearchIndex(DATA)
+    for query in ("ом", "ов", "ba", "tu", "ри"):
+        index.search(query)
+    assert list(index._prefix_cache) == ["ba", "tu", "ри"]
@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime
+
+from aiogram import Bot, Dispatcher, Router
+from aiogram.filters import StateFilter
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Chat, Message, Update, User
+
+from app.middlewares import ChatOrderingIsolation
+
+
+class Form(StatesGroup):
+    age = State()
+    height = State()
+
+
+def message_update(update_id: int, chat_id: int, text: str) -> Update:
+    return Update(
+        update_id=update_id,
+        message=Message(
+            message_id=update_id,
+            date=datetime.now(),
+            chat=Chat(id=chat_id, type="private"),
+            from_user=User(id=chat_id, is_bot=False, first_name="Test"),
+            text=text,
+        ),
+    )
+
+
+def build(isolation: ChatOrderingIsolation, answers: list) -> Dispatcher:
+    router = Router()
+
+    @router.message(Form.age)
+    async def on_age(message: Message, state: FSMContext):
+        answers.append(("age", message.text))
+        await asyncio.sleep(0.02)  # e.g. a Telegram call before the state moves on
+        await state.set_state(Form.height)
+
+    @router.message(Form.height)
+    async def on_height(message: Message, state: FSMContext):
+        answers.append(("height", message.text))
+        await state.clear()
+
+    @router.message(StateFilter(None))
+    async def on_other(message: Message):
+        answers.append((None, message.text))
+        await asyncio.sleep(0.02)
+
+    dp = Dispatcher(storage=MemoryStorage(), events_isolation=isolation)
+    dp.include_router(router)
+    return dp
+
+
+async def set_state(dp: Dispatcher, bot: Bot, chat_id: int, state: State) -> None:
+    context = dp.fsm.get_context(bot, chat_id=chat_id, user_id=chat_id)
+    await context.set_state(state)
+
+
+def test_queued_update_sees_the_state_left_by_the_previous_one():
+    async def scenario():
+        answers: list = []
+        dp = build(ChatOrderingIsolation(8), answers)
+        bot = Bot("42:TEST")
+        await set_state(dp, bot, 1, Form.age)
+        await asyncio.gather(
+            dp.feed_update(bot, message_update(1, 1, "30")),
+            dp.feed_update(bot, message_update(2, 1, "180")),
+        )
+        await bot.session.close()
+        return answers
+
+    assert asyncio.run(scenario()) == [("age", "30"), ("height", "180")]
+
+
+def test_one_chat_in_order_and_global_cap():
+    async def scenario():
+        answers: list = []
+        isolation = ChatOrderingIsolation(2)
+        dp = build(isolation, answers)
+        bot = Bot("42:TEST")
+        peak = 0
+
+        async def watch():
+            nonlocal peak
+            while True:
+                peak = max(peak, isolation.in_flight)
+                await asyncio.sleep(0.001)
+
+        watcher = asyncio.create_task(watch())
+        await asyncio.gather(*(
+            dp.feed_update(bot, message_update(i, 100 + i % 3, str(i))) for i in range(12)
+        ))
+        watcher.cancel()
+        await bot.session.close()
+        return answers, peak, isolation.metrics()
+
+    answers, peak, metrics = asyncio.run(scenario())
+    for chat in range(3):
+        texts = [int(text) for _, text in answers if int(text) % 3 == chat]
+        assert texts == sorted(texts)
+    assert peak == 2
+    assert metrics["processed"] == 12
+    assert metrics["active_chats"] == metrics["queued"] == metrics["in_flight"] == 0
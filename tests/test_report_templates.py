@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+
+from app.handlers.admin import STATS_GENERAL_REPORT, _bot_stats_values
+from app.handlers.progress import MENU_SUMMARY_REPORT, _progress_values
+from app.services.i18n import LANGS, t
+from app.services.report_templates import ReportTemplate, Section
+from benchmarks.report_render import BOT_STATS, PROGRESS_STATS, legacy_admin_general, legacy_menu_summary
+
+
+@pytest.mark.parametrize("lang", LANGS)
+def test_progress_summary_matches_the_old_screen(lang):
+    assert MENU_SUMMARY_REPORT.render(_progress_values(PROGRESS_STATS), lang) == legacy_menu_summary(PROGRESS_STATS, lang)
+
+
+@pytest.mark.parametrize("lang", LANGS)
+def test_progress_summary_without_sleep_data(lang):
+    stats = {**PROGRESS_STATS, "sleep": {"total_nights": 0, "avg_duration": 0, "optimal_nights": 0, "deviation": 0}}
+    assert MENU_SUMMARY_REPORT.render(_progress_values(stats), lang) == legacy_menu_summary(stats, lang)
+
+
+def test_admin_general_matches_the_old_screen():
+    assert STATS_GENERAL_REPORT.render(_bot_stats_values(BOT_STATS)) == legacy_admin_general(BOT_STATS)
+
+
+def test_sections_and_translations():
+    report = ReportTemplate(
+        "[[btn_meals]]: {count}\n",
+        Section("{{literal}} {ratio:.0%}\n", when="count", otherwise="—\n"),
+    )
+    assert report.render({"count": 3, "ratio": 0.5}, "en") == f"{t('en', 'btn_meals')}: 3\n{{literal}} 50%\n"
+    assert report.render({"count": 0, "ratio": 0}, "en") == f"{t('en', 'btn_meals')}: 0\n—\n"
+
+
+def test_translated_braces_stay_literal(monkeypatch):
+    from app.services import report_templates
+
+    monkeypatch.setattr(report_templates, "t", lambda lang, key: "{not a slot}")
+    assert ReportTemplate("[[any]] {n}").render({"n": 1}, "ru") == "{not a slot} 1"
+
+
+def test_missing_slot_falls_back_to_checked_render(caplog):
+    report = ReportTemplate("{a} / {b}", Section("shown", when="flag"))
+    with caplog.at_level(logging.ERROR):
+        assert report.render({"a": 1}) == "1 / {b}"
+    assert "Missing placeholder {b}" in caplog.text
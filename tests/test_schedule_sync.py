@@ -0,0 +1,62 @@
+import pytest
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from app.models.user import User
+from app.models.user_settings import UserSettings
+from app.services import reminders
+
+
+@pytest.fixture
+def scheduler(session_factory, monkeypatch):
+    monkeypatch.setattr(reminders, "SessionLocal", session_factory)
+    monkeypatch.setattr(reminders, "_scheduler", BackgroundScheduler(timezone="UTC"))
+    monkeypatch.setattr(reminders, "_scheduler_leader", True)
+    return reminders.get_scheduler()
+
+
+def _add_user(sessions, tg_id, reminder_time=None, **settings):
+    with sessions() as session:
+        session.add(User(tg_id=tg_id, reminder_time=reminder_time))
+        if settings:
+            session.add(UserSettings(user_id=tg_id, **settings))
+        session.commit()
+
+
+def _times(scheduler):
+    return {job.id: str(job.trigger) for job in scheduler.get_jobs()}
+
+
+def test_sync_adds_every_wanted_job(session_factory, scheduler):
+    _add_user(session_factory, 1, "morning", sleep_time="23:00", wake_time="06:58", lunch_time="13:30")
+    reminders.resync_all_schedules()
+    assert _times(scheduler) == {
+        "reminder:1": "cron[hour='8', minute='0']",
+        "sleep_evening:1": "cron[hour='22', minute='0']",
+        "sleep_morning:1": "cron[hour='7', minute='3']",
+        "meal_lunch:1": "cron[hour='13', minute='30']",
+    }
+
+
+def test_sync_touches_only_changed_jobs(session_factory, scheduler):
+    _add_user(session_factory, 1, "morning", lunch_time="13:30")
+    _add_user(session_factory, 2, "evening")
+    reminders.resync_all_schedules()
+    kept = scheduler.get_job("reminder:2")
+
+    with session_factory() as session:
+        session.query(User).filter(User.tg_id == 1).update({"reminder_time": "day"})
+        session.query(UserSettings).filter(UserSettings.user_id == 1).update({"lunch_time": None})
+        session.commit()
+    reminders.resync_all_schedules()
+
+    assert _times(scheduler) == {
+        "reminder:1": "cron[hour='13', minute='0']",
+        "reminder:2": "cron[hour='19', minute='0']",
+    }
+    assert scheduler.get_job("reminder:2") is kept
+
+
+def test_sync_skips_invalid_times(session_factory, scheduler):
+    _add_user(session_factory, 1, "never", sleep_time="25:00", dinner_time="19:00")
+    reminders.resync_all_schedules()
+    assert _times(scheduler) == {"meal_dinner:1": "cron[hour='19', minute='0']"}
@@ -1,182 +1,251 @@
 import asyncio
 import logging
-import threading
-import os
-from flask import Flask, render_template, jsonify, request
+import secrets
+from pathlib import Path
+from aiohttp import web
 from aiogram import Bot, Dispatcher
-from aiogram.client.default import DefaultBotProperties
-from aiogram.enums import ParseMode
-from app.config import TOKEN
-from app.database import Base, engine
-from app.models import user, admin, notification_log
-from app.handlers import start
-from app.services.reminders import load_and_schedule_all, start_scheduler, set_bot_instance
-
-# Flask приложение
-app = Flask(__name__)
-
-# Глобальные переменные для бота
-bot = None
-dp = None
-bot_thread = None
-bot_running = False
-
-def run_bot():
-    """Запуск бота в отдельном потоке"""
-    global bot, dp, bot_running
-    
-    try:
-        # Проверяем токен
-        if not TOKEN:
-            logging.error("BOT_TOKEN не найден в переменных окружения!")
-            return
-            
-        logging.info(f"Запуск бота с токеном: {TOKEN[:10]}...")
-        
-        # Создаём таблицы в базе, если их ещё нет
-        Base.metadata.create_all(bind=engine)
-        
-        bot = Bot(
-            token=TOKEN,
-            default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from app.config import TOKEN, WEBHOOK_BASE_URL, WEBHOOK_PATH, WEBHOOK_SECRET, PORT, BOT_WORKERS
+from app import handlers
+from app.bot import build_dispatcher, create_bot
+from app.services.bot_stats import bot_stats_summary
+from app.services.overload import overload_status
+from app.sharding import ShardedFeeder
+
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+# Ключи состояния в aiohttp-приложении
+BOT_KEY = web.AppKey("bot", Bot)
+DP_KEY = web.AppKey("dp", Dispatcher)
+STATUS_KEY = web.AppKey("status", dict)
+FEEDER_KEY = web.AppKey("feeder", ShardedFeeder)
+
+
+def token_preview() -> str:
+    return f"{TOKEN[:10]}..." if TOKEN else 'not_set'
+
+
+def webhook_secret() -> str:
+    return WEBHOOK_SECRET or secrets.token_urlsafe(32)
+
+
+def setup_webhook(app: web.Application, bot: Bot, dp: Dispatcher) -> None:
+    """Webhook: Telegram сам присылает апдейты POST-запросом на WEBHOOK_PATH"""
+    # Секрет проверяется в заголовке X-Telegram-Bot-Api-Secret-Token каждого запроса
+    secret = webhook_secret()
+    SimpleRequestHandler(dispatcher=dp, bot=bot, secret_token=secret).register(app, path=WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+
+    async def set_webhook(bot: Bot):
+        url = f"{WEBHOOK_BASE_URL}{WEBHOOK_PATH}"
+        await bot.set_webhook(
+            url,
+            secret_token=secret,
+            allowed_updates=dp.resolve_used_update_types(),
         )
-        dp = Dispatcher()
-        
-        # Подключаем все роутеры
-        dp.include_router(start.router)
-        
-        # Планировщик напоминаний
-        start_scheduler()
-        set_bot_instance(bot)
-        load_and_schedule_all()
-        
-        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
-        logging.getLogger("aiogram").setLevel(logging.INFO)
-        logging.info("Бот запущен через Flask...")
-        
-        bot_running = True
-        
-        # Запускаем бота в бесконечном цикле
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
+        app[STATUS_KEY]["running"] = True
+        logging.info(f"Webhook установлен: {url}")
+
+    dp.startup.register(set_webhook)
+
+
+def setup_sharded_webhook(app: web.Application, bot: Bot) -> None:
+    """Webhook + BOT_WORKERS процессов: здесь только принимаем апдейты и раскладываем их
+    по воркерам по chat id (app/sharding.py), сами хендлеры работают в воркерах"""
+    secret = webhook_secret()
+    feeder = ShardedFeeder(BOT_WORKERS)
+    app[FEEDER_KEY] = feeder
+
+    async def receive_update(request: web.Request):
+        if not secrets.compare_digest(request.headers.get("X-Telegram-Bot-Api-Secret-Token", ""), secret):
+            return web.Response(status=401, text="Unauthorized")
         try:
-            loop.run_until_complete(dp.start_polling(bot))
-        except KeyboardInterrupt:
-            logging.info("Бот остановлен пользователем")
-        except Exception as e:
-            logging.error(f"Ошибка в работе бота: {e}")
-        finally:
-            bot_running = False
-        
-    except Exception as e:
-        logging.error(f"Ошибка запуска бота: {e}")
-        bot_running = False
+            update = await request.json()
+        except ValueError:
+            return web.Response(status=400, text="Malformed update")
+        if not isinstance(update, dict):
+            return web.Response(status=400, text="Malformed update")
+        if not feeder.submit(update):
+            # Воркер перегружен: Telegram повторит доставку позже
+            return web.Response(status=503)
+        return web.Response()
+
+    async def on_startup(app: web.Application):
+        feeder.start()
+        url = f"{WEBHOOK_BASE_URL}{WEBHOOK_PATH}"
+        await bot.set_webhook(
+            url,
+            secret_token=secret,
+            allowed_updates=handlers.router.resolve_used_update_types(),
+        )
+        app[STATUS_KEY]["running"] = True
+        logging.info(f"Webhook установлен: {url}, воркеров: {BOT_WORKERS}")
+
+    async def on_shutdown(app: web.Application):
+        app[STATUS_KEY]["running"] = False
+        await asyncio.get_running_loop().run_in_executor(None, feeder.stop)
+
+    app.router.add_post(WEBHOOK_PATH, receive_update)
+    app.on_startup.append(on_startup)
+    app.on_shutdown.append(on_shutdown)
+
+
+def setup_polling(app: web.Application, bot: Bot, dp: Dispatcher) -> None:
+    """Без публичного адреса (локально) получаем апдейты long polling'ом в том же цикле"""
+    async def on_startup(app: web.Application):
+        await bot.delete_webhook()
+        app[STATUS_KEY]["running"] = True
+        app[STATUS_KEY]["task"] = asyncio.create_task(
+            dp.start_polling(bot, handle_signals=False, close_bot_session=False)
+        )
+
+    async def on_shutdown(app: web.Application):
+        app[STATUS_KEY]["running"] = False
+        task = app[STATUS_KEY].get("task")
+        if task and not task.done():
+            await dp.stop_polling()
+            await task
+
+    app.on_startup.append(on_startup)
+    app.on_shutdown.append(on_shutdown)
+
 
-@app.route('/')
-def index():
+async def index(request: web.Request):
     """Главная страница"""
-    return render_template('index.html')
+    return web.FileResponse(TEMPLATES_DIR / 'index.html')
 
-@app.route('/admin')
-def admin():
+
+async def admin_page(request: web.Request):
     """Админ панель"""
-    return render_template('admin.html')
+    return web.FileResponse(TEMPLATES_DIR / 'admin.html')
+
 
-@app.route('/health')
-def health():
+async def health(request: web.Request):
     """Проверка здоровья бота"""
-    if bot and dp and bot_running:
-        return jsonify({
+    status = request.app[STATUS_KEY]
+    feeder = request.app.get(FEEDER_KEY)
+    if feeder and feeder.alive() < feeder.workers:
+        return web.json_response({
+            'status': 'error',
+            'message': f'Workers alive: {feeder.alive()}/{feeder.workers}',
+            'mode': status["mode"],
+            'token': token_preview(),
+            'bot_running': status["running"]
+        })
+    if status["running"]:
+        return web.json_response({
             'status': 'running',
             'bot': 'active',
             'dispatcher': 'active',
-            'token': f"{TOKEN[:10]}..." if TOKEN else 'not_set'
+            'mode': status["mode"],
+            'token': token_preview()
         })
-    return jsonify({
-        'status': 'error', 
+    return web.json_response({
+        'status': 'error',
         'message': 'Bot not initialized',
-        'token': f"{TOKEN[:10]}..." if TOKEN else 'not_set',
-        'bot_running': bot_running
+        'mode': status["mode"],
+        'token': token_preview(),
+        'bot_running': status["running"]
     })
 
-@app.route('/stats')
-def stats():
+
+async def stats(request: web.Request):
     """Статистика бота"""
     try:
-        # Здесь можно добавить логику получения статистики из БД
-        return jsonify({
-            'users': 'N/A',  # TODO: получить из БД
-            'workouts': 'N/A',
-            'meals': 'N/A'
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)})
-
-@app.route('/start_bot', methods=['POST'])
-def start_bot():
-    """Запуск бота (если не запущен)"""
-    global bot_thread, bot_running
-    
-    if bot_thread and bot_thread.is_alive() and bot_running:
-        return jsonify({'status': 'already_running'})
-    
-    try:
-        # Проверяем токен
-        if not TOKEN:
-            return jsonify({'status': 'error', 'message': 'BOT_TOKEN не найден в переменных окружения!'})
-        
-        bot_thread = threading.Thread(target=run_bot, daemon=False)  # Не daemon!
-        bot_thread.start()
-        
-        # Ждем немного чтобы бот успел запуститься
-        import time
-        time.sleep(2)
-        
-        return jsonify({
-            'status': 'started',
-            'token': f"{TOKEN[:10]}..." if TOKEN else 'not_set',
-            'bot_running': bot_running
+        # Снимок считается SQL-агрегатами и обновляется в фоне (app/services/bot_stats.py)
+        summary = await bot_stats_summary()
+        return web.json_response({
+            'users': summary['total_users'],
+            'workouts': summary['workout_logs'],
+            'meals': summary['meal_logs'],
+            **summary,
         })
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)})
-
-@app.route('/stop_bot', methods=['POST'])
-def stop_bot():
-    """Остановка бота"""
-    global bot, dp, bot_running
-    
-    if bot and dp and bot_running:
-        bot_running = False
-        # Здесь можно добавить логику остановки бота
-        return jsonify({'status': 'stopped'})
-    
-    return jsonify({'status': 'not_running'})
-
-@app.route('/debug')
-def debug():
+        return web.json_response({'error': str(e)})
+
+
+async def start_bot(request: web.Request):
+    """Бот запускается вместе с сервером; эндпоинт оставлен для дашборда"""
+    status = request.app[STATUS_KEY]
+    if status["running"]:
+        return web.json_response({'status': 'already_running'})
+    return web.json_response({'status': 'error', 'message': 'BOT_TOKEN не найден в переменных окружения!'})
+
+
+async def stop_bot(request: web.Request):
+    """Остановка бота = остановка сервиса (в webhook-режиме отдельного потока бота больше нет)"""
+    return web.json_response({'status': 'not_supported'})
+
+
+async def debug(request: web.Request):
     """Отладочная информация"""
-    return jsonify({
+    status = request.app[STATUS_KEY]
+    feeder = request.app.get(FEEDER_KEY)
+    dp = request.app.get(DP_KEY)
+    return web.json_response({
         'token_set': bool(TOKEN),
-        'token_preview': f"{TOKEN[:10]}..." if TOKEN else 'not_set',
-        'bot_exists': bot is not None,
-        'dp_exists': dp is not None,
-        'bot_running': bot_running,
-        'thread_alive': bot_thread.is_alive() if bot_thread else False,
-        'thread_daemon': bot_thread.daemon if bot_thread else None
+        'token_preview': token_preview(),
+        'bot_exists': BOT_KEY in request.app,
+        'dp_exists': DP_KEY in request.app,
+        'bot_running': status["running"],
+        'mode': status["mode"],
+        'webhook_path': WEBHOOK_PATH if status["mode"] in ("webhook", "sharded") else None,
+        'workers_alive': feeder.alive() if feeder else None,
+        'worker_queues': feeder.queue_sizes() if feeder else None,
+        # Апдейты в обработке / в очереди (app/middlewares/ordering.py)
+        'updates': dp["update_ordering"].metrics() if dp else None,
+        # Режим деградации при перегрузке (app/services/overload.py)
+        'overload': overload_status() if dp else None,
     })
 
-if __name__ == '__main__':
-    # Автоматически запускаем бота при старте (для Render)
-    if TOKEN:
-        logging.info("Автоматический запуск бота...")
-        bot_thread = threading.Thread(target=run_bot, daemon=False)
-        bot_thread.start()
-        # Ждем немного чтобы бот успел запуститься
-        import time
-        time.sleep(3)
+
+def create_app() -> web.Application:
+    """aiohttp-приложение: дашборд, health/stats и приём апдейтов бота"""
+    app = web.Application()
+    app[STATUS_KEY] = {"running": False, "mode": None}
+    app.router.add_get('/', index)
+    app.router.add_get('/admin', admin_page)
+    app.router.add_get('/health', health)
+    app.router.add_get('/stats', stats)
+    app.router.add_post('/start_bot', start_bot)
+    app.router.add_post('/stop_bot', stop_bot)
+    app.router.add_get('/debug', debug)
+
+    if not TOKEN:
+        logging.warning("BOT_TOKEN не найден, бот не будет запущен")
+        return app
+
+    logging.info(f"Запуск бота с токеном: {TOKEN[:10]}...")
+    bot = create_bot()
+    app[BOT_KEY] = bot
+
+    async def close_bot_session(app: web.Application):
+        await app[BOT_KEY].session.close()
+
+    app.on_cleanup.append(close_bot_session)
+
+    if WEBHOOK_BASE_URL and BOT_WORKERS > 1:
+        # Диспетчер, FSM и планировщик живут в процессах-воркерах
+        app[STATUS_KEY]["mode"] = "sharded"
+        setup_sharded_webhook(app, bot)
+        return app
+    if BOT_WORKERS > 1:
+        logging.warning("BOT_WORKERS > 1 работает только в режиме webhook, запускаем один процесс")
+
+    dp = build_dispatcher(bot)
+    app[DP_KEY] = dp
+
+    if WEBHOOK_BASE_URL:
+        app[STATUS_KEY]["mode"] = "webhook"
+        setup_webhook(app, bot, dp)
     else:
-        logging.warning("BOT_TOKEN не найден, бот не будет запущен автоматически")
-    
-    # Запускаем Flask сервер
-    app.run(host='0.0.0.0', port=5000, debug=False)
+        app[STATUS_KEY]["mode"] = "polling"
+        setup_polling(app, bot, dp)
+    return app
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("aiogram").setLevel(logging.INFO)
+    # Один процесс и один event loop: и веб-сервер, и бот
+    web.run_app(create_app(), host='0.0.0.0', port=PORT)